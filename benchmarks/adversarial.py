@@ -0,0 +1,45 @@
+"""
+Shows that the time to render pathological input grows linearly with its size, for both engines.
+
+Each row is one adversarial corpus from benchmarks.corpora.ADVERSARIAL at a growing size.
+Microseconds per character should stay flat along a row.
+The last rows show the fallback of a time budget: the render stops converting pinyin once it is spent.
+
+Run from the repository root: python -m benchmarks.adversarial
+"""
+import timeit
+
+from markdown import Markdown
+from pinyin_markdown import PinyinExtension
+from benchmarks.corpora import ADVERSARIAL
+
+SIZES_KB = (4, 16, 64)
+# Quadratic for the regex, which searches again after every colon: minutes at 64 KB
+REGEX_SKIPS = ('colon_restarts',)
+
+
+def microseconds_per_char(md, text, repeat=3):
+    return min(timeit.repeat(lambda: md.reset().convert(text), number=1, repeat=repeat)) * 1e6 / len(text)
+
+
+def main():
+    print('{:<8}{:<16}'.format('engine', 'corpus') + ''.join('{:>10}'.format('{} KB'.format(kb)) for kb in SIZES_KB))
+    renderers = [
+        ('trie', {}),
+        ('regex', {}),
+        ('trie', {'time_budget': 0.01}),
+    ]
+    for engine, budget in renderers:
+        md = Markdown(extensions=[PinyinExtension(engine=engine, **budget)])
+        for name, corpus in sorted(ADVERSARIAL.items()):
+            label = engine + ('*' if budget else '')
+            if engine == 'regex' and name in REGEX_SKIPS:
+                print('{:<8}{:<16}{:>30}'.format(label, name, 'quadratic: skipped'))
+                continue
+            times = [microseconds_per_char(md, corpus(size_kb)) for size_kb in SIZES_KB]
+            print('{:<8}{:<16}'.format(label, name) + ''.join('{:>10.2f}'.format(t) for t in times))
+    print('* with time_budget=0.01 seconds: microseconds per character fall as the budget cuts the pinyin off')
+
+
+if __name__ == '__main__':
+    main()
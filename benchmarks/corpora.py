@@ -0,0 +1,98 @@
+"""
+Synthetic benchmark documents built from SYLLABLES, so the benchmarks run offline and are reproducible.
+"""
+import random
+
+from pinyin_markdown.pinyin_regex import SYLLABLES
+
+PROSE = ('the', 'teacher', 'said', 'that', 'we', 'should', 'practise', 'every', 'day', 'and', 'then', 'went', 'to',
+         'lunch', 'with', 'our', 'friends', 'in', 'a', 'small', 'restaurant', 'near', 'station')
+
+
+def pinyin_word(rng):
+    word = ''.join(rng.choice(SYLLABLES) + rng.choice('12345') for _ in range(rng.randint(1, 3)))
+    return word.capitalize() if rng.random() < 0.1 else word
+
+
+def paragraph(rng, size, pinyin_ratio):
+    """A paragraph of about size characters, where pinyin_ratio of the words are toned pinyin"""
+    words = []
+    length = 0
+    while length < size:
+        word = pinyin_word(rng) if rng.random() < pinyin_ratio else rng.choice(PROSE)
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)
+
+
+def document(size_kb, pinyin_ratio, paragraph_size=400, seed=0):
+    """size_kb of Markdown paragraphs separated by blank lines"""
+    rng = random.Random(seed)
+    paragraphs = []
+    length = 0
+    while length < size_kb * 1024:
+        paragraphs.append(paragraph(rng, min(paragraph_size, size_kb * 1024), pinyin_ratio))
+        length += len(paragraphs[-1]) + 2
+    return '\n\n'.join(paragraphs)
+
+
+def dense(size_kb=8, seed=0):
+    """Vocabulary lists and example sentences: most words are pinyin"""
+    return document(size_kb, 0.8, seed=seed)
+
+
+def sparse(size_kb=8, seed=0):
+    """English prose with the occasional Xi3an4"""
+    return document(size_kb, 0.02, seed=seed)
+
+
+def huge_paragraph(size_kb=64, seed=0):
+    """One enormous paragraph, half pinyin"""
+    return document(size_kb, 0.5, paragraph_size=size_kb * 1024, seed=seed)
+
+
+def no_pinyin(size_kb=8, seed=0):
+    """A page without any pinyin at all"""
+    return document(size_kb, 0, seed=seed)
+
+
+def graded(size_kb=8, vocabulary=8000, seed=0):
+    """Graded readers: mostly pinyin, drawn from a fixed vocabulary, so that words repeat as in real text"""
+    rng = random.Random(seed)
+    words = [pinyin_word(rng) for _ in range(vocabulary)]
+    text = []
+    length = 0
+    while length < size_kb * 1024:
+        text.append(rng.choice(words) if rng.random() < 0.7 else rng.choice(PROSE))
+        length += len(text[-1]) + 1
+    return ' '.join(text)
+
+
+CORPORA = {
+    'dense': dense,
+    'sparse': sparse,
+    'huge_paragraph': huge_paragraph,
+    'no_pinyin': no_pinyin,
+}
+
+
+def repeated(unit, size_kb):
+    return unit * (size_kb * 1024 // len(unit))
+
+
+ADVERSARIAL = {
+    # One enormous word of valid syllables
+    'one_long_word': lambda size_kb=8: repeated('ni3', size_kb),
+    # Syllable prefixes without a tone, then a tone: nearly a word, for a very long way
+    'untoned_run': lambda size_kb=8: repeated('zhuang', size_kb)[:-1] + '1',
+    # A long valid word spoiled by its last letter, so that a backtracking search gives up every syllable
+    'spoiled_word': lambda size_kb=8: repeated('ni3', size_kb)[:-1] + 'x',
+    # Vowel syllables with erhua candidates everywhere
+    'vowels_and_r': lambda size_kb=8: repeated('a1e2o3r', size_kb),
+    # Nothing but tone digits, which pass the candidate gate
+    'digits': lambda size_kb=8: repeated('12345', size_kb),
+    # Many short words
+    'many_words': lambda size_kb=8: repeated('zhuang1zhuang4 ', size_kb),
+    # Words start again after every u: colon, each the start of a long word spoiled by its last letter
+    'colon_restarts': lambda size_kb=8: repeated('nu:e3', size_kb) + 'x',
+}
@@ -0,0 +1,57 @@
+"""
+Measures the corpus scanner in MB/s against walking the text with the trie, then with more worker processes.
+
+dense has few repeated words, so it's the scanner's worst case. graded repeats its words like real text.
+
+Run from the repository root: python -m benchmarks.corpus_scan
+"""
+import os
+import tempfile
+import time
+
+from pinyin_markdown.corpus import scan_files
+from pinyin_markdown.syllable_trie import trie
+from benchmarks.corpora import dense, graded
+
+FILES = 8
+FILE_KB = 1024
+
+
+def write_files(directory, corpus):
+    paths = []
+    for i in range(FILES):
+        path = os.path.join(directory, '{}.txt'.format(i))
+        with open(path, 'w', encoding='utf8') as f:
+            f.write(corpus(FILE_KB, seed=i))
+        paths.append(path)
+    return paths
+
+
+def trie_megabytes_per_second(paths):
+    start = time.perf_counter()
+    size = 0
+    for path in paths:
+        with open(path, encoding='utf8') as f:
+            text = f.read()
+        size += len(text.encode('utf8'))
+        for m in trie().finditer(text):
+            m.sounds
+    return size / 1e6 / (time.perf_counter() - start)
+
+
+def main():
+    cores = os.cpu_count() or 1
+    print('{:<8}{:<10}{:>10}'.format('corpus', 'scan', 'MB/s'))
+    for name, corpus in (('dense', dense), ('graded', graded)):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = write_files(directory, corpus)
+            print('{:<8}{:<10}{:>10.2f}'.format(name, 'trie', trie_megabytes_per_second(paths)))
+            workers = 1
+            while workers <= cores:
+                counts = scan_files(paths, workers)
+                print('{:<8}{:<10}{:>10.2f}'.format(name, '{} worker'.format(workers), counts.megabytes_per_second))
+                workers *= 2
+
+
+if __name__ == '__main__':
+    main()
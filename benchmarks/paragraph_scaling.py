@@ -0,0 +1,85 @@
+"""
+Shows how rendering time grows with the length of a single paragraph full of pinyin.
+
+Markdown rebuilds the string of a text node after every inline match, so the time per KB of the inline engines
+grows slowly with the length of the paragraph. Before Markdown 3.11, which resumes the search after the last
+match instead of at the start of the node, it grows in proportion to it, and the larger sizes take minutes.
+The postprocess engine makes a single pass over the HTML and stays flat. For comparison, the 'legacy' rows use
+a Markdown 2 style Pattern, which wraps the pinyin regex in ^(.*?)...(.*)$, copies the rest of the node on every
+search and searches each match again: it grows like the other inline engines, but costs more per match.
+
+Run from the repository root: python -m benchmarks.paragraph_scaling
+"""
+import random
+import re
+import timeit
+
+import markdown
+from markdown import Markdown
+from markdown.extensions import Extension
+from markdown.inlinepatterns import Pattern
+from pinyin_markdown import PinyinExtension, pinyin_regex
+from pinyin_markdown.pinyinextension import NumberedPinyinPattern, UntagWordsTreeprocessor
+
+SIZES_KB = (1, 4, 16, 64, 256)
+
+
+class _LegacyPinyinPattern(Pattern):
+    """The pre-InlineProcessor pattern, kept here only to measure against"""
+
+    def __init__(self, md):
+        super(_LegacyPinyinPattern, self).__init__(pinyin_regex.POLYSYLLABIC_REGEX_STR, md)
+        self.inline = NumberedPinyinPattern(pinyin_regex.POLYSYLLABIC_REGEX_STR, md,
+                                            **PinyinExtension().pattern_configs())
+        self.words = self.inline.words
+        self.word = re.compile(pinyin_regex.POLYSYLLABIC_REGEX_STR)
+
+    def handleMatch(self, m):
+        return self.inline.handleMatch(self.word.search(m.group(2)), m.group(2))[0]
+
+
+class _LegacyExtension(Extension):
+    def extendMarkdown(self, md):
+        pattern = _LegacyPinyinPattern(md)
+        md.inlinePatterns.register(pattern, 'pinyin', 5)
+        md.treeprocessors.register(UntagWordsTreeprocessor(md, pattern), 'pinyin_untag_words', -1)
+
+
+def paragraph(size_kb, seed=0):
+    """One long paragraph mixing toned pinyin words and plain English"""
+    rng = random.Random(seed)
+    words = []
+    length = 0
+    while length < size_kb * 1024:
+        if rng.random() < 0.5:
+            word = ''.join(rng.choice(pinyin_regex.SYLLABLES) + rng.choice('12345') for _ in range(rng.randint(1, 3)))
+        else:
+            word = rng.choice(('the', 'teacher', 'said', 'and', 'then', 'we', 'went', 'to'))
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)
+
+
+def time_per_kb(extension, size_kb, repeat=3):
+    md = Markdown(extensions=[extension])
+    text = paragraph(size_kb)
+    best = min(timeit.repeat(lambda: md.reset().convert(text), number=1, repeat=repeat))
+    return best * 1000 / size_kb
+
+
+def main():
+    renderers = [
+        ('regex', PinyinExtension(engine='regex')),
+        ('trie', PinyinExtension(engine='trie')),
+        ('postprocess', PinyinExtension(engine='postprocess')),
+        ('legacy', _LegacyExtension()),
+    ]
+    print('Markdown ' + markdown.__version__)
+    print('{:<12}{:>8}{:>14}'.format('engine', 'KB', 'ms per KB'))
+    for name, extension in renderers:
+        for size_kb in SIZES_KB:
+            print('{:<12}{:>8}{:>14.3f}'.format(name, size_kb, time_per_kb(extension, size_kb)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Shows how convert_many scales with the number of worker processes on the benchmark corpus.
+
+Documents per second should grow close to linearly up to the number of cores.
+
+Run from the repository root: python -m benchmarks.parallel_scaling
+"""
+import os
+import time
+
+from pinyin_markdown import convert_many
+from benchmarks.corpora import dense, sparse
+
+DOCUMENTS = 400
+
+
+def documents():
+    return [(dense if i % 2 else sparse)(4, seed=i) for i in range(DOCUMENTS)]
+
+
+def docs_per_second(docs, workers, chunksize=16):
+    start = time.perf_counter()
+    convert_many(docs, workers=workers, chunksize=chunksize)
+    return len(docs) / (time.perf_counter() - start)
+
+
+def main():
+    docs = documents()
+    cores = os.cpu_count() or 1
+    print('{:<8}{:>12}{:>10}'.format('workers', 'docs/s', 'speedup'))
+    single = None
+    workers = 1
+    while workers <= cores:
+        rate = docs_per_second(docs, workers)
+        single = single or rate
+        print('{:<8}{:>12.1f}{:>10.2f}'.format(workers, rate, rate / single))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
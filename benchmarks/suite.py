@@ -0,0 +1,112 @@
+"""
+Offline benchmark suite. Writes machine-readable results so that runs can be compared:
+
+    python -m benchmarks.suite --output before.json
+    python -m benchmarks.suite --output after.json --engine trie
+
+Measures, for each synthetic corpus in benchmarks.corpora: documents per second, milliseconds per KB and
+peak memory allocated during one render (tracemalloc). Also measures the cold import time of pinyin_markdown
+and the cost of building Markdown(extensions=[PinyinExtension()]).
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from os import path
+
+import markdown
+from markdown import Markdown
+import pinyin_markdown
+from pinyin_markdown import PinyinExtension
+from benchmarks.corpora import CORPORA
+
+
+def best_of(function, number, repeat):
+    """:return: the best time in seconds of one call"""
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def import_time(repeat=5):
+    """
+    Best cumulative time in seconds of importing pinyin_markdown in a fresh interpreter, as reported by
+    python -X importtime, once markdown is imported. The package is compiled first, as installed packages are.
+    """
+    package = path.dirname(pinyin_markdown.__file__)
+    subprocess.check_call([sys.executable, '-m', 'compileall', '-q', package])
+    times = []
+    for _ in range(repeat):
+        stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import markdown; import pinyin_markdown'],
+                                cwd=path.dirname(package), check=True, universal_newlines=True,
+                                stderr=subprocess.PIPE).stderr
+        times.extend(int(line.split('|')[1]) for line in stderr.splitlines()
+                     if line.split('|')[-1].strip() == 'pinyin_markdown')
+    return min(times) / 1e6
+
+
+def construction_time(config, repeat=5, number=20):
+    """Seconds to build a Markdown instance with the pinyin extension"""
+    return best_of(lambda: Markdown(extensions=[PinyinExtension(**config)]), number, repeat)
+
+
+def peak_memory(md, text):
+    """Peak bytes allocated while rendering text once"""
+    md.reset()
+    tracemalloc.start()
+    try:
+        md.convert(text)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_corpus(name, config, repeat=5):
+    text = CORPORA[name]()
+    md = Markdown(extensions=[PinyinExtension(**config)])
+    md.convert(text)  # Warm up, e.g. the word cache
+    seconds = best_of(lambda: md.reset().convert(text), 1, repeat)
+    size_kb = len(text.encode('utf8')) / 1024
+    return {
+        'size_kb': round(size_kb, 2),
+        'docs_per_second': 1 / seconds,
+        'ms_per_kb': seconds * 1000 / size_kb,
+        'peak_memory_bytes': peak_memory(md, text),
+    }
+
+
+def run(config, corpora=None, repeat=5):
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'markdown': markdown.__version__,
+            'pinyin_markdown': pinyin_markdown.__version__,
+            'config': config,
+        },
+        'import_seconds': import_time(),
+        'construction_seconds': construction_time(config),
+        'corpora': {name: bench_corpus(name, config, repeat) for name in (corpora or sorted(CORPORA))},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite', description=__doc__.strip().split('\n')[0])
+    parser.add_argument('-o', '--output', help='Write the JSON results here as well as to stdout')
+    parser.add_argument('-c', '--corpus', action='append', choices=sorted(CORPORA), help='Only run these corpora')
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    parser.add_argument('--engine', default='trie')
+    parser.add_argument('--cache-size', type=int, default=None)
+    args = parser.parse_args(argv)
+    config = {'engine': args.engine}
+    if args.cache_size is not None:
+        config['cache_size'] = args.cache_size
+    results = json.dumps(run(config, args.corpus, args.repeat), indent=2, sort_keys=True)
+    print(results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(results + '\n')
+
+
+if __name__ == '__main__':
+    main()
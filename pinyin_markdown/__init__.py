@@ -1 +1,14 @@
+__version__ = '0.8.2'
+
 from .pinyinextension import makeExtension, PinyinExtension
+from .convert import convert, iter_convert, PinyinConverter
+
+# batch imports multiprocessing and hashlib, which most users never need
+_BATCH_EXPORTS = ('convert_many', 'iter_convert_many')
+
+
+def __getattr__(name):
+    if name in _BATCH_EXPORTS:
+        from . import batch
+        return getattr(batch, name)
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
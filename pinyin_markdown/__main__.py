@@ -0,0 +1,51 @@
+"""
+python -m pinyin_markdown lessons/ site/ --tone-class=t{} -x tables
+"""
+import argparse
+import sys
+
+from pinyin_markdown import batch
+from pinyin_markdown.pinyinextension import PinyinExtension
+
+
+def _add_config_flags(parser):
+    """Every PinyinExtension config option becomes a flag: tone_class => --tone-class"""
+    defaults = PinyinExtension().config
+    for key, (default, description) in sorted(defaults.items()):
+        flag = '--' + key.replace('_', '-')
+        description = description.replace('%', '%%')
+        if isinstance(default, bool):
+            parser.add_argument(flag, dest=key, action='store_true', default=default, help=description)
+        else:
+            parser.add_argument(flag, dest=key, type=type(default), default=default, help=description)
+    return list(defaults)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m pinyin_markdown',
+                                     description='Convert a directory of Markdown files with pinyin to HTML')
+    parser.add_argument('src', help='Directory of .md files')
+    parser.add_argument('dst', help='Directory for the .html files, and the manifest of converted files')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='Worker processes - Default: number of CPUs')
+    parser.add_argument('-x', '--extension', action='append', default=[], dest='extensions',
+                        help='Another Markdown extension to load, e.g. tables. May be repeated')
+    config_keys = _add_config_flags(parser)
+    args = parser.parse_args(argv)
+    config = {key: getattr(args, key) for key in config_keys}
+    return args, config
+
+
+def main(argv=None):
+    args, config = parse_args(argv)
+    try:
+        batch.check_config(config, args.extensions)
+    except (ValueError, ImportError) as e:
+        print('python -m pinyin_markdown: error: {}'.format(e), file=sys.stderr)
+        return 2
+    result = batch.convert_tree(args.src, args.dst, config, args.extensions, args.jobs)
+    print(result)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
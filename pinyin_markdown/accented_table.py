@@ -0,0 +1,4206 @@
+# coding: utf-8
+# Generated by pinyin_markdown/build_tables.py from SYLLABLES and VOWEL_MAP. Do not edit.
+# Maps each numbered sound (syllable + tone) to its accented form
+
+ACCENTED = {
+    'A1': 'Ā',
+    'A2': 'Á',
+    'A3': 'Ǎ',
+    'A4': 'À',
+    'A5': 'A',
+    'Ai1': 'Āi',
+    'Ai2': 'Ái',
+    'Ai3': 'Ǎi',
+    'Ai4': 'Ài',
+    'Ai5': 'Ai',
+    'An1': 'Ān',
+    'An2': 'Án',
+    'An3': 'Ǎn',
+    'An4': 'Àn',
+    'An5': 'An',
+    'Ang1': 'Āng',
+    'Ang2': 'Áng',
+    'Ang3': 'Ǎng',
+    'Ang4': 'Àng',
+    'Ang5': 'Ang',
+    'Ao1': 'Āo',
+    'Ao2': 'Áo',
+    'Ao3': 'Ǎo',
+    'Ao4': 'Ào',
+    'Ao5': 'Ao',
+    'Ba1': 'Bā',
+    'Ba2': 'Bá',
+    'Ba3': 'Bǎ',
+    'Ba4': 'Bà',
+    'Ba5': 'Ba',
+    'Bai1': 'Bāi',
+    'Bai2': 'Bái',
+    'Bai3': 'Bǎi',
+    'Bai4': 'Bài',
+    'Bai5': 'Bai',
+    'Ban1': 'Bān',
+    'Ban2': 'Bán',
+    'Ban3': 'Bǎn',
+    'Ban4': 'Bàn',
+    'Ban5': 'Ban',
+    'Bang1': 'Bāng',
+    'Bang2': 'Báng',
+    'Bang3': 'Bǎng',
+    'Bang4': 'Bàng',
+    'Bang5': 'Bang',
+    'Bao1': 'Bāo',
+    'Bao2': 'Báo',
+    'Bao3': 'Bǎo',
+    'Bao4': 'Bào',
+    'Bao5': 'Bao',
+    'Bei1': 'Bēi',
+    'Bei2': 'Béi',
+    'Bei3': 'Běi',
+    'Bei4': 'Bèi',
+    'Bei5': 'Bei',
+    'Ben1': 'Bēn',
+    'Ben2': 'Bén',
+    'Ben3': 'Běn',
+    'Ben4': 'Bèn',
+    'Ben5': 'Ben',
+    'Beng1': 'Bēng',
+    'Beng2': 'Béng',
+    'Beng3': 'Běng',
+    'Beng4': 'Bèng',
+    'Beng5': 'Beng',
+    'Bi1': 'Bī',
+    'Bi2': 'Bí',
+    'Bi3': 'Bǐ',
+    'Bi4': 'Bì',
+    'Bi5': 'Bi',
+    'Bian1': 'Biān',
+    'Bian2': 'Bián',
+    'Bian3': 'Biǎn',
+    'Bian4': 'Biàn',
+    'Bian5': 'Bian',
+    'Biao1': 'Biāo',
+    'Biao2': 'Biáo',
+    'Biao3': 'Biǎo',
+    'Biao4': 'Biào',
+    'Biao5': 'Biao',
+    'Bie1': 'Biē',
+    'Bie2': 'Bié',
+    'Bie3': 'Biě',
+    'Bie4': 'Biè',
+    'Bie5': 'Bie',
+    'Bin1': 'Bīn',
+    'Bin2': 'Bín',
+    'Bin3': 'Bǐn',
+    'Bin4': 'Bìn',
+    'Bin5': 'Bin',
+    'Bing1': 'Bīng',
+    'Bing2': 'Bíng',
+    'Bing3': 'Bǐng',
+    'Bing4': 'Bìng',
+    'Bing5': 'Bing',
+    'Bo1': 'Bō',
+    'Bo2': 'Bó',
+    'Bo3': 'Bǒ',
+    'Bo4': 'Bò',
+    'Bo5': 'Bo',
+    'Bu1': 'Bū',
+    'Bu2': 'Bú',
+    'Bu3': 'Bǔ',
+    'Bu4': 'Bù',
+    'Bu5': 'Bu',
+    'Ca1': 'Cā',
+    'Ca2': 'Cá',
+    'Ca3': 'Cǎ',
+    'Ca4': 'Cà',
+    'Ca5': 'Ca',
+    'Cai1': 'Cāi',
+    'Cai2': 'Cái',
+    'Cai3': 'Cǎi',
+    'Cai4': 'Cài',
+    'Cai5': 'Cai',
+    'Can1': 'Cān',
+    'Can2': 'Cán',
+    'Can3': 'Cǎn',
+    'Can4': 'Càn',
+    'Can5': 'Can',
+    'Cang1': 'Cāng',
+    'Cang2': 'Cáng',
+    'Cang3': 'Cǎng',
+    'Cang4': 'Càng',
+    'Cang5': 'Cang',
+    'Cao1': 'Cāo',
+    'Cao2': 'Cáo',
+    'Cao3': 'Cǎo',
+    'Cao4': 'Cào',
+    'Cao5': 'Cao',
+    'Ce1': 'Cē',
+    'Ce2': 'Cé',
+    'Ce3': 'Cě',
+    'Ce4': 'Cè',
+    'Ce5': 'Ce',
+    'Cen1': 'Cēn',
+    'Cen2': 'Cén',
+    'Cen3': 'Cěn',
+    'Cen4': 'Cèn',
+    'Cen5': 'Cen',
+    'Ceng1': 'Cēng',
+    'Ceng2': 'Céng',
+    'Ceng3': 'Cěng',
+    'Ceng4': 'Cèng',
+    'Ceng5': 'Ceng',
+    'Cha1': 'Chā',
+    'Cha2': 'Chá',
+    'Cha3': 'Chǎ',
+    'Cha4': 'Chà',
+    'Cha5': 'Cha',
+    'Chai1': 'Chāi',
+    'Chai2': 'Chái',
+    'Chai3': 'Chǎi',
+    'Chai4': 'Chài',
+    'Chai5': 'Chai',
+    'Chan1': 'Chān',
+    'Chan2': 'Chán',
+    'Chan3': 'Chǎn',
+    'Chan4': 'Chàn',
+    'Chan5': 'Chan',
+    'Chang1': 'Chāng',
+    'Chang2': 'Cháng',
+    'Chang3': 'Chǎng',
+    'Chang4': 'Chàng',
+    'Chang5': 'Chang',
+    'Chao1': 'Chāo',
+    'Chao2': 'Cháo',
+    'Chao3': 'Chǎo',
+    'Chao4': 'Chào',
+    'Chao5': 'Chao',
+    'Che1': 'Chē',
+    'Che2': 'Ché',
+    'Che3': 'Chě',
+    'Che4': 'Chè',
+    'Che5': 'Che',
+    'Chen1': 'Chēn',
+    'Chen2': 'Chén',
+    'Chen3': 'Chěn',
+    'Chen4': 'Chèn',
+    'Chen5': 'Chen',
+    'Cheng1': 'Chēng',
+    'Cheng2': 'Chéng',
+    'Cheng3': 'Chěng',
+    'Cheng4': 'Chèng',
+    'Cheng5': 'Cheng',
+    'Chi1': 'Chī',
+    'Chi2': 'Chí',
+    'Chi3': 'Chǐ',
+    'Chi4': 'Chì',
+    'Chi5': 'Chi',
+    'Chong1': 'Chōng',
+    'Chong2': 'Chóng',
+    'Chong3': 'Chǒng',
+    'Chong4': 'Chòng',
+    'Chong5': 'Chong',
+    'Chou1': 'Chōu',
+    'Chou2': 'Chóu',
+    'Chou3': 'Chǒu',
+    'Chou4': 'Chòu',
+    'Chou5': 'Chou',
+    'Chu1': 'Chū',
+    'Chu2': 'Chú',
+    'Chu3': 'Chǔ',
+    'Chu4': 'Chù',
+    'Chu5': 'Chu',
+    'Chua1': 'Chuā',
+    'Chua2': 'Chuá',
+    'Chua3': 'Chuǎ',
+    'Chua4': 'Chuà',
+    'Chua5': 'Chua',
+    'Chuai1': 'Chuāi',
+    'Chuai2': 'Chuái',
+    'Chuai3': 'Chuǎi',
+    'Chuai4': 'Chuài',
+    'Chuai5': 'Chuai',
+    'Chuan1': 'Chuān',
+    'Chuan2': 'Chuán',
+    'Chuan3': 'Chuǎn',
+    'Chuan4': 'Chuàn',
+    'Chuan5': 'Chuan',
+    'Chuang1': 'Chuāng',
+    'Chuang2': 'Chuáng',
+    'Chuang3': 'Chuǎng',
+    'Chuang4': 'Chuàng',
+    'Chuang5': 'Chuang',
+    'Chui1': 'Chuī',
+    'Chui2': 'Chuí',
+    'Chui3': 'Chuǐ',
+    'Chui4': 'Chuì',
+    'Chui5': 'Chui',
+    'Chun1': 'Chūn',
+    'Chun2': 'Chún',
+    'Chun3': 'Chǔn',
+    'Chun4': 'Chùn',
+    'Chun5': 'Chun',
+    'Chuo1': 'Chuō',
+    'Chuo2': 'Chuó',
+    'Chuo3': 'Chuǒ',
+    'Chuo4': 'Chuò',
+    'Chuo5': 'Chuo',
+    'Ci1': 'Cī',
+    'Ci2': 'Cí',
+    'Ci3': 'Cǐ',
+    'Ci4': 'Cì',
+    'Ci5': 'Ci',
+    'Cong1': 'Cōng',
+    'Cong2': 'Cóng',
+    'Cong3': 'Cǒng',
+    'Cong4': 'Còng',
+    'Cong5': 'Cong',
+    'Cou1': 'Cōu',
+    'Cou2': 'Cóu',
+    'Cou3': 'Cǒu',
+    'Cou4': 'Còu',
+    'Cou5': 'Cou',
+    'Cu1': 'Cū',
+    'Cu2': 'Cú',
+    'Cu3': 'Cǔ',
+    'Cu4': 'Cù',
+    'Cu5': 'Cu',
+    'Cuan1': 'Cuān',
+    'Cuan2': 'Cuán',
+    'Cuan3': 'Cuǎn',
+    'Cuan4': 'Cuàn',
+    'Cuan5': 'Cuan',
+    'Cui1': 'Cuī',
+    'Cui2': 'Cuí',
+    'Cui3': 'Cuǐ',
+    'Cui4': 'Cuì',
+    'Cui5': 'Cui',
+    'Cun1': 'Cūn',
+    'Cun2': 'Cún',
+    'Cun3': 'Cǔn',
+    'Cun4': 'Cùn',
+    'Cun5': 'Cun',
+    'Cuo1': 'Cuō',
+    'Cuo2': 'Cuó',
+    'Cuo3': 'Cuǒ',
+    'Cuo4': 'Cuò',
+    'Cuo5': 'Cuo',
+    'Da1': 'Dā',
+    'Da2': 'Dá',
+    'Da3': 'Dǎ',
+    'Da4': 'Dà',
+    'Da5': 'Da',
+    'Dai1': 'Dāi',
+    'Dai2': 'Dái',
+    'Dai3': 'Dǎi',
+    'Dai4': 'Dài',
+    'Dai5': 'Dai',
+    'Dan1': 'Dān',
+    'Dan2': 'Dán',
+    'Dan3': 'Dǎn',
+    'Dan4': 'Dàn',
+    'Dan5': 'Dan',
+    'Dang1': 'Dāng',
+    'Dang2': 'Dáng',
+    'Dang3': 'Dǎng',
+    'Dang4': 'Dàng',
+    'Dang5': 'Dang',
+    'Dao1': 'Dāo',
+    'Dao2': 'Dáo',
+    'Dao3': 'Dǎo',
+    'Dao4': 'Dào',
+    'Dao5': 'Dao',
+    'De1': 'Dē',
+    'De2': 'Dé',
+    'De3': 'Dě',
+    'De4': 'Dè',
+    'De5': 'De',
+    'Dei1': 'Dēi',
+    'Dei2': 'Déi',
+    'Dei3': 'Děi',
+    'Dei4': 'Dèi',
+    'Dei5': 'Dei',
+    'Den1': 'Dēn',
+    'Den2': 'Dén',
+    'Den3': 'Děn',
+    'Den4': 'Dèn',
+    'Den5': 'Den',
+    'Deng1': 'Dēng',
+    'Deng2': 'Déng',
+    'Deng3': 'Děng',
+    'Deng4': 'Dèng',
+    'Deng5': 'Deng',
+    'Di1': 'Dī',
+    'Di2': 'Dí',
+    'Di3': 'Dǐ',
+    'Di4': 'Dì',
+    'Di5': 'Di',
+    'Dia1': 'Diā',
+    'Dia2': 'Diá',
+    'Dia3': 'Diǎ',
+    'Dia4': 'Dià',
+    'Dia5': 'Dia',
+    'Dian1': 'Diān',
+    'Dian2': 'Dián',
+    'Dian3': 'Diǎn',
+    'Dian4': 'Diàn',
+    'Dian5': 'Dian',
+    'Diao1': 'Diāo',
+    'Diao2': 'Diáo',
+    'Diao3': 'Diǎo',
+    'Diao4': 'Diào',
+    'Diao5': 'Diao',
+    'Die1': 'Diē',
+    'Die2': 'Dié',
+    'Die3': 'Diě',
+    'Die4': 'Diè',
+    'Die5': 'Die',
+    'Ding1': 'Dīng',
+    'Ding2': 'Díng',
+    'Ding3': 'Dǐng',
+    'Ding4': 'Dìng',
+    'Ding5': 'Ding',
+    'Diu1': 'Diū',
+    'Diu2': 'Diú',
+    'Diu3': 'Diǔ',
+    'Diu4': 'Diù',
+    'Diu5': 'Diu',
+    'Dong1': 'Dōng',
+    'Dong2': 'Dóng',
+    'Dong3': 'Dǒng',
+    'Dong4': 'Dòng',
+    'Dong5': 'Dong',
+    'Dou1': 'Dōu',
+    'Dou2': 'Dóu',
+    'Dou3': 'Dǒu',
+    'Dou4': 'Dòu',
+    'Dou5': 'Dou',
+    'Du1': 'Dū',
+    'Du2': 'Dú',
+    'Du3': 'Dǔ',
+    'Du4': 'Dù',
+    'Du5': 'Du',
+    'Duan1': 'Duān',
+    'Duan2': 'Duán',
+    'Duan3': 'Duǎn',
+    'Duan4': 'Duàn',
+    'Duan5': 'Duan',
+    'Dui1': 'Duī',
+    'Dui2': 'Duí',
+    'Dui3': 'Duǐ',
+    'Dui4': 'Duì',
+    'Dui5': 'Dui',
+    'Dun1': 'Dūn',
+    'Dun2': 'Dún',
+    'Dun3': 'Dǔn',
+    'Dun4': 'Dùn',
+    'Dun5': 'Dun',
+    'Duo1': 'Duō',
+    'Duo2': 'Duó',
+    'Duo3': 'Duǒ',
+    'Duo4': 'Duò',
+    'Duo5': 'Duo',
+    'E1': 'Ē',
+    'E2': 'É',
+    'E3': 'Ě',
+    'E4': 'È',
+    'E5': 'E',
+    'Ei1': 'Ēi',
+    'Ei2': 'Éi',
+    'Ei3': 'Ěi',
+    'Ei4': 'Èi',
+    'Ei5': 'Ei',
+    'En1': 'Ēn',
+    'En2': 'Én',
+    'En3': 'Ěn',
+    'En4': 'Èn',
+    'En5': 'En',
+    'Eng1': 'Ēng',
+    'Eng2': 'Éng',
+    'Eng3': 'Ěng',
+    'Eng4': 'Èng',
+    'Eng5': 'Eng',
+    'Er1': 'Ēr',
+    'Er2': 'Ér',
+    'Er3': 'Ěr',
+    'Er4': 'Èr',
+    'Er5': 'Er',
+    'Fa1': 'Fā',
+    'Fa2': 'Fá',
+    'Fa3': 'Fǎ',
+    'Fa4': 'Fà',
+    'Fa5': 'Fa',
+    'Fan1': 'Fān',
+    'Fan2': 'Fán',
+    'Fan3': 'Fǎn',
+    'Fan4': 'Fàn',
+    'Fan5': 'Fan',
+    'Fang1': 'Fāng',
+    'Fang2': 'Fáng',
+    'Fang3': 'Fǎng',
+    'Fang4': 'Fàng',
+    'Fang5': 'Fang',
+    'Fei1': 'Fēi',
+    'Fei2': 'Féi',
+    'Fei3': 'Fěi',
+    'Fei4': 'Fèi',
+    'Fei5': 'Fei',
+    'Fen1': 'Fēn',
+    'Fen2': 'Fén',
+    'Fen3': 'Fěn',
+    'Fen4': 'Fèn',
+    'Fen5': 'Fen',
+    'Feng1': 'Fēng',
+    'Feng2': 'Féng',
+    'Feng3': 'Fěng',
+    'Feng4': 'Fèng',
+    'Feng5': 'Feng',
+    'Fo1': 'Fō',
+    'Fo2': 'Fó',
+    'Fo3': 'Fǒ',
+    'Fo4': 'Fò',
+    'Fo5': 'Fo',
+    'Fou1': 'Fōu',
+    'Fou2': 'Fóu',
+    'Fou3': 'Fǒu',
+    'Fou4': 'Fòu',
+    'Fou5': 'Fou',
+    'Fu1': 'Fū',
+    'Fu2': 'Fú',
+    'Fu3': 'Fǔ',
+    'Fu4': 'Fù',
+    'Fu5': 'Fu',
+    'Ga1': 'Gā',
+    'Ga2': 'Gá',
+    'Ga3': 'Gǎ',
+    'Ga4': 'Gà',
+    'Ga5': 'Ga',
+    'Gai1': 'Gāi',
+    'Gai2': 'Gái',
+    'Gai3': 'Gǎi',
+    'Gai4': 'Gài',
+    'Gai5': 'Gai',
+    'Gan1': 'Gān',
+    'Gan2': 'Gán',
+    'Gan3': 'Gǎn',
+    'Gan4': 'Gàn',
+    'Gan5': 'Gan',
+    'Gang1': 'Gāng',
+    'Gang2': 'Gáng',
+    'Gang3': 'Gǎng',
+    'Gang4': 'Gàng',
+    'Gang5': 'Gang',
+    'Gao1': 'Gāo',
+    'Gao2': 'Gáo',
+    'Gao3': 'Gǎo',
+    'Gao4': 'Gào',
+    'Gao5': 'Gao',
+    'Ge1': 'Gē',
+    'Ge2': 'Gé',
+    'Ge3': 'Gě',
+    'Ge4': 'Gè',
+    'Ge5': 'Ge',
+    'Gei1': 'Gēi',
+    'Gei2': 'Géi',
+    'Gei3': 'Gěi',
+    'Gei4': 'Gèi',
+    'Gei5': 'Gei',
+    'Gen1': 'Gēn',
+    'Gen2': 'Gén',
+    'Gen3': 'Gěn',
+    'Gen4': 'Gèn',
+    'Gen5': 'Gen',
+    'Geng1': 'Gēng',
+    'Geng2': 'Géng',
+    'Geng3': 'Gěng',
+    'Geng4': 'Gèng',
+    'Geng5': 'Geng',
+    'Gong1': 'Gōng',
+    'Gong2': 'Góng',
+    'Gong3': 'Gǒng',
+    'Gong4': 'Gòng',
+    'Gong5': 'Gong',
+    'Gou1': 'Gōu',
+    'Gou2': 'Góu',
+    'Gou3': 'Gǒu',
+    'Gou4': 'Gòu',
+    'Gou5': 'Gou',
+    'Gu1': 'Gū',
+    'Gu2': 'Gú',
+    'Gu3': 'Gǔ',
+    'Gu4': 'Gù',
+    'Gu5': 'Gu',
+    'Gua1': 'Guā',
+    'Gua2': 'Guá',
+    'Gua3': 'Guǎ',
+    'Gua4': 'Guà',
+    'Gua5': 'Gua',
+    'Guai1': 'Guāi',
+    'Guai2': 'Guái',
+    'Guai3': 'Guǎi',
+    'Guai4': 'Guài',
+    'Guai5': 'Guai',
+    'Guan1': 'Guān',
+    'Guan2': 'Guán',
+    'Guan3': 'Guǎn',
+    'Guan4': 'Guàn',
+    'Guan5': 'Guan',
+    'Guang1': 'Guāng',
+    'Guang2': 'Guáng',
+    'Guang3': 'Guǎng',
+    'Guang4': 'Guàng',
+    'Guang5': 'Guang',
+    'Gui1': 'Guī',
+    'Gui2': 'Guí',
+    'Gui3': 'Guǐ',
+    'Gui4': 'Guì',
+    'Gui5': 'Gui',
+    'Gun1': 'Gūn',
+    'Gun2': 'Gún',
+    'Gun3': 'Gǔn',
+    'Gun4': 'Gùn',
+    'Gun5': 'Gun',
+    'Guo1': 'Guō',
+    'Guo2': 'Guó',
+    'Guo3': 'Guǒ',
+    'Guo4': 'Guò',
+    'Guo5': 'Guo',
+    'Ha1': 'Hā',
+    'Ha2': 'Há',
+    'Ha3': 'Hǎ',
+    'Ha4': 'Hà',
+    'Ha5': 'Ha',
+    'Hai1': 'Hāi',
+    'Hai2': 'Hái',
+    'Hai3': 'Hǎi',
+    'Hai4': 'Hài',
+    'Hai5': 'Hai',
+    'Han1': 'Hān',
+    'Han2': 'Hán',
+    'Han3': 'Hǎn',
+    'Han4': 'Hàn',
+    'Han5': 'Han',
+    'Hang1': 'Hāng',
+    'Hang2': 'Háng',
+    'Hang3': 'Hǎng',
+    'Hang4': 'Hàng',
+    'Hang5': 'Hang',
+    'Hao1': 'Hāo',
+    'Hao2': 'Háo',
+    'Hao3': 'Hǎo',
+    'Hao4': 'Hào',
+    'Hao5': 'Hao',
+    'He1': 'Hē',
+    'He2': 'Hé',
+    'He3': 'Hě',
+    'He4': 'Hè',
+    'He5': 'He',
+    'Hei1': 'Hēi',
+    'Hei2': 'Héi',
+    'Hei3': 'Hěi',
+    'Hei4': 'Hèi',
+    'Hei5': 'Hei',
+    'Hen1': 'Hēn',
+    'Hen2': 'Hén',
+    'Hen3': 'Hěn',
+    'Hen4': 'Hèn',
+    'Hen5': 'Hen',
+    'Heng1': 'Hēng',
+    'Heng2': 'Héng',
+    'Heng3': 'Hěng',
+    'Heng4': 'Hèng',
+    'Heng5': 'Heng',
+    'Hong1': 'Hōng',
+    'Hong2': 'Hóng',
+    'Hong3': 'Hǒng',
+    'Hong4': 'Hòng',
+    'Hong5': 'Hong',
+    'Hou1': 'Hōu',
+    'Hou2': 'Hóu',
+    'Hou3': 'Hǒu',
+    'Hou4': 'Hòu',
+    'Hou5': 'Hou',
+    'Hu1': 'Hū',
+    'Hu2': 'Hú',
+    'Hu3': 'Hǔ',
+    'Hu4': 'Hù',
+    'Hu5': 'Hu',
+    'Hua1': 'Huā',
+    'Hua2': 'Huá',
+    'Hua3': 'Huǎ',
+    'Hua4': 'Huà',
+    'Hua5': 'Hua',
+    'Huai1': 'Huāi',
+    'Huai2': 'Huái',
+    'Huai3': 'Huǎi',
+    'Huai4': 'Huài',
+    'Huai5': 'Huai',
+    'Huan1': 'Huān',
+    'Huan2': 'Huán',
+    'Huan3': 'Huǎn',
+    'Huan4': 'Huàn',
+    'Huan5': 'Huan',
+    'Huang1': 'Huāng',
+    'Huang2': 'Huáng',
+    'Huang3': 'Huǎng',
+    'Huang4': 'Huàng',
+    'Huang5': 'Huang',
+    'Hui1': 'Huī',
+    'Hui2': 'Huí',
+    'Hui3': 'Huǐ',
+    'Hui4': 'Huì',
+    'Hui5': 'Hui',
+    'Hun1': 'Hūn',
+    'Hun2': 'Hún',
+    'Hun3': 'Hǔn',
+    'Hun4': 'Hùn',
+    'Hun5': 'Hun',
+    'Huo1': 'Huō',
+    'Huo2': 'Huó',
+    'Huo3': 'Huǒ',
+    'Huo4': 'Huò',
+    'Huo5': 'Huo',
+    'Ji1': 'Jī',
+    'Ji2': 'Jí',
+    'Ji3': 'Jǐ',
+    'Ji4': 'Jì',
+    'Ji5': 'Ji',
+    'Jia1': 'Jiā',
+    'Jia2': 'Jiá',
+    'Jia3': 'Jiǎ',
+    'Jia4': 'Jià',
+    'Jia5': 'Jia',
+    'Jian1': 'Jiān',
+    'Jian2': 'Jián',
+    'Jian3': 'Jiǎn',
+    'Jian4': 'Jiàn',
+    'Jian5': 'Jian',
+    'Jiang1': 'Jiāng',
+    'Jiang2': 'Jiáng',
+    'Jiang3': 'Jiǎng',
+    'Jiang4': 'Jiàng',
+    'Jiang5': 'Jiang',
+    'Jiao1': 'Jiāo',
+    'Jiao2': 'Jiáo',
+    'Jiao3': 'Jiǎo',
+    'Jiao4': 'Jiào',
+    'Jiao5': 'Jiao',
+    'Jie1': 'Jiē',
+    'Jie2': 'Jié',
+    'Jie3': 'Jiě',
+    'Jie4': 'Jiè',
+    'Jie5': 'Jie',
+    'Jin1': 'Jīn',
+    'Jin2': 'Jín',
+    'Jin3': 'Jǐn',
+    'Jin4': 'Jìn',
+    'Jin5': 'Jin',
+    'Jing1': 'Jīng',
+    'Jing2': 'Jíng',
+    'Jing3': 'Jǐng',
+    'Jing4': 'Jìng',
+    'Jing5': 'Jing',
+    'Jiong1': 'Jiōng',
+    'Jiong2': 'Jióng',
+    'Jiong3': 'Jiǒng',
+    'Jiong4': 'Jiòng',
+    'Jiong5': 'Jiong',
+    'Jiu1': 'Jiū',
+    'Jiu2': 'Jiú',
+    'Jiu3': 'Jiǔ',
+    'Jiu4': 'Jiù',
+    'Jiu5': 'Jiu',
+    'Ju1': 'Jū',
+    'Ju2': 'Jú',
+    'Ju3': 'Jǔ',
+    'Ju4': 'Jù',
+    'Ju5': 'Ju',
+    'Juan1': 'Juān',
+    'Juan2': 'Juán',
+    'Juan3': 'Juǎn',
+    'Juan4': 'Juàn',
+    'Juan5': 'Juan',
+    'Jue1': 'Juē',
+    'Jue2': 'Jué',
+    'Jue3': 'Juě',
+    'Jue4': 'Juè',
+    'Jue5': 'Jue',
+    'Jun1': 'Jūn',
+    'Jun2': 'Jún',
+    'Jun3': 'Jǔn',
+    'Jun4': 'Jùn',
+    'Jun5': 'Jun',
+    'Ka1': 'Kā',
+    'Ka2': 'Ká',
+    'Ka3': 'Kǎ',
+    'Ka4': 'Kà',
+    'Ka5': 'Ka',
+    'Kai1': 'Kāi',
+    'Kai2': 'Kái',
+    'Kai3': 'Kǎi',
+    'Kai4': 'Kài',
+    'Kai5': 'Kai',
+    'Kan1': 'Kān',
+    'Kan2': 'Kán',
+    'Kan3': 'Kǎn',
+    'Kan4': 'Kàn',
+    'Kan5': 'Kan',
+    'Kang1': 'Kāng',
+    'Kang2': 'Káng',
+    'Kang3': 'Kǎng',
+    'Kang4': 'Kàng',
+    'Kang5': 'Kang',
+    'Kao1': 'Kāo',
+    'Kao2': 'Káo',
+    'Kao3': 'Kǎo',
+    'Kao4': 'Kào',
+    'Kao5': 'Kao',
+    'Ke1': 'Kē',
+    'Ke2': 'Ké',
+    'Ke3': 'Kě',
+    'Ke4': 'Kè',
+    'Ke5': 'Ke',
+    'Kei1': 'Kēi',
+    'Kei2': 'Kéi',
+    'Kei3': 'Kěi',
+    'Kei4': 'Kèi',
+    'Kei5': 'Kei',
+    'Ken1': 'Kēn',
+    'Ken2': 'Kén',
+    'Ken3': 'Kěn',
+    'Ken4': 'Kèn',
+    'Ken5': 'Ken',
+    'Keng1': 'Kēng',
+    'Keng2': 'Kéng',
+    'Keng3': 'Kěng',
+    'Keng4': 'Kèng',
+    'Keng5': 'Keng',
+    'Kong1': 'Kōng',
+    'Kong2': 'Kóng',
+    'Kong3': 'Kǒng',
+    'Kong4': 'Kòng',
+    'Kong5': 'Kong',
+    'Kou1': 'Kōu',
+    'Kou2': 'Kóu',
+    'Kou3': 'Kǒu',
+    'Kou4': 'Kòu',
+    'Kou5': 'Kou',
+    'Ku1': 'Kū',
+    'Ku2': 'Kú',
+    'Ku3': 'Kǔ',
+    'Ku4': 'Kù',
+    'Ku5': 'Ku',
+    'Kua1': 'Kuā',
+    'Kua2': 'Kuá',
+    'Kua3': 'Kuǎ',
+    'Kua4': 'Kuà',
+    'Kua5': 'Kua',
+    'Kuai1': 'Kuāi',
+    'Kuai2': 'Kuái',
+    'Kuai3': 'Kuǎi',
+    'Kuai4': 'Kuài',
+    'Kuai5': 'Kuai',
+    'Kuan1': 'Kuān',
+    'Kuan2': 'Kuán',
+    'Kuan3': 'Kuǎn',
+    'Kuan4': 'Kuàn',
+    'Kuan5': 'Kuan',
+    'Kuang1': 'Kuāng',
+    'Kuang2': 'Kuáng',
+    'Kuang3': 'Kuǎng',
+    'Kuang4': 'Kuàng',
+    'Kuang5': 'Kuang',
+    'Kui1': 'Kuī',
+    'Kui2': 'Kuí',
+    'Kui3': 'Kuǐ',
+    'Kui4': 'Kuì',
+    'Kui5': 'Kui',
+    'Kun1': 'Kūn',
+    'Kun2': 'Kún',
+    'Kun3': 'Kǔn',
+    'Kun4': 'Kùn',
+    'Kun5': 'Kun',
+    'Kuo1': 'Kuō',
+    'Kuo2': 'Kuó',
+    'Kuo3': 'Kuǒ',
+    'Kuo4': 'Kuò',
+    'Kuo5': 'Kuo',
+    'La1': 'Lā',
+    'La2': 'Lá',
+    'La3': 'Lǎ',
+    'La4': 'Là',
+    'La5': 'La',
+    'Lai1': 'Lāi',
+    'Lai2': 'Lái',
+    'Lai3': 'Lǎi',
+    'Lai4': 'Lài',
+    'Lai5': 'Lai',
+    'Lan1': 'Lān',
+    'Lan2': 'Lán',
+    'Lan3': 'Lǎn',
+    'Lan4': 'Làn',
+    'Lan5': 'Lan',
+    'Lang1': 'Lāng',
+    'Lang2': 'Láng',
+    'Lang3': 'Lǎng',
+    'Lang4': 'Làng',
+    'Lang5': 'Lang',
+    'Lao1': 'Lāo',
+    'Lao2': 'Láo',
+    'Lao3': 'Lǎo',
+    'Lao4': 'Lào',
+    'Lao5': 'Lao',
+    'Le1': 'Lē',
+    'Le2': 'Lé',
+    'Le3': 'Lě',
+    'Le4': 'Lè',
+    'Le5': 'Le',
+    'Lei1': 'Lēi',
+    'Lei2': 'Léi',
+    'Lei3': 'Lěi',
+    'Lei4': 'Lèi',
+    'Lei5': 'Lei',
+    'Leng1': 'Lēng',
+    'Leng2': 'Léng',
+    'Leng3': 'Lěng',
+    'Leng4': 'Lèng',
+    'Leng5': 'Leng',
+    'Li1': 'Lī',
+    'Li2': 'Lí',
+    'Li3': 'Lǐ',
+    'Li4': 'Lì',
+    'Li5': 'Li',
+    'Lia1': 'Liā',
+    'Lia2': 'Liá',
+    'Lia3': 'Liǎ',
+    'Lia4': 'Lià',
+    'Lia5': 'Lia',
+    'Lian1': 'Liān',
+    'Lian2': 'Lián',
+    'Lian3': 'Liǎn',
+    'Lian4': 'Liàn',
+    'Lian5': 'Lian',
+    'Liang1': 'Liāng',
+    'Liang2': 'Liáng',
+    'Liang3': 'Liǎng',
+    'Liang4': 'Liàng',
+    'Liang5': 'Liang',
+    'Liao1': 'Liāo',
+    'Liao2': 'Liáo',
+    'Liao3': 'Liǎo',
+    'Liao4': 'Liào',
+    'Liao5': 'Liao',
+    'Lie1': 'Liē',
+    'Lie2': 'Lié',
+    'Lie3': 'Liě',
+    'Lie4': 'Liè',
+    'Lie5': 'Lie',
+    'Lin1': 'Līn',
+    'Lin2': 'Lín',
+    'Lin3': 'Lǐn',
+    'Lin4': 'Lìn',
+    'Lin5': 'Lin',
+    'Ling1': 'Līng',
+    'Ling2': 'Líng',
+    'Ling3': 'Lǐng',
+    'Ling4': 'Lìng',
+    'Ling5': 'Ling',
+    'Liu1': 'Liū',
+    'Liu2': 'Liú',
+    'Liu3': 'Liǔ',
+    'Liu4': 'Liù',
+    'Liu5': 'Liu',
+    'Lo1': 'Lō',
+    'Lo2': 'Ló',
+    'Lo3': 'Lǒ',
+    'Lo4': 'Lò',
+    'Lo5': 'Lo',
+    'Long1': 'Lōng',
+    'Long2': 'Lóng',
+    'Long3': 'Lǒng',
+    'Long4': 'Lòng',
+    'Long5': 'Long',
+    'Lou1': 'Lōu',
+    'Lou2': 'Lóu',
+    'Lou3': 'Lǒu',
+    'Lou4': 'Lòu',
+    'Lou5': 'Lou',
+    'Lu1': 'Lū',
+    'Lu2': 'Lú',
+    'Lu3': 'Lǔ',
+    'Lu4': 'Lù',
+    'Lu5': 'Lu',
+    'Lu:1': 'Lǖ',
+    'Lu:2': 'Lǘ',
+    'Lu:3': 'Lǚ',
+    'Lu:4': 'Lǜ',
+    'Lu:5': 'Lü',
+    'Lu:e1': 'Lüē',
+    'Lu:e2': 'Lüé',
+    'Lu:e3': 'Lüě',
+    'Lu:e4': 'Lüè',
+    'Lu:e5': 'Lüe',
+    'Luan1': 'Luān',
+    'Luan2': 'Luán',
+    'Luan3': 'Luǎn',
+    'Luan4': 'Luàn',
+    'Luan5': 'Luan',
+    'Lun1': 'Lūn',
+    'Lun2': 'Lún',
+    'Lun3': 'Lǔn',
+    'Lun4': 'Lùn',
+    'Lun5': 'Lun',
+    'Luo1': 'Luō',
+    'Luo2': 'Luó',
+    'Luo3': 'Luǒ',
+    'Luo4': 'Luò',
+    'Luo5': 'Luo',
+    'Lv1': 'Lǖ',
+    'Lv2': 'Lǘ',
+    'Lv3': 'Lǚ',
+    'Lv4': 'Lǜ',
+    'Lv5': 'Lü',
+    'Lve1': 'Lüē',
+    'Lve2': 'Lüé',
+    'Lve3': 'Lüě',
+    'Lve4': 'Lüè',
+    'Lve5': 'Lüe',
+    'Lü1': 'Lǖ',
+    'Lü2': 'Lǘ',
+    'Lü3': 'Lǚ',
+    'Lü4': 'Lǜ',
+    'Lü5': 'Lü',
+    'Lüe1': 'Lüē',
+    'Lüe2': 'Lüé',
+    'Lüe3': 'Lüě',
+    'Lüe4': 'Lüè',
+    'Lüe5': 'Lüe',
+    'Ma1': 'Mā',
+    'Ma2': 'Má',
+    'Ma3': 'Mǎ',
+    'Ma4': 'Mà',
+    'Ma5': 'Ma',
+    'Mai1': 'Māi',
+    'Mai2': 'Mái',
+    'Mai3': 'Mǎi',
+    'Mai4': 'Mài',
+    'Mai5': 'Mai',
+    'Man1': 'Mān',
+    'Man2': 'Mán',
+    'Man3': 'Mǎn',
+    'Man4': 'Màn',
+    'Man5': 'Man',
+    'Mang1': 'Māng',
+    'Mang2': 'Máng',
+    'Mang3': 'Mǎng',
+    'Mang4': 'Màng',
+    'Mang5': 'Mang',
+    'Mao1': 'Māo',
+    'Mao2': 'Máo',
+    'Mao3': 'Mǎo',
+    'Mao4': 'Mào',
+    'Mao5': 'Mao',
+    'Me1': 'Mē',
+    'Me2': 'Mé',
+    'Me3': 'Mě',
+    'Me4': 'Mè',
+    'Me5': 'Me',
+    'Mei1': 'Mēi',
+    'Mei2': 'Méi',
+    'Mei3': 'Měi',
+    'Mei4': 'Mèi',
+    'Mei5': 'Mei',
+    'Men1': 'Mēn',
+    'Men2': 'Mén',
+    'Men3': 'Měn',
+    'Men4': 'Mèn',
+    'Men5': 'Men',
+    'Meng1': 'Mēng',
+    'Meng2': 'Méng',
+    'Meng3': 'Měng',
+    'Meng4': 'Mèng',
+    'Meng5': 'Meng',
+    'Mi1': 'Mī',
+    'Mi2': 'Mí',
+    'Mi3': 'Mǐ',
+    'Mi4': 'Mì',
+    'Mi5': 'Mi',
+    'Mian1': 'Miān',
+    'Mian2': 'Mián',
+    'Mian3': 'Miǎn',
+    'Mian4': 'Miàn',
+    'Mian5': 'Mian',
+    'Miao1': 'Miāo',
+    'Miao2': 'Miáo',
+    'Miao3': 'Miǎo',
+    'Miao4': 'Miào',
+    'Miao5': 'Miao',
+    'Mie1': 'Miē',
+    'Mie2': 'Mié',
+    'Mie3': 'Miě',
+    'Mie4': 'Miè',
+    'Mie5': 'Mie',
+    'Min1': 'Mīn',
+    'Min2': 'Mín',
+    'Min3': 'Mǐn',
+    'Min4': 'Mìn',
+    'Min5': 'Min',
+    'Ming1': 'Mīng',
+    'Ming2': 'Míng',
+    'Ming3': 'Mǐng',
+    'Ming4': 'Mìng',
+    'Ming5': 'Ming',
+    'Miu1': 'Miū',
+    'Miu2': 'Miú',
+    'Miu3': 'Miǔ',
+    'Miu4': 'Miù',
+    'Miu5': 'Miu',
+    'Mo1': 'Mō',
+    'Mo2': 'Mó',
+    'Mo3': 'Mǒ',
+    'Mo4': 'Mò',
+    'Mo5': 'Mo',
+    'Mou1': 'Mōu',
+    'Mou2': 'Móu',
+    'Mou3': 'Mǒu',
+    'Mou4': 'Mòu',
+    'Mou5': 'Mou',
+    'Mu1': 'Mū',
+    'Mu2': 'Mú',
+    'Mu3': 'Mǔ',
+    'Mu4': 'Mù',
+    'Mu5': 'Mu',
+    'Na1': 'Nā',
+    'Na2': 'Ná',
+    'Na3': 'Nǎ',
+    'Na4': 'Nà',
+    'Na5': 'Na',
+    'Nai1': 'Nāi',
+    'Nai2': 'Nái',
+    'Nai3': 'Nǎi',
+    'Nai4': 'Nài',
+    'Nai5': 'Nai',
+    'Nan1': 'Nān',
+    'Nan2': 'Nán',
+    'Nan3': 'Nǎn',
+    'Nan4': 'Nàn',
+    'Nan5': 'Nan',
+    'Nang1': 'Nāng',
+    'Nang2': 'Náng',
+    'Nang3': 'Nǎng',
+    'Nang4': 'Nàng',
+    'Nang5': 'Nang',
+    'Nao1': 'Nāo',
+    'Nao2': 'Náo',
+    'Nao3': 'Nǎo',
+    'Nao4': 'Nào',
+    'Nao5': 'Nao',
+    'Ne1': 'Nē',
+    'Ne2': 'Né',
+    'Ne3': 'Ně',
+    'Ne4': 'Nè',
+    'Ne5': 'Ne',
+    'Nei1': 'Nēi',
+    'Nei2': 'Néi',
+    'Nei3': 'Něi',
+    'Nei4': 'Nèi',
+    'Nei5': 'Nei',
+    'Nen1': 'Nēn',
+    'Nen2': 'Nén',
+    'Nen3': 'Něn',
+    'Nen4': 'Nèn',
+    'Nen5': 'Nen',
+    'Neng1': 'Nēng',
+    'Neng2': 'Néng',
+    'Neng3': 'Něng',
+    'Neng4': 'Nèng',
+    'Neng5': 'Neng',
+    'Ni1': 'Nī',
+    'Ni2': 'Ní',
+    'Ni3': 'Nǐ',
+    'Ni4': 'Nì',
+    'Ni5': 'Ni',
+    'Nian1': 'Niān',
+    'Nian2': 'Nián',
+    'Nian3': 'Niǎn',
+    'Nian4': 'Niàn',
+    'Nian5': 'Nian',
+    'Niang1': 'Niāng',
+    'Niang2': 'Niáng',
+    'Niang3': 'Niǎng',
+    'Niang4': 'Niàng',
+    'Niang5': 'Niang',
+    'Niao1': 'Niāo',
+    'Niao2': 'Niáo',
+    'Niao3': 'Niǎo',
+    'Niao4': 'Niào',
+    'Niao5': 'Niao',
+    'Nie1': 'Niē',
+    'Nie2': 'Nié',
+    'Nie3': 'Niě',
+    'Nie4': 'Niè',
+    'Nie5': 'Nie',
+    'Nin1': 'Nīn',
+    'Nin2': 'Nín',
+    'Nin3': 'Nǐn',
+    'Nin4': 'Nìn',
+    'Nin5': 'Nin',
+    'Ning1': 'Nīng',
+    'Ning2': 'Níng',
+    'Ning3': 'Nǐng',
+    'Ning4': 'Nìng',
+    'Ning5': 'Ning',
+    'Niu1': 'Niū',
+    'Niu2': 'Niú',
+    'Niu3': 'Niǔ',
+    'Niu4': 'Niù',
+    'Niu5': 'Niu',
+    'Nong1': 'Nōng',
+    'Nong2': 'Nóng',
+    'Nong3': 'Nǒng',
+    'Nong4': 'Nòng',
+    'Nong5': 'Nong',
+    'Nou1': 'Nōu',
+    'Nou2': 'Nóu',
+    'Nou3': 'Nǒu',
+    'Nou4': 'Nòu',
+    'Nou5': 'Nou',
+    'Nu1': 'Nū',
+    'Nu2': 'Nú',
+    'Nu3': 'Nǔ',
+    'Nu4': 'Nù',
+    'Nu5': 'Nu',
+    'Nu:1': 'Nǖ',
+    'Nu:2': 'Nǘ',
+    'Nu:3': 'Nǚ',
+    'Nu:4': 'Nǜ',
+    'Nu:5': 'Nü',
+    'Nu:e1': 'Nüē',
+    'Nu:e2': 'Nüé',
+    'Nu:e3': 'Nüě',
+    'Nu:e4': 'Nüè',
+    'Nu:e5': 'Nüe',
+    'Nuan1': 'Nuān',
+    'Nuan2': 'Nuán',
+    'Nuan3': 'Nuǎn',
+    'Nuan4': 'Nuàn',
+    'Nuan5': 'Nuan',
+    'Nun1': 'Nūn',
+    'Nun2': 'Nún',
+    'Nun3': 'Nǔn',
+    'Nun4': 'Nùn',
+    'Nun5': 'Nun',
+    'Nuo1': 'Nuō',
+    'Nuo2': 'Nuó',
+    'Nuo3': 'Nuǒ',
+    'Nuo4': 'Nuò',
+    'Nuo5': 'Nuo',
+    'Nv1': 'Nǖ',
+    'Nv2': 'Nǘ',
+    'Nv3': 'Nǚ',
+    'Nv4': 'Nǜ',
+    'Nv5': 'Nü',
+    'Nve1': 'Nüē',
+    'Nve2': 'Nüé',
+    'Nve3': 'Nüě',
+    'Nve4': 'Nüè',
+    'Nve5': 'Nüe',
+    'Nü1': 'Nǖ',
+    'Nü2': 'Nǘ',
+    'Nü3': 'Nǚ',
+    'Nü4': 'Nǜ',
+    'Nü5': 'Nü',
+    'Nüe1': 'Nüē',
+    'Nüe2': 'Nüé',
+    'Nüe3': 'Nüě',
+    'Nüe4': 'Nüè',
+    'Nüe5': 'Nüe',
+    'O1': 'Ō',
+    'O2': 'Ó',
+    'O3': 'Ǒ',
+    'O4': 'Ò',
+    'O5': 'O',
+    'Ou1': 'Ōu',
+    'Ou2': 'Óu',
+    'Ou3': 'Ǒu',
+    'Ou4': 'Òu',
+    'Ou5': 'Ou',
+    'Pa1': 'Pā',
+    'Pa2': 'Pá',
+    'Pa3': 'Pǎ',
+    'Pa4': 'Pà',
+    'Pa5': 'Pa',
+    'Pai1': 'Pāi',
+    'Pai2': 'Pái',
+    'Pai3': 'Pǎi',
+    'Pai4': 'Pài',
+    'Pai5': 'Pai',
+    'Pan1': 'Pān',
+    'Pan2': 'Pán',
+    'Pan3': 'Pǎn',
+    'Pan4': 'Pàn',
+    'Pan5': 'Pan',
+    'Pang1': 'Pāng',
+    'Pang2': 'Páng',
+    'Pang3': 'Pǎng',
+    'Pang4': 'Pàng',
+    'Pang5': 'Pang',
+    'Pao1': 'Pāo',
+    'Pao2': 'Páo',
+    'Pao3': 'Pǎo',
+    'Pao4': 'Pào',
+    'Pao5': 'Pao',
+    'Pei1': 'Pēi',
+    'Pei2': 'Péi',
+    'Pei3': 'Pěi',
+    'Pei4': 'Pèi',
+    'Pei5': 'Pei',
+    'Pen1': 'Pēn',
+    'Pen2': 'Pén',
+    'Pen3': 'Pěn',
+    'Pen4': 'Pèn',
+    'Pen5': 'Pen',
+    'Peng1': 'Pēng',
+    'Peng2': 'Péng',
+    'Peng3': 'Pěng',
+    'Peng4': 'Pèng',
+    'Peng5': 'Peng',
+    'Pi1': 'Pī',
+    'Pi2': 'Pí',
+    'Pi3': 'Pǐ',
+    'Pi4': 'Pì',
+    'Pi5': 'Pi',
+    'Pian1': 'Piān',
+    'Pian2': 'Pián',
+    'Pian3': 'Piǎn',
+    'Pian4': 'Piàn',
+    'Pian5': 'Pian',
+    'Piao1': 'Piāo',
+    'Piao2': 'Piáo',
+    'Piao3': 'Piǎo',
+    'Piao4': 'Piào',
+    'Piao5': 'Piao',
+    'Pie1': 'Piē',
+    'Pie2': 'Pié',
+    'Pie3': 'Piě',
+    'Pie4': 'Piè',
+    'Pie5': 'Pie',
+    'Pin1': 'Pīn',
+    'Pin2': 'Pín',
+    'Pin3': 'Pǐn',
+    'Pin4': 'Pìn',
+    'Pin5': 'Pin',
+    'Ping1': 'Pīng',
+    'Ping2': 'Píng',
+    'Ping3': 'Pǐng',
+    'Ping4': 'Pìng',
+    'Ping5': 'Ping',
+    'Po1': 'Pō',
+    'Po2': 'Pó',
+    'Po3': 'Pǒ',
+    'Po4': 'Pò',
+    'Po5': 'Po',
+    'Pou1': 'Pōu',
+    'Pou2': 'Póu',
+    'Pou3': 'Pǒu',
+    'Pou4': 'Pòu',
+    'Pou5': 'Pou',
+    'Pu1': 'Pū',
+    'Pu2': 'Pú',
+    'Pu3': 'Pǔ',
+    'Pu4': 'Pù',
+    'Pu5': 'Pu',
+    'Qi1': 'Qī',
+    'Qi2': 'Qí',
+    'Qi3': 'Qǐ',
+    'Qi4': 'Qì',
+    'Qi5': 'Qi',
+    'Qia1': 'Qiā',
+    'Qia2': 'Qiá',
+    'Qia3': 'Qiǎ',
+    'Qia4': 'Qià',
+    'Qia5': 'Qia',
+    'Qian1': 'Qiān',
+    'Qian2': 'Qián',
+    'Qian3': 'Qiǎn',
+    'Qian4': 'Qiàn',
+    'Qian5': 'Qian',
+    'Qiang1': 'Qiāng',
+    'Qiang2': 'Qiáng',
+    'Qiang3': 'Qiǎng',
+    'Qiang4': 'Qiàng',
+    'Qiang5': 'Qiang',
+    'Qiao1': 'Qiāo',
+    'Qiao2': 'Qiáo',
+    'Qiao3': 'Qiǎo',
+    'Qiao4': 'Qiào',
+    'Qiao5': 'Qiao',
+    'Qie1': 'Qiē',
+    'Qie2': 'Qié',
+    'Qie3': 'Qiě',
+    'Qie4': 'Qiè',
+    'Qie5': 'Qie',
+    'Qin1': 'Qīn',
+    'Qin2': 'Qín',
+    'Qin3': 'Qǐn',
+    'Qin4': 'Qìn',
+    'Qin5': 'Qin',
+    'Qing1': 'Qīng',
+    'Qing2': 'Qíng',
+    'Qing3': 'Qǐng',
+    'Qing4': 'Qìng',
+    'Qing5': 'Qing',
+    'Qiong1': 'Qiōng',
+    'Qiong2': 'Qióng',
+    'Qiong3': 'Qiǒng',
+    'Qiong4': 'Qiòng',
+    'Qiong5': 'Qiong',
+    'Qiu1': 'Qiū',
+    'Qiu2': 'Qiú',
+    'Qiu3': 'Qiǔ',
+    'Qiu4': 'Qiù',
+    'Qiu5': 'Qiu',
+    'Qu1': 'Qū',
+    'Qu2': 'Qú',
+    'Qu3': 'Qǔ',
+    'Qu4': 'Qù',
+    'Qu5': 'Qu',
+    'Quan1': 'Quān',
+    'Quan2': 'Quán',
+    'Quan3': 'Quǎn',
+    'Quan4': 'Quàn',
+    'Quan5': 'Quan',
+    'Que1': 'Quē',
+    'Que2': 'Qué',
+    'Que3': 'Quě',
+    'Que4': 'Què',
+    'Que5': 'Que',
+    'Qun1': 'Qūn',
+    'Qun2': 'Qún',
+    'Qun3': 'Qǔn',
+    'Qun4': 'Qùn',
+    'Qun5': 'Qun',
+    'Ran1': 'Rān',
+    'Ran2': 'Rán',
+    'Ran3': 'Rǎn',
+    'Ran4': 'Ràn',
+    'Ran5': 'Ran',
+    'Rang1': 'Rāng',
+    'Rang2': 'Ráng',
+    'Rang3': 'Rǎng',
+    'Rang4': 'Ràng',
+    'Rang5': 'Rang',
+    'Rao1': 'Rāo',
+    'Rao2': 'Ráo',
+    'Rao3': 'Rǎo',
+    'Rao4': 'Rào',
+    'Rao5': 'Rao',
+    'Re1': 'Rē',
+    'Re2': 'Ré',
+    'Re3': 'Rě',
+    'Re4': 'Rè',
+    'Re5': 'Re',
+    'Ren1': 'Rēn',
+    'Ren2': 'Rén',
+    'Ren3': 'Rěn',
+    'Ren4': 'Rèn',
+    'Ren5': 'Ren',
+    'Reng1': 'Rēng',
+    'Reng2': 'Réng',
+    'Reng3': 'Rěng',
+    'Reng4': 'Rèng',
+    'Reng5': 'Reng',
+    'Ri1': 'Rī',
+    'Ri2': 'Rí',
+    'Ri3': 'Rǐ',
+    'Ri4': 'Rì',
+    'Ri5': 'Ri',
+    'Rong1': 'Rōng',
+    'Rong2': 'Róng',
+    'Rong3': 'Rǒng',
+    'Rong4': 'Ròng',
+    'Rong5': 'Rong',
+    'Rou1': 'Rōu',
+    'Rou2': 'Róu',
+    'Rou3': 'Rǒu',
+    'Rou4': 'Ròu',
+    'Rou5': 'Rou',
+    'Ru1': 'Rū',
+    'Ru2': 'Rú',
+    'Ru3': 'Rǔ',
+    'Ru4': 'Rù',
+    'Ru5': 'Ru',
+    'Rua1': 'Ruā',
+    'Rua2': 'Ruá',
+    'Rua3': 'Ruǎ',
+    'Rua4': 'Ruà',
+    'Rua5': 'Rua',
+    'Ruan1': 'Ruān',
+    'Ruan2': 'Ruán',
+    'Ruan3': 'Ruǎn',
+    'Ruan4': 'Ruàn',
+    'Ruan5': 'Ruan',
+    'Rui1': 'Ruī',
+    'Rui2': 'Ruí',
+    'Rui3': 'Ruǐ',
+    'Rui4': 'Ruì',
+    'Rui5': 'Rui',
+    'Run1': 'Rūn',
+    'Run2': 'Rún',
+    'Run3': 'Rǔn',
+    'Run4': 'Rùn',
+    'Run5': 'Run',
+    'Ruo1': 'Ruō',
+    'Ruo2': 'Ruó',
+    'Ruo3': 'Ruǒ',
+    'Ruo4': 'Ruò',
+    'Ruo5': 'Ruo',
+    'Sa1': 'Sā',
+    'Sa2': 'Sá',
+    'Sa3': 'Sǎ',
+    'Sa4': 'Sà',
+    'Sa5': 'Sa',
+    'Sai1': 'Sāi',
+    'Sai2': 'Sái',
+    'Sai3': 'Sǎi',
+    'Sai4': 'Sài',
+    'Sai5': 'Sai',
+    'San1': 'Sān',
+    'San2': 'Sán',
+    'San3': 'Sǎn',
+    'San4': 'Sàn',
+    'San5': 'San',
+    'Sang1': 'Sāng',
+    'Sang2': 'Sáng',
+    'Sang3': 'Sǎng',
+    'Sang4': 'Sàng',
+    'Sang5': 'Sang',
+    'Sao1': 'Sāo',
+    'Sao2': 'Sáo',
+    'Sao3': 'Sǎo',
+    'Sao4': 'Sào',
+    'Sao5': 'Sao',
+    'Se1': 'Sē',
+    'Se2': 'Sé',
+    'Se3': 'Sě',
+    'Se4': 'Sè',
+    'Se5': 'Se',
+    'Sen1': 'Sēn',
+    'Sen2': 'Sén',
+    'Sen3': 'Sěn',
+    'Sen4': 'Sèn',
+    'Sen5': 'Sen',
+    'Seng1': 'Sēng',
+    'Seng2': 'Séng',
+    'Seng3': 'Sěng',
+    'Seng4': 'Sèng',
+    'Seng5': 'Seng',
+    'Sha1': 'Shā',
+    'Sha2': 'Shá',
+    'Sha3': 'Shǎ',
+    'Sha4': 'Shà',
+    'Sha5': 'Sha',
+    'Shai1': 'Shāi',
+    'Shai2': 'Shái',
+    'Shai3': 'Shǎi',
+    'Shai4': 'Shài',
+    'Shai5': 'Shai',
+    'Shan1': 'Shān',
+    'Shan2': 'Shán',
+    'Shan3': 'Shǎn',
+    'Shan4': 'Shàn',
+    'Shan5': 'Shan',
+    'Shang1': 'Shāng',
+    'Shang2': 'Sháng',
+    'Shang3': 'Shǎng',
+    'Shang4': 'Shàng',
+    'Shang5': 'Shang',
+    'Shao1': 'Shāo',
+    'Shao2': 'Sháo',
+    'Shao3': 'Shǎo',
+    'Shao4': 'Shào',
+    'Shao5': 'Shao',
+    'She1': 'Shē',
+    'She2': 'Shé',
+    'She3': 'Shě',
+    'She4': 'Shè',
+    'She5': 'She',
+    'Shei1': 'Shēi',
+    'Shei2': 'Shéi',
+    'Shei3': 'Shěi',
+    'Shei4': 'Shèi',
+    'Shei5': 'Shei',
+    'Shen1': 'Shēn',
+    'Shen2': 'Shén',
+    'Shen3': 'Shěn',
+    'Shen4': 'Shèn',
+    'Shen5': 'Shen',
+    'Sheng1': 'Shēng',
+    'Sheng2': 'Shéng',
+    'Sheng3': 'Shěng',
+    'Sheng4': 'Shèng',
+    'Sheng5': 'Sheng',
+    'Shi1': 'Shī',
+    'Shi2': 'Shí',
+    'Shi3': 'Shǐ',
+    'Shi4': 'Shì',
+    'Shi5': 'Shi',
+    'Shou1': 'Shōu',
+    'Shou2': 'Shóu',
+    'Shou3': 'Shǒu',
+    'Shou4': 'Shòu',
+    'Shou5': 'Shou',
+    'Shu1': 'Shū',
+    'Shu2': 'Shú',
+    'Shu3': 'Shǔ',
+    'Shu4': 'Shù',
+    'Shu5': 'Shu',
+    'Shua1': 'Shuā',
+    'Shua2': 'Shuá',
+    'Shua3': 'Shuǎ',
+    'Shua4': 'Shuà',
+    'Shua5': 'Shua',
+    'Shuai1': 'Shuāi',
+    'Shuai2': 'Shuái',
+    'Shuai3': 'Shuǎi',
+    'Shuai4': 'Shuài',
+    'Shuai5': 'Shuai',
+    'Shuan1': 'Shuān',
+    'Shuan2': 'Shuán',
+    'Shuan3': 'Shuǎn',
+    'Shuan4': 'Shuàn',
+    'Shuan5': 'Shuan',
+    'Shuang1': 'Shuāng',
+    'Shuang2': 'Shuáng',
+    'Shuang3': 'Shuǎng',
+    'Shuang4': 'Shuàng',
+    'Shuang5': 'Shuang',
+    'Shui1': 'Shuī',
+    'Shui2': 'Shuí',
+    'Shui3': 'Shuǐ',
+    'Shui4': 'Shuì',
+    'Shui5': 'Shui',
+    'Shun1': 'Shūn',
+    'Shun2': 'Shún',
+    'Shun3': 'Shǔn',
+    'Shun4': 'Shùn',
+    'Shun5': 'Shun',
+    'Shuo1': 'Shuō',
+    'Shuo2': 'Shuó',
+    'Shuo3': 'Shuǒ',
+    'Shuo4': 'Shuò',
+    'Shuo5': 'Shuo',
+    'Si1': 'Sī',
+    'Si2': 'Sí',
+    'Si3': 'Sǐ',
+    'Si4': 'Sì',
+    'Si5': 'Si',
+    'Song1': 'Sōng',
+    'Song2': 'Sóng',
+    'Song3': 'Sǒng',
+    'Song4': 'Sòng',
+    'Song5': 'Song',
+    'Sou1': 'Sōu',
+    'Sou2': 'Sóu',
+    'Sou3': 'Sǒu',
+    'Sou4': 'Sòu',
+    'Sou5': 'Sou',
+    'Su1': 'Sū',
+    'Su2': 'Sú',
+    'Su3': 'Sǔ',
+    'Su4': 'Sù',
+    'Su5': 'Su',
+    'Suan1': 'Suān',
+    'Suan2': 'Suán',
+    'Suan3': 'Suǎn',
+    'Suan4': 'Suàn',
+    'Suan5': 'Suan',
+    'Sui1': 'Suī',
+    'Sui2': 'Suí',
+    'Sui3': 'Suǐ',
+    'Sui4': 'Suì',
+    'Sui5': 'Sui',
+    'Sun1': 'Sūn',
+    'Sun2': 'Sún',
+    'Sun3': 'Sǔn',
+    'Sun4': 'Sùn',
+    'Sun5': 'Sun',
+    'Suo1': 'Suō',
+    'Suo2': 'Suó',
+    'Suo3': 'Suǒ',
+    'Suo4': 'Suò',
+    'Suo5': 'Suo',
+    'Ta1': 'Tā',
+    'Ta2': 'Tá',
+    'Ta3': 'Tǎ',
+    'Ta4': 'Tà',
+    'Ta5': 'Ta',
+    'Tai1': 'Tāi',
+    'Tai2': 'Tái',
+    'Tai3': 'Tǎi',
+    'Tai4': 'Tài',
+    'Tai5': 'Tai',
+    'Tan1': 'Tān',
+    'Tan2': 'Tán',
+    'Tan3': 'Tǎn',
+    'Tan4': 'Tàn',
+    'Tan5': 'Tan',
+    'Tang1': 'Tāng',
+    'Tang2': 'Táng',
+    'Tang3': 'Tǎng',
+    'Tang4': 'Tàng',
+    'Tang5': 'Tang',
+    'Tao1': 'Tāo',
+    'Tao2': 'Táo',
+    'Tao3': 'Tǎo',
+    'Tao4': 'Tào',
+    'Tao5': 'Tao',
+    'Te1': 'Tē',
+    'Te2': 'Té',
+    'Te3': 'Tě',
+    'Te4': 'Tè',
+    'Te5': 'Te',
+    'Tei1': 'Tēi',
+    'Tei2': 'Téi',
+    'Tei3': 'Těi',
+    'Tei4': 'Tèi',
+    'Tei5': 'Tei',
+    'Teng1': 'Tēng',
+    'Teng2': 'Téng',
+    'Teng3': 'Těng',
+    'Teng4': 'Tèng',
+    'Teng5': 'Teng',
+    'Ti1': 'Tī',
+    'Ti2': 'Tí',
+    'Ti3': 'Tǐ',
+    'Ti4': 'Tì',
+    'Ti5': 'Ti',
+    'Tian1': 'Tiān',
+    'Tian2': 'Tián',
+    'Tian3': 'Tiǎn',
+    'Tian4': 'Tiàn',
+    'Tian5': 'Tian',
+    'Tiao1': 'Tiāo',
+    'Tiao2': 'Tiáo',
+    'Tiao3': 'Tiǎo',
+    'Tiao4': 'Tiào',
+    'Tiao5': 'Tiao',
+    'Tie1': 'Tiē',
+    'Tie2': 'Tié',
+    'Tie3': 'Tiě',
+    'Tie4': 'Tiè',
+    'Tie5': 'Tie',
+    'Ting1': 'Tīng',
+    'Ting2': 'Tíng',
+    'Ting3': 'Tǐng',
+    'Ting4': 'Tìng',
+    'Ting5': 'Ting',
+    'Tong1': 'Tōng',
+    'Tong2': 'Tóng',
+    'Tong3': 'Tǒng',
+    'Tong4': 'Tòng',
+    'Tong5': 'Tong',
+    'Tou1': 'Tōu',
+    'Tou2': 'Tóu',
+    'Tou3': 'Tǒu',
+    'Tou4': 'Tòu',
+    'Tou5': 'Tou',
+    'Tu1': 'Tū',
+    'Tu2': 'Tú',
+    'Tu3': 'Tǔ',
+    'Tu4': 'Tù',
+    'Tu5': 'Tu',
+    'Tuan1': 'Tuān',
+    'Tuan2': 'Tuán',
+    'Tuan3': 'Tuǎn',
+    'Tuan4': 'Tuàn',
+    'Tuan5': 'Tuan',
+    'Tui1': 'Tuī',
+    'Tui2': 'Tuí',
+    'Tui3': 'Tuǐ',
+    'Tui4': 'Tuì',
+    'Tui5': 'Tui',
+    'Tun1': 'Tūn',
+    'Tun2': 'Tún',
+    'Tun3': 'Tǔn',
+    'Tun4': 'Tùn',
+    'Tun5': 'Tun',
+    'Tuo1': 'Tuō',
+    'Tuo2': 'Tuó',
+    'Tuo3': 'Tuǒ',
+    'Tuo4': 'Tuò',
+    'Tuo5': 'Tuo',
+    'Wa1': 'Wā',
+    'Wa2': 'Wá',
+    'Wa3': 'Wǎ',
+    'Wa4': 'Wà',
+    'Wa5': 'Wa',
+    'Wai1': 'Wāi',
+    'Wai2': 'Wái',
+    'Wai3': 'Wǎi',
+    'Wai4': 'Wài',
+    'Wai5': 'Wai',
+    'Wan1': 'Wān',
+    'Wan2': 'Wán',
+    'Wan3': 'Wǎn',
+    'Wan4': 'Wàn',
+    'Wan5': 'Wan',
+    'Wang1': 'Wāng',
+    'Wang2': 'Wáng',
+    'Wang3': 'Wǎng',
+    'Wang4': 'Wàng',
+    'Wang5': 'Wang',
+    'Wei1': 'Wēi',
+    'Wei2': 'Wéi',
+    'Wei3': 'Wěi',
+    'Wei4': 'Wèi',
+    'Wei5': 'Wei',
+    'Wen1': 'Wēn',
+    'Wen2': 'Wén',
+    'Wen3': 'Wěn',
+    'Wen4': 'Wèn',
+    'Wen5': 'Wen',
+    'Weng1': 'Wēng',
+    'Weng2': 'Wéng',
+    'Weng3': 'Wěng',
+    'Weng4': 'Wèng',
+    'Weng5': 'Weng',
+    'Wo1': 'Wō',
+    'Wo2': 'Wó',
+    'Wo3': 'Wǒ',
+    'Wo4': 'Wò',
+    'Wo5': 'Wo',
+    'Wu1': 'Wū',
+    'Wu2': 'Wú',
+    'Wu3': 'Wǔ',
+    'Wu4': 'Wù',
+    'Wu5': 'Wu',
+    'Xi1': 'Xī',
+    'Xi2': 'Xí',
+    'Xi3': 'Xǐ',
+    'Xi4': 'Xì',
+    'Xi5': 'Xi',
+    'Xia1': 'Xiā',
+    'Xia2': 'Xiá',
+    'Xia3': 'Xiǎ',
+    'Xia4': 'Xià',
+    'Xia5': 'Xia',
+    'Xian1': 'Xiān',
+    'Xian2': 'Xián',
+    'Xian3': 'Xiǎn',
+    'Xian4': 'Xiàn',
+    'Xian5': 'Xian',
+    'Xiang1': 'Xiāng',
+    'Xiang2': 'Xiáng',
+    'Xiang3': 'Xiǎng',
+    'Xiang4': 'Xiàng',
+    'Xiang5': 'Xiang',
+    'Xiao1': 'Xiāo',
+    'Xiao2': 'Xiáo',
+    'Xiao3': 'Xiǎo',
+    'Xiao4': 'Xiào',
+    'Xiao5': 'Xiao',
+    'Xie1': 'Xiē',
+    'Xie2': 'Xié',
+    'Xie3': 'Xiě',
+    'Xie4': 'Xiè',
+    'Xie5': 'Xie',
+    'Xin1': 'Xīn',
+    'Xin2': 'Xín',
+    'Xin3': 'Xǐn',
+    'Xin4': 'Xìn',
+    'Xin5': 'Xin',
+    'Xing1': 'Xīng',
+    'Xing2': 'Xíng',
+    'Xing3': 'Xǐng',
+    'Xing4': 'Xìng',
+    'Xing5': 'Xing',
+    'Xiong1': 'Xiōng',
+    'Xiong2': 'Xióng',
+    'Xiong3': 'Xiǒng',
+    'Xiong4': 'Xiòng',
+    'Xiong5': 'Xiong',
+    'Xiu1': 'Xiū',
+    'Xiu2': 'Xiú',
+    'Xiu3': 'Xiǔ',
+    'Xiu4': 'Xiù',
+    'Xiu5': 'Xiu',
+    'Xu1': 'Xū',
+    'Xu2': 'Xú',
+    'Xu3': 'Xǔ',
+    'Xu4': 'Xù',
+    'Xu5': 'Xu',
+    'Xuan1': 'Xuān',
+    'Xuan2': 'Xuán',
+    'Xuan3': 'Xuǎn',
+    'Xuan4': 'Xuàn',
+    'Xuan5': 'Xuan',
+    'Xue1': 'Xuē',
+    'Xue2': 'Xué',
+    'Xue3': 'Xuě',
+    'Xue4': 'Xuè',
+    'Xue5': 'Xue',
+    'Xun1': 'Xūn',
+    'Xun2': 'Xún',
+    'Xun3': 'Xǔn',
+    'Xun4': 'Xùn',
+    'Xun5': 'Xun',
+    'Ya1': 'Yā',
+    'Ya2': 'Yá',
+    'Ya3': 'Yǎ',
+    'Ya4': 'Yà',
+    'Ya5': 'Ya',
+    'Yan1': 'Yān',
+    'Yan2': 'Yán',
+    'Yan3': 'Yǎn',
+    'Yan4': 'Yàn',
+    'Yan5': 'Yan',
+    'Yang1': 'Yāng',
+    'Yang2': 'Yáng',
+    'Yang3': 'Yǎng',
+    'Yang4': 'Yàng',
+    'Yang5': 'Yang',
+    'Yao1': 'Yāo',
+    'Yao2': 'Yáo',
+    'Yao3': 'Yǎo',
+    'Yao4': 'Yào',
+    'Yao5': 'Yao',
+    'Ye1': 'Yē',
+    'Ye2': 'Yé',
+    'Ye3': 'Yě',
+    'Ye4': 'Yè',
+    'Ye5': 'Ye',
+    'Yi1': 'Yī',
+    'Yi2': 'Yí',
+    'Yi3': 'Yǐ',
+    'Yi4': 'Yì',
+    'Yi5': 'Yi',
+    'Yin1': 'Yīn',
+    'Yin2': 'Yín',
+    'Yin3': 'Yǐn',
+    'Yin4': 'Yìn',
+    'Yin5': 'Yin',
+    'Ying1': 'Yīng',
+    'Ying2': 'Yíng',
+    'Ying3': 'Yǐng',
+    'Ying4': 'Yìng',
+    'Ying5': 'Ying',
+    'Yo1': 'Yō',
+    'Yo2': 'Yó',
+    'Yo3': 'Yǒ',
+    'Yo4': 'Yò',
+    'Yo5': 'Yo',
+    'Yong1': 'Yōng',
+    'Yong2': 'Yóng',
+    'Yong3': 'Yǒng',
+    'Yong4': 'Yòng',
+    'Yong5': 'Yong',
+    'You1': 'Yōu',
+    'You2': 'Yóu',
+    'You3': 'Yǒu',
+    'You4': 'Yòu',
+    'You5': 'You',
+    'Yu1': 'Yū',
+    'Yu2': 'Yú',
+    'Yu3': 'Yǔ',
+    'Yu4': 'Yù',
+    'Yu5': 'Yu',
+    'Yuan1': 'Yuān',
+    'Yuan2': 'Yuán',
+    'Yuan3': 'Yuǎn',
+    'Yuan4': 'Yuàn',
+    'Yuan5': 'Yuan',
+    'Yue1': 'Yuē',
+    'Yue2': 'Yué',
+    'Yue3': 'Yuě',
+    'Yue4': 'Yuè',
+    'Yue5': 'Yue',
+    'Yun1': 'Yūn',
+    'Yun2': 'Yún',
+    'Yun3': 'Yǔn',
+    'Yun4': 'Yùn',
+    'Yun5': 'Yun',
+    'Za1': 'Zā',
+    'Za2': 'Zá',
+    'Za3': 'Zǎ',
+    'Za4': 'Zà',
+    'Za5': 'Za',
+    'Zai1': 'Zāi',
+    'Zai2': 'Zái',
+    'Zai3': 'Zǎi',
+    'Zai4': 'Zài',
+    'Zai5': 'Zai',
+    'Zan1': 'Zān',
+    'Zan2': 'Zán',
+    'Zan3': 'Zǎn',
+    'Zan4': 'Zàn',
+    'Zan5': 'Zan',
+    'Zang1': 'Zāng',
+    'Zang2': 'Záng',
+    'Zang3': 'Zǎng',
+    'Zang4': 'Zàng',
+    'Zang5': 'Zang',
+    'Zao1': 'Zāo',
+    'Zao2': 'Záo',
+    'Zao3': 'Zǎo',
+    'Zao4': 'Zào',
+    'Zao5': 'Zao',
+    'Ze1': 'Zē',
+    'Ze2': 'Zé',
+    'Ze3': 'Zě',
+    'Ze4': 'Zè',
+    'Ze5': 'Ze',
+    'Zei1': 'Zēi',
+    'Zei2': 'Zéi',
+    'Zei3': 'Zěi',
+    'Zei4': 'Zèi',
+    'Zei5': 'Zei',
+    'Zen1': 'Zēn',
+    'Zen2': 'Zén',
+    'Zen3': 'Zěn',
+    'Zen4': 'Zèn',
+    'Zen5': 'Zen',
+    'Zeng1': 'Zēng',
+    'Zeng2': 'Zéng',
+    'Zeng3': 'Zěng',
+    'Zeng4': 'Zèng',
+    'Zeng5': 'Zeng',
+    'Zha1': 'Zhā',
+    'Zha2': 'Zhá',
+    'Zha3': 'Zhǎ',
+    'Zha4': 'Zhà',
+    'Zha5': 'Zha',
+    'Zhai1': 'Zhāi',
+    'Zhai2': 'Zhái',
+    'Zhai3': 'Zhǎi',
+    'Zhai4': 'Zhài',
+    'Zhai5': 'Zhai',
+    'Zhan1': 'Zhān',
+    'Zhan2': 'Zhán',
+    'Zhan3': 'Zhǎn',
+    'Zhan4': 'Zhàn',
+    'Zhan5': 'Zhan',
+    'Zhang1': 'Zhāng',
+    'Zhang2': 'Zháng',
+    'Zhang3': 'Zhǎng',
+    'Zhang4': 'Zhàng',
+    'Zhang5': 'Zhang',
+    'Zhao1': 'Zhāo',
+    'Zhao2': 'Zháo',
+    'Zhao3': 'Zhǎo',
+    'Zhao4': 'Zhào',
+    'Zhao5': 'Zhao',
+    'Zhe1': 'Zhē',
+    'Zhe2': 'Zhé',
+    'Zhe3': 'Zhě',
+    'Zhe4': 'Zhè',
+    'Zhe5': 'Zhe',
+    'Zhei1': 'Zhēi',
+    'Zhei2': 'Zhéi',
+    'Zhei3': 'Zhěi',
+    'Zhei4': 'Zhèi',
+    'Zhei5': 'Zhei',
+    'Zhen1': 'Zhēn',
+    'Zhen2': 'Zhén',
+    'Zhen3': 'Zhěn',
+    'Zhen4': 'Zhèn',
+    'Zhen5': 'Zhen',
+    'Zheng1': 'Zhēng',
+    'Zheng2': 'Zhéng',
+    'Zheng3': 'Zhěng',
+    'Zheng4': 'Zhèng',
+    'Zheng5': 'Zheng',
+    'Zhi1': 'Zhī',
+    'Zhi2': 'Zhí',
+    'Zhi3': 'Zhǐ',
+    'Zhi4': 'Zhì',
+    'Zhi5': 'Zhi',
+    'Zhong1': 'Zhōng',
+    'Zhong2': 'Zhóng',
+    'Zhong3': 'Zhǒng',
+    'Zhong4': 'Zhòng',
+    'Zhong5': 'Zhong',
+    'Zhou1': 'Zhōu',
+    'Zhou2': 'Zhóu',
+    'Zhou3': 'Zhǒu',
+    'Zhou4': 'Zhòu',
+    'Zhou5': 'Zhou',
+    'Zhu1': 'Zhū',
+    'Zhu2': 'Zhú',
+    'Zhu3': 'Zhǔ',
+    'Zhu4': 'Zhù',
+    'Zhu5': 'Zhu',
+    'Zhua1': 'Zhuā',
+    'Zhua2': 'Zhuá',
+    'Zhua3': 'Zhuǎ',
+    'Zhua4': 'Zhuà',
+    'Zhua5': 'Zhua',
+    'Zhuai1': 'Zhuāi',
+    'Zhuai2': 'Zhuái',
+    'Zhuai3': 'Zhuǎi',
+    'Zhuai4': 'Zhuài',
+    'Zhuai5': 'Zhuai',
+    'Zhuan1': 'Zhuān',
+    'Zhuan2': 'Zhuán',
+    'Zhuan3': 'Zhuǎn',
+    'Zhuan4': 'Zhuàn',
+    'Zhuan5': 'Zhuan',
+    'Zhuang1': 'Zhuāng',
+    'Zhuang2': 'Zhuáng',
+    'Zhuang3': 'Zhuǎng',
+    'Zhuang4': 'Zhuàng',
+    'Zhuang5': 'Zhuang',
+    'Zhui1': 'Zhuī',
+    'Zhui2': 'Zhuí',
+    'Zhui3': 'Zhuǐ',
+    'Zhui4': 'Zhuì',
+    'Zhui5': 'Zhui',
+    'Zhun1': 'Zhūn',
+    'Zhun2': 'Zhún',
+    'Zhun3': 'Zhǔn',
+    'Zhun4': 'Zhùn',
+    'Zhun5': 'Zhun',
+    'Zhuo1': 'Zhuō',
+    'Zhuo2': 'Zhuó',
+    'Zhuo3': 'Zhuǒ',
+    'Zhuo4': 'Zhuò',
+    'Zhuo5': 'Zhuo',
+    'Zi1': 'Zī',
+    'Zi2': 'Zí',
+    'Zi3': 'Zǐ',
+    'Zi4': 'Zì',
+    'Zi5': 'Zi',
+    'Zong1': 'Zōng',
+    'Zong2': 'Zóng',
+    'Zong3': 'Zǒng',
+    'Zong4': 'Zòng',
+    'Zong5': 'Zong',
+    'Zou1': 'Zōu',
+    'Zou2': 'Zóu',
+    'Zou3': 'Zǒu',
+    'Zou4': 'Zòu',
+    'Zou5': 'Zou',
+    'Zu1': 'Zū',
+    'Zu2': 'Zú',
+    'Zu3': 'Zǔ',
+    'Zu4': 'Zù',
+    'Zu5': 'Zu',
+    'Zuan1': 'Zuān',
+    'Zuan2': 'Zuán',
+    'Zuan3': 'Zuǎn',
+    'Zuan4': 'Zuàn',
+    'Zuan5': 'Zuan',
+    'Zui1': 'Zuī',
+    'Zui2': 'Zuí',
+    'Zui3': 'Zuǐ',
+    'Zui4': 'Zuì',
+    'Zui5': 'Zui',
+    'Zun1': 'Zūn',
+    'Zun2': 'Zún',
+    'Zun3': 'Zǔn',
+    'Zun4': 'Zùn',
+    'Zun5': 'Zun',
+    'Zuo1': 'Zuō',
+    'Zuo2': 'Zuó',
+    'Zuo3': 'Zuǒ',
+    'Zuo4': 'Zuò',
+    'Zuo5': 'Zuo',
+    'a1': 'ā',
+    'a2': 'á',
+    'a3': 'ǎ',
+    'a4': 'à',
+    'a5': 'a',
+    'ai1': 'āi',
+    'ai2': 'ái',
+    'ai3': 'ǎi',
+    'ai4': 'ài',
+    'ai5': 'ai',
+    'an1': 'ān',
+    'an2': 'án',
+    'an3': 'ǎn',
+    'an4': 'àn',
+    'an5': 'an',
+    'ang1': 'āng',
+    'ang2': 'áng',
+    'ang3': 'ǎng',
+    'ang4': 'àng',
+    'ang5': 'ang',
+    'ao1': 'āo',
+    'ao2': 'áo',
+    'ao3': 'ǎo',
+    'ao4': 'ào',
+    'ao5': 'ao',
+    'ba1': 'bā',
+    'ba2': 'bá',
+    'ba3': 'bǎ',
+    'ba4': 'bà',
+    'ba5': 'ba',
+    'bai1': 'bāi',
+    'bai2': 'bái',
+    'bai3': 'bǎi',
+    'bai4': 'bài',
+    'bai5': 'bai',
+    'ban1': 'bān',
+    'ban2': 'bán',
+    'ban3': 'bǎn',
+    'ban4': 'bàn',
+    'ban5': 'ban',
+    'bang1': 'bāng',
+    'bang2': 'báng',
+    'bang3': 'bǎng',
+    'bang4': 'bàng',
+    'bang5': 'bang',
+    'bao1': 'bāo',
+    'bao2': 'báo',
+    'bao3': 'bǎo',
+    'bao4': 'bào',
+    'bao5': 'bao',
+    'bei1': 'bēi',
+    'bei2': 'béi',
+    'bei3': 'běi',
+    'bei4': 'bèi',
+    'bei5': 'bei',
+    'ben1': 'bēn',
+    'ben2': 'bén',
+    'ben3': 'běn',
+    'ben4': 'bèn',
+    'ben5': 'ben',
+    'beng1': 'bēng',
+    'beng2': 'béng',
+    'beng3': 'běng',
+    'beng4': 'bèng',
+    'beng5': 'beng',
+    'bi1': 'bī',
+    'bi2': 'bí',
+    'bi3': 'bǐ',
+    'bi4': 'bì',
+    'bi5': 'bi',
+    'bian1': 'biān',
+    'bian2': 'bián',
+    'bian3': 'biǎn',
+    'bian4': 'biàn',
+    'bian5': 'bian',
+    'biao1': 'biāo',
+    'biao2': 'biáo',
+    'biao3': 'biǎo',
+    'biao4': 'biào',
+    'biao5': 'biao',
+    'bie1': 'biē',
+    'bie2': 'bié',
+    'bie3': 'biě',
+    'bie4': 'biè',
+    'bie5': 'bie',
+    'bin1': 'bīn',
+    'bin2': 'bín',
+    'bin3': 'bǐn',
+    'bin4': 'bìn',
+    'bin5': 'bin',
+    'bing1': 'bīng',
+    'bing2': 'bíng',
+    'bing3': 'bǐng',
+    'bing4': 'bìng',
+    'bing5': 'bing',
+    'bo1': 'bō',
+    'bo2': 'bó',
+    'bo3': 'bǒ',
+    'bo4': 'bò',
+    'bo5': 'bo',
+    'bu1': 'bū',
+    'bu2': 'bú',
+    'bu3': 'bǔ',
+    'bu4': 'bù',
+    'bu5': 'bu',
+    'ca1': 'cā',
+    'ca2': 'cá',
+    'ca3': 'cǎ',
+    'ca4': 'cà',
+    'ca5': 'ca',
+    'cai1': 'cāi',
+    'cai2': 'cái',
+    'cai3': 'cǎi',
+    'cai4': 'cài',
+    'cai5': 'cai',
+    'can1': 'cān',
+    'can2': 'cán',
+    'can3': 'cǎn',
+    'can4': 'càn',
+    'can5': 'can',
+    'cang1': 'cāng',
+    'cang2': 'cáng',
+    'cang3': 'cǎng',
+    'cang4': 'càng',
+    'cang5': 'cang',
+    'cao1': 'cāo',
+    'cao2': 'cáo',
+    'cao3': 'cǎo',
+    'cao4': 'cào',
+    'cao5': 'cao',
+    'ce1': 'cē',
+    'ce2': 'cé',
+    'ce3': 'cě',
+    'ce4': 'cè',
+    'ce5': 'ce',
+    'cen1': 'cēn',
+    'cen2': 'cén',
+    'cen3': 'cěn',
+    'cen4': 'cèn',
+    'cen5': 'cen',
+    'ceng1': 'cēng',
+    'ceng2': 'céng',
+    'ceng3': 'cěng',
+    'ceng4': 'cèng',
+    'ceng5': 'ceng',
+    'cha1': 'chā',
+    'cha2': 'chá',
+    'cha3': 'chǎ',
+    'cha4': 'chà',
+    'cha5': 'cha',
+    'chai1': 'chāi',
+    'chai2': 'chái',
+    'chai3': 'chǎi',
+    'chai4': 'chài',
+    'chai5': 'chai',
+    'chan1': 'chān',
+    'chan2': 'chán',
+    'chan3': 'chǎn',
+    'chan4': 'chàn',
+    'chan5': 'chan',
+    'chang1': 'chāng',
+    'chang2': 'cháng',
+    'chang3': 'chǎng',
+    'chang4': 'chàng',
+    'chang5': 'chang',
+    'chao1': 'chāo',
+    'chao2': 'cháo',
+    'chao3': 'chǎo',
+    'chao4': 'chào',
+    'chao5': 'chao',
+    'che1': 'chē',
+    'che2': 'ché',
+    'che3': 'chě',
+    'che4': 'chè',
+    'che5': 'che',
+    'chen1': 'chēn',
+    'chen2': 'chén',
+    'chen3': 'chěn',
+    'chen4': 'chèn',
+    'chen5': 'chen',
+    'cheng1': 'chēng',
+    'cheng2': 'chéng',
+    'cheng3': 'chěng',
+    'cheng4': 'chèng',
+    'cheng5': 'cheng',
+    'chi1': 'chī',
+    'chi2': 'chí',
+    'chi3': 'chǐ',
+    'chi4': 'chì',
+    'chi5': 'chi',
+    'chong1': 'chōng',
+    'chong2': 'chóng',
+    'chong3': 'chǒng',
+    'chong4': 'chòng',
+    'chong5': 'chong',
+    'chou1': 'chōu',
+    'chou2': 'chóu',
+    'chou3': 'chǒu',
+    'chou4': 'chòu',
+    'chou5': 'chou',
+    'chu1': 'chū',
+    'chu2': 'chú',
+    'chu3': 'chǔ',
+    'chu4': 'chù',
+    'chu5': 'chu',
+    'chua1': 'chuā',
+    'chua2': 'chuá',
+    'chua3': 'chuǎ',
+    'chua4': 'chuà',
+    'chua5': 'chua',
+    'chuai1': 'chuāi',
+    'chuai2': 'chuái',
+    'chuai3': 'chuǎi',
+    'chuai4': 'chuài',
+    'chuai5': 'chuai',
+    'chuan1': 'chuān',
+    'chuan2': 'chuán',
+    'chuan3': 'chuǎn',
+    'chuan4': 'chuàn',
+    'chuan5': 'chuan',
+    'chuang1': 'chuāng',
+    'chuang2': 'chuáng',
+    'chuang3': 'chuǎng',
+    'chuang4': 'chuàng',
+    'chuang5': 'chuang',
+    'chui1': 'chuī',
+    'chui2': 'chuí',
+    'chui3': 'chuǐ',
+    'chui4': 'chuì',
+    'chui5': 'chui',
+    'chun1': 'chūn',
+    'chun2': 'chún',
+    'chun3': 'chǔn',
+    'chun4': 'chùn',
+    'chun5': 'chun',
+    'chuo1': 'chuō',
+    'chuo2': 'chuó',
+    'chuo3': 'chuǒ',
+    'chuo4': 'chuò',
+    'chuo5': 'chuo',
+    'ci1': 'cī',
+    'ci2': 'cí',
+    'ci3': 'cǐ',
+    'ci4': 'cì',
+    'ci5': 'ci',
+    'cong1': 'cōng',
+    'cong2': 'cóng',
+    'cong3': 'cǒng',
+    'cong4': 'còng',
+    'cong5': 'cong',
+    'cou1': 'cōu',
+    'cou2': 'cóu',
+    'cou3': 'cǒu',
+    'cou4': 'còu',
+    'cou5': 'cou',
+    'cu1': 'cū',
+    'cu2': 'cú',
+    'cu3': 'cǔ',
+    'cu4': 'cù',
+    'cu5': 'cu',
+    'cuan1': 'cuān',
+    'cuan2': 'cuán',
+    'cuan3': 'cuǎn',
+    'cuan4': 'cuàn',
+    'cuan5': 'cuan',
+    'cui1': 'cuī',
+    'cui2': 'cuí',
+    'cui3': 'cuǐ',
+    'cui4': 'cuì',
+    'cui5': 'cui',
+    'cun1': 'cūn',
+    'cun2': 'cún',
+    'cun3': 'cǔn',
+    'cun4': 'cùn',
+    'cun5': 'cun',
+    'cuo1': 'cuō',
+    'cuo2': 'cuó',
+    'cuo3': 'cuǒ',
+    'cuo4': 'cuò',
+    'cuo5': 'cuo',
+    'da1': 'dā',
+    'da2': 'dá',
+    'da3': 'dǎ',
+    'da4': 'dà',
+    'da5': 'da',
+    'dai1': 'dāi',
+    'dai2': 'dái',
+    'dai3': 'dǎi',
+    'dai4': 'dài',
+    'dai5': 'dai',
+    'dan1': 'dān',
+    'dan2': 'dán',
+    'dan3': 'dǎn',
+    'dan4': 'dàn',
+    'dan5': 'dan',
+    'dang1': 'dāng',
+    'dang2': 'dáng',
+    'dang3': 'dǎng',
+    'dang4': 'dàng',
+    'dang5': 'dang',
+    'dao1': 'dāo',
+    'dao2': 'dáo',
+    'dao3': 'dǎo',
+    'dao4': 'dào',
+    'dao5': 'dao',
+    'de1': 'dē',
+    'de2': 'dé',
+    'de3': 'dě',
+    'de4': 'dè',
+    'de5': 'de',
+    'dei1': 'dēi',
+    'dei2': 'déi',
+    'dei3': 'děi',
+    'dei4': 'dèi',
+    'dei5': 'dei',
+    'den1': 'dēn',
+    'den2': 'dén',
+    'den3': 'děn',
+    'den4': 'dèn',
+    'den5': 'den',
+    'deng1': 'dēng',
+    'deng2': 'déng',
+    'deng3': 'děng',
+    'deng4': 'dèng',
+    'deng5': 'deng',
+    'di1': 'dī',
+    'di2': 'dí',
+    'di3': 'dǐ',
+    'di4': 'dì',
+    'di5': 'di',
+    'dia1': 'diā',
+    'dia2': 'diá',
+    'dia3': 'diǎ',
+    'dia4': 'dià',
+    'dia5': 'dia',
+    'dian1': 'diān',
+    'dian2': 'dián',
+    'dian3': 'diǎn',
+    'dian4': 'diàn',
+    'dian5': 'dian',
+    'diao1': 'diāo',
+    'diao2': 'diáo',
+    'diao3': 'diǎo',
+    'diao4': 'diào',
+    'diao5': 'diao',
+    'die1': 'diē',
+    'die2': 'dié',
+    'die3': 'diě',
+    'die4': 'diè',
+    'die5': 'die',
+    'ding1': 'dīng',
+    'ding2': 'díng',
+    'ding3': 'dǐng',
+    'ding4': 'dìng',
+    'ding5': 'ding',
+    'diu1': 'diū',
+    'diu2': 'diú',
+    'diu3': 'diǔ',
+    'diu4': 'diù',
+    'diu5': 'diu',
+    'dong1': 'dōng',
+    'dong2': 'dóng',
+    'dong3': 'dǒng',
+    'dong4': 'dòng',
+    'dong5': 'dong',
+    'dou1': 'dōu',
+    'dou2': 'dóu',
+    'dou3': 'dǒu',
+    'dou4': 'dòu',
+    'dou5': 'dou',
+    'du1': 'dū',
+    'du2': 'dú',
+    'du3': 'dǔ',
+    'du4': 'dù',
+    'du5': 'du',
+    'duan1': 'duān',
+    'duan2': 'duán',
+    'duan3': 'duǎn',
+    'duan4': 'duàn',
+    'duan5': 'duan',
+    'dui1': 'duī',
+    'dui2': 'duí',
+    'dui3': 'duǐ',
+    'dui4': 'duì',
+    'dui5': 'dui',
+    'dun1': 'dūn',
+    'dun2': 'dún',
+    'dun3': 'dǔn',
+    'dun4': 'dùn',
+    'dun5': 'dun',
+    'duo1': 'duō',
+    'duo2': 'duó',
+    'duo3': 'duǒ',
+    'duo4': 'duò',
+    'duo5': 'duo',
+    'e1': 'ē',
+    'e2': 'é',
+    'e3': 'ě',
+    'e4': 'è',
+    'e5': 'e',
+    'ei1': 'ēi',
+    'ei2': 'éi',
+    'ei3': 'ěi',
+    'ei4': 'èi',
+    'ei5': 'ei',
+    'en1': 'ēn',
+    'en2': 'én',
+    'en3': 'ěn',
+    'en4': 'èn',
+    'en5': 'en',
+    'eng1': 'ēng',
+    'eng2': 'éng',
+    'eng3': 'ěng',
+    'eng4': 'èng',
+    'eng5': 'eng',
+    'er1': 'ēr',
+    'er2': 'ér',
+    'er3': 'ěr',
+    'er4': 'èr',
+    'er5': 'er',
+    'fa1': 'fā',
+    'fa2': 'fá',
+    'fa3': 'fǎ',
+    'fa4': 'fà',
+    'fa5': 'fa',
+    'fan1': 'fān',
+    'fan2': 'fán',
+    'fan3': 'fǎn',
+    'fan4': 'fàn',
+    'fan5': 'fan',
+    'fang1': 'fāng',
+    'fang2': 'fáng',
+    'fang3': 'fǎng',
+    'fang4': 'fàng',
+    'fang5': 'fang',
+    'fei1': 'fēi',
+    'fei2': 'féi',
+    'fei3': 'fěi',
+    'fei4': 'fèi',
+    'fei5': 'fei',
+    'fen1': 'fēn',
+    'fen2': 'fén',
+    'fen3': 'fěn',
+    'fen4': 'fèn',
+    'fen5': 'fen',
+    'feng1': 'fēng',
+    'feng2': 'féng',
+    'feng3': 'fěng',
+    'feng4': 'fèng',
+    'feng5': 'feng',
+    'fo1': 'fō',
+    'fo2': 'fó',
+    'fo3': 'fǒ',
+    'fo4': 'fò',
+    'fo5': 'fo',
+    'fou1': 'fōu',
+    'fou2': 'fóu',
+    'fou3': 'fǒu',
+    'fou4': 'fòu',
+    'fou5': 'fou',
+    'fu1': 'fū',
+    'fu2': 'fú',
+    'fu3': 'fǔ',
+    'fu4': 'fù',
+    'fu5': 'fu',
+    'ga1': 'gā',
+    'ga2': 'gá',
+    'ga3': 'gǎ',
+    'ga4': 'gà',
+    'ga5': 'ga',
+    'gai1': 'gāi',
+    'gai2': 'gái',
+    'gai3': 'gǎi',
+    'gai4': 'gài',
+    'gai5': 'gai',
+    'gan1': 'gān',
+    'gan2': 'gán',
+    'gan3': 'gǎn',
+    'gan4': 'gàn',
+    'gan5': 'gan',
+    'gang1': 'gāng',
+    'gang2': 'gáng',
+    'gang3': 'gǎng',
+    'gang4': 'gàng',
+    'gang5': 'gang',
+    'gao1': 'gāo',
+    'gao2': 'gáo',
+    'gao3': 'gǎo',
+    'gao4': 'gào',
+    'gao5': 'gao',
+    'ge1': 'gē',
+    'ge2': 'gé',
+    'ge3': 'gě',
+    'ge4': 'gè',
+    'ge5': 'ge',
+    'gei1': 'gēi',
+    'gei2': 'géi',
+    'gei3': 'gěi',
+    'gei4': 'gèi',
+    'gei5': 'gei',
+    'gen1': 'gēn',
+    'gen2': 'gén',
+    'gen3': 'gěn',
+    'gen4': 'gèn',
+    'gen5': 'gen',
+    'geng1': 'gēng',
+    'geng2': 'géng',
+    'geng3': 'gěng',
+    'geng4': 'gèng',
+    'geng5': 'geng',
+    'gong1': 'gōng',
+    'gong2': 'góng',
+    'gong3': 'gǒng',
+    'gong4': 'gòng',
+    'gong5': 'gong',
+    'gou1': 'gōu',
+    'gou2': 'góu',
+    'gou3': 'gǒu',
+    'gou4': 'gòu',
+    'gou5': 'gou',
+    'gu1': 'gū',
+    'gu2': 'gú',
+    'gu3': 'gǔ',
+    'gu4': 'gù',
+    'gu5': 'gu',
+    'gua1': 'guā',
+    'gua2': 'guá',
+    'gua3': 'guǎ',
+    'gua4': 'guà',
+    'gua5': 'gua',
+    'guai1': 'guāi',
+    'guai2': 'guái',
+    'guai3': 'guǎi',
+    'guai4': 'guài',
+    'guai5': 'guai',
+    'guan1': 'guān',
+    'guan2': 'guán',
+    'guan3': 'guǎn',
+    'guan4': 'guàn',
+    'guan5': 'guan',
+    'guang1': 'guāng',
+    'guang2': 'guáng',
+    'guang3': 'guǎng',
+    'guang4': 'guàng',
+    'guang5': 'guang',
+    'gui1': 'guī',
+    'gui2': 'guí',
+    'gui3': 'guǐ',
+    'gui4': 'guì',
+    'gui5': 'gui',
+    'gun1': 'gūn',
+    'gun2': 'gún',
+    'gun3': 'gǔn',
+    'gun4': 'gùn',
+    'gun5': 'gun',
+    'guo1': 'guō',
+    'guo2': 'guó',
+    'guo3': 'guǒ',
+    'guo4': 'guò',
+    'guo5': 'guo',
+    'ha1': 'hā',
+    'ha2': 'há',
+    'ha3': 'hǎ',
+    'ha4': 'hà',
+    'ha5': 'ha',
+    'hai1': 'hāi',
+    'hai2': 'hái',
+    'hai3': 'hǎi',
+    'hai4': 'hài',
+    'hai5': 'hai',
+    'han1': 'hān',
+    'han2': 'hán',
+    'han3': 'hǎn',
+    'han4': 'hàn',
+    'han5': 'han',
+    'hang1': 'hāng',
+    'hang2': 'háng',
+    'hang3': 'hǎng',
+    'hang4': 'hàng',
+    'hang5': 'hang',
+    'hao1': 'hāo',
+    'hao2': 'háo',
+    'hao3': 'hǎo',
+    'hao4': 'hào',
+    'hao5': 'hao',
+    'he1': 'hē',
+    'he2': 'hé',
+    'he3': 'hě',
+    'he4': 'hè',
+    'he5': 'he',
+    'hei1': 'hēi',
+    'hei2': 'héi',
+    'hei3': 'hěi',
+    'hei4': 'hèi',
+    'hei5': 'hei',
+    'hen1': 'hēn',
+    'hen2': 'hén',
+    'hen3': 'hěn',
+    'hen4': 'hèn',
+    'hen5': 'hen',
+    'heng1': 'hēng',
+    'heng2': 'héng',
+    'heng3': 'hěng',
+    'heng4': 'hèng',
+    'heng5': 'heng',
+    'hong1': 'hōng',
+    'hong2': 'hóng',
+    'hong3': 'hǒng',
+    'hong4': 'hòng',
+    'hong5': 'hong',
+    'hou1': 'hōu',
+    'hou2': 'hóu',
+    'hou3': 'hǒu',
+    'hou4': 'hòu',
+    'hou5': 'hou',
+    'hu1': 'hū',
+    'hu2': 'hú',
+    'hu3': 'hǔ',
+    'hu4': 'hù',
+    'hu5': 'hu',
+    'hua1': 'huā',
+    'hua2': 'huá',
+    'hua3': 'huǎ',
+    'hua4': 'huà',
+    'hua5': 'hua',
+    'huai1': 'huāi',
+    'huai2': 'huái',
+    'huai3': 'huǎi',
+    'huai4': 'huài',
+    'huai5': 'huai',
+    'huan1': 'huān',
+    'huan2': 'huán',
+    'huan3': 'huǎn',
+    'huan4': 'huàn',
+    'huan5': 'huan',
+    'huang1': 'huāng',
+    'huang2': 'huáng',
+    'huang3': 'huǎng',
+    'huang4': 'huàng',
+    'huang5': 'huang',
+    'hui1': 'huī',
+    'hui2': 'huí',
+    'hui3': 'huǐ',
+    'hui4': 'huì',
+    'hui5': 'hui',
+    'hun1': 'hūn',
+    'hun2': 'hún',
+    'hun3': 'hǔn',
+    'hun4': 'hùn',
+    'hun5': 'hun',
+    'huo1': 'huō',
+    'huo2': 'huó',
+    'huo3': 'huǒ',
+    'huo4': 'huò',
+    'huo5': 'huo',
+    'ji1': 'jī',
+    'ji2': 'jí',
+    'ji3': 'jǐ',
+    'ji4': 'jì',
+    'ji5': 'ji',
+    'jia1': 'jiā',
+    'jia2': 'jiá',
+    'jia3': 'jiǎ',
+    'jia4': 'jià',
+    'jia5': 'jia',
+    'jian1': 'jiān',
+    'jian2': 'jián',
+    'jian3': 'jiǎn',
+    'jian4': 'jiàn',
+    'jian5': 'jian',
+    'jiang1': 'jiāng',
+    'jiang2': 'jiáng',
+    'jiang3': 'jiǎng',
+    'jiang4': 'jiàng',
+    'jiang5': 'jiang',
+    'jiao1': 'jiāo',
+    'jiao2': 'jiáo',
+    'jiao3': 'jiǎo',
+    'jiao4': 'jiào',
+    'jiao5': 'jiao',
+    'jie1': 'jiē',
+    'jie2': 'jié',
+    'jie3': 'jiě',
+    'jie4': 'jiè',
+    'jie5': 'jie',
+    'jin1': 'jīn',
+    'jin2': 'jín',
+    'jin3': 'jǐn',
+    'jin4': 'jìn',
+    'jin5': 'jin',
+    'jing1': 'jīng',
+    'jing2': 'jíng',
+    'jing3': 'jǐng',
+    'jing4': 'jìng',
+    'jing5': 'jing',
+    'jiong1': 'jiōng',
+    'jiong2': 'jióng',
+    'jiong3': 'jiǒng',
+    'jiong4': 'jiòng',
+    'jiong5': 'jiong',
+    'jiu1': 'jiū',
+    'jiu2': 'jiú',
+    'jiu3': 'jiǔ',
+    'jiu4': 'jiù',
+    'jiu5': 'jiu',
+    'ju1': 'jū',
+    'ju2': 'jú',
+    'ju3': 'jǔ',
+    'ju4': 'jù',
+    'ju5': 'ju',
+    'juan1': 'juān',
+    'juan2': 'juán',
+    'juan3': 'juǎn',
+    'juan4': 'juàn',
+    'juan5': 'juan',
+    'jue1': 'juē',
+    'jue2': 'jué',
+    'jue3': 'juě',
+    'jue4': 'juè',
+    'jue5': 'jue',
+    'jun1': 'jūn',
+    'jun2': 'jún',
+    'jun3': 'jǔn',
+    'jun4': 'jùn',
+    'jun5': 'jun',
+    'ka1': 'kā',
+    'ka2': 'ká',
+    'ka3': 'kǎ',
+    'ka4': 'kà',
+    'ka5': 'ka',
+    'kai1': 'kāi',
+    'kai2': 'kái',
+    'kai3': 'kǎi',
+    'kai4': 'kài',
+    'kai5': 'kai',
+    'kan1': 'kān',
+    'kan2': 'kán',
+    'kan3': 'kǎn',
+    'kan4': 'kàn',
+    'kan5': 'kan',
+    'kang1': 'kāng',
+    'kang2': 'káng',
+    'kang3': 'kǎng',
+    'kang4': 'kàng',
+    'kang5': 'kang',
+    'kao1': 'kāo',
+    'kao2': 'káo',
+    'kao3': 'kǎo',
+    'kao4': 'kào',
+    'kao5': 'kao',
+    'ke1': 'kē',
+    'ke2': 'ké',
+    'ke3': 'kě',
+    'ke4': 'kè',
+    'ke5': 'ke',
+    'kei1': 'kēi',
+    'kei2': 'kéi',
+    'kei3': 'kěi',
+    'kei4': 'kèi',
+    'kei5': 'kei',
+    'ken1': 'kēn',
+    'ken2': 'kén',
+    'ken3': 'kěn',
+    'ken4': 'kèn',
+    'ken5': 'ken',
+    'keng1': 'kēng',
+    'keng2': 'kéng',
+    'keng3': 'kěng',
+    'keng4': 'kèng',
+    'keng5': 'keng',
+    'kong1': 'kōng',
+    'kong2': 'kóng',
+    'kong3': 'kǒng',
+    'kong4': 'kòng',
+    'kong5': 'kong',
+    'kou1': 'kōu',
+    'kou2': 'kóu',
+    'kou3': 'kǒu',
+    'kou4': 'kòu',
+    'kou5': 'kou',
+    'ku1': 'kū',
+    'ku2': 'kú',
+    'ku3': 'kǔ',
+    'ku4': 'kù',
+    'ku5': 'ku',
+    'kua1': 'kuā',
+    'kua2': 'kuá',
+    'kua3': 'kuǎ',
+    'kua4': 'kuà',
+    'kua5': 'kua',
+    'kuai1': 'kuāi',
+    'kuai2': 'kuái',
+    'kuai3': 'kuǎi',
+    'kuai4': 'kuài',
+    'kuai5': 'kuai',
+    'kuan1': 'kuān',
+    'kuan2': 'kuán',
+    'kuan3': 'kuǎn',
+    'kuan4': 'kuàn',
+    'kuan5': 'kuan',
+    'kuang1': 'kuāng',
+    'kuang2': 'kuáng',
+    'kuang3': 'kuǎng',
+    'kuang4': 'kuàng',
+    'kuang5': 'kuang',
+    'kui1': 'kuī',
+    'kui2': 'kuí',
+    'kui3': 'kuǐ',
+    'kui4': 'kuì',
+    'kui5': 'kui',
+    'kun1': 'kūn',
+    'kun2': 'kún',
+    'kun3': 'kǔn',
+    'kun4': 'kùn',
+    'kun5': 'kun',
+    'kuo1': 'kuō',
+    'kuo2': 'kuó',
+    'kuo3': 'kuǒ',
+    'kuo4': 'kuò',
+    'kuo5': 'kuo',
+    'la1': 'lā',
+    'la2': 'lá',
+    'la3': 'lǎ',
+    'la4': 'là',
+    'la5': 'la',
+    'lai1': 'lāi',
+    'lai2': 'lái',
+    'lai3': 'lǎi',
+    'lai4': 'lài',
+    'lai5': 'lai',
+    'lan1': 'lān',
+    'lan2': 'lán',
+    'lan3': 'lǎn',
+    'lan4': 'làn',
+    'lan5': 'lan',
+    'lang1': 'lāng',
+    'lang2': 'láng',
+    'lang3': 'lǎng',
+    'lang4': 'làng',
+    'lang5': 'lang',
+    'lao1': 'lāo',
+    'lao2': 'láo',
+    'lao3': 'lǎo',
+    'lao4': 'lào',
+    'lao5': 'lao',
+    'le1': 'lē',
+    'le2': 'lé',
+    'le3': 'lě',
+    'le4': 'lè',
+    'le5': 'le',
+    'lei1': 'lēi',
+    'lei2': 'léi',
+    'lei3': 'lěi',
+    'lei4': 'lèi',
+    'lei5': 'lei',
+    'leng1': 'lēng',
+    'leng2': 'léng',
+    'leng3': 'lěng',
+    'leng4': 'lèng',
+    'leng5': 'leng',
+    'li1': 'lī',
+    'li2': 'lí',
+    'li3': 'lǐ',
+    'li4': 'lì',
+    'li5': 'li',
+    'lia1': 'liā',
+    'lia2': 'liá',
+    'lia3': 'liǎ',
+    'lia4': 'lià',
+    'lia5': 'lia',
+    'lian1': 'liān',
+    'lian2': 'lián',
+    'lian3': 'liǎn',
+    'lian4': 'liàn',
+    'lian5': 'lian',
+    'liang1': 'liāng',
+    'liang2': 'liáng',
+    'liang3': 'liǎng',
+    'liang4': 'liàng',
+    'liang5': 'liang',
+    'liao1': 'liāo',
+    'liao2': 'liáo',
+    'liao3': 'liǎo',
+    'liao4': 'liào',
+    'liao5': 'liao',
+    'lie1': 'liē',
+    'lie2': 'lié',
+    'lie3': 'liě',
+    'lie4': 'liè',
+    'lie5': 'lie',
+    'lin1': 'līn',
+    'lin2': 'lín',
+    'lin3': 'lǐn',
+    'lin4': 'lìn',
+    'lin5': 'lin',
+    'ling1': 'līng',
+    'ling2': 'líng',
+    'ling3': 'lǐng',
+    'ling4': 'lìng',
+    'ling5': 'ling',
+    'liu1': 'liū',
+    'liu2': 'liú',
+    'liu3': 'liǔ',
+    'liu4': 'liù',
+    'liu5': 'liu',
+    'lo1': 'lō',
+    'lo2': 'ló',
+    'lo3': 'lǒ',
+    'lo4': 'lò',
+    'lo5': 'lo',
+    'long1': 'lōng',
+    'long2': 'lóng',
+    'long3': 'lǒng',
+    'long4': 'lòng',
+    'long5': 'long',
+    'lou1': 'lōu',
+    'lou2': 'lóu',
+    'lou3': 'lǒu',
+    'lou4': 'lòu',
+    'lou5': 'lou',
+    'lu1': 'lū',
+    'lu2': 'lú',
+    'lu3': 'lǔ',
+    'lu4': 'lù',
+    'lu5': 'lu',
+    'lu:1': 'lǖ',
+    'lu:2': 'lǘ',
+    'lu:3': 'lǚ',
+    'lu:4': 'lǜ',
+    'lu:5': 'lü',
+    'lu:e1': 'lüē',
+    'lu:e2': 'lüé',
+    'lu:e3': 'lüě',
+    'lu:e4': 'lüè',
+    'lu:e5': 'lüe',
+    'luan1': 'luān',
+    'luan2': 'luán',
+    'luan3': 'luǎn',
+    'luan4': 'luàn',
+    'luan5': 'luan',
+    'lun1': 'lūn',
+    'lun2': 'lún',
+    'lun3': 'lǔn',
+    'lun4': 'lùn',
+    'lun5': 'lun',
+    'luo1': 'luō',
+    'luo2': 'luó',
+    'luo3': 'luǒ',
+    'luo4': 'luò',
+    'luo5': 'luo',
+    'lv1': 'lǖ',
+    'lv2': 'lǘ',
+    'lv3': 'lǚ',
+    'lv4': 'lǜ',
+    'lv5': 'lü',
+    'lve1': 'lüē',
+    'lve2': 'lüé',
+    'lve3': 'lüě',
+    'lve4': 'lüè',
+    'lve5': 'lüe',
+    'lü1': 'lǖ',
+    'lü2': 'lǘ',
+    'lü3': 'lǚ',
+    'lü4': 'lǜ',
+    'lü5': 'lü',
+    'lüe1': 'lüē',
+    'lüe2': 'lüé',
+    'lüe3': 'lüě',
+    'lüe4': 'lüè',
+    'lüe5': 'lüe',
+    'ma1': 'mā',
+    'ma2': 'má',
+    'ma3': 'mǎ',
+    'ma4': 'mà',
+    'ma5': 'ma',
+    'mai1': 'māi',
+    'mai2': 'mái',
+    'mai3': 'mǎi',
+    'mai4': 'mài',
+    'mai5': 'mai',
+    'man1': 'mān',
+    'man2': 'mán',
+    'man3': 'mǎn',
+    'man4': 'màn',
+    'man5': 'man',
+    'mang1': 'māng',
+    'mang2': 'máng',
+    'mang3': 'mǎng',
+    'mang4': 'màng',
+    'mang5': 'mang',
+    'mao1': 'māo',
+    'mao2': 'máo',
+    'mao3': 'mǎo',
+    'mao4': 'mào',
+    'mao5': 'mao',
+    'me1': 'mē',
+    'me2': 'mé',
+    'me3': 'mě',
+    'me4': 'mè',
+    'me5': 'me',
+    'mei1': 'mēi',
+    'mei2': 'méi',
+    'mei3': 'měi',
+    'mei4': 'mèi',
+    'mei5': 'mei',
+    'men1': 'mēn',
+    'men2': 'mén',
+    'men3': 'měn',
+    'men4': 'mèn',
+    'men5': 'men',
+    'meng1': 'mēng',
+    'meng2': 'méng',
+    'meng3': 'měng',
+    'meng4': 'mèng',
+    'meng5': 'meng',
+    'mi1': 'mī',
+    'mi2': 'mí',
+    'mi3': 'mǐ',
+    'mi4': 'mì',
+    'mi5': 'mi',
+    'mian1': 'miān',
+    'mian2': 'mián',
+    'mian3': 'miǎn',
+    'mian4': 'miàn',
+    'mian5': 'mian',
+    'miao1': 'miāo',
+    'miao2': 'miáo',
+    'miao3': 'miǎo',
+    'miao4': 'miào',
+    'miao5': 'miao',
+    'mie1': 'miē',
+    'mie2': 'mié',
+    'mie3': 'miě',
+    'mie4': 'miè',
+    'mie5': 'mie',
+    'min1': 'mīn',
+    'min2': 'mín',
+    'min3': 'mǐn',
+    'min4': 'mìn',
+    'min5': 'min',
+    'ming1': 'mīng',
+    'ming2': 'míng',
+    'ming3': 'mǐng',
+    'ming4': 'mìng',
+    'ming5': 'ming',
+    'miu1': 'miū',
+    'miu2': 'miú',
+    'miu3': 'miǔ',
+    'miu4': 'miù',
+    'miu5': 'miu',
+    'mo1': 'mō',
+    'mo2': 'mó',
+    'mo3': 'mǒ',
+    'mo4': 'mò',
+    'mo5': 'mo',
+    'mou1': 'mōu',
+    'mou2': 'móu',
+    'mou3': 'mǒu',
+    'mou4': 'mòu',
+    'mou5': 'mou',
+    'mu1': 'mū',
+    'mu2': 'mú',
+    'mu3': 'mǔ',
+    'mu4': 'mù',
+    'mu5': 'mu',
+    'na1': 'nā',
+    'na2': 'ná',
+    'na3': 'nǎ',
+    'na4': 'nà',
+    'na5': 'na',
+    'nai1': 'nāi',
+    'nai2': 'nái',
+    'nai3': 'nǎi',
+    'nai4': 'nài',
+    'nai5': 'nai',
+    'nan1': 'nān',
+    'nan2': 'nán',
+    'nan3': 'nǎn',
+    'nan4': 'nàn',
+    'nan5': 'nan',
+    'nang1': 'nāng',
+    'nang2': 'náng',
+    'nang3': 'nǎng',
+    'nang4': 'nàng',
+    'nang5': 'nang',
+    'nao1': 'nāo',
+    'nao2': 'náo',
+    'nao3': 'nǎo',
+    'nao4': 'nào',
+    'nao5': 'nao',
+    'ne1': 'nē',
+    'ne2': 'né',
+    'ne3': 'ně',
+    'ne4': 'nè',
+    'ne5': 'ne',
+    'nei1': 'nēi',
+    'nei2': 'néi',
+    'nei3': 'něi',
+    'nei4': 'nèi',
+    'nei5': 'nei',
+    'nen1': 'nēn',
+    'nen2': 'nén',
+    'nen3': 'něn',
+    'nen4': 'nèn',
+    'nen5': 'nen',
+    'neng1': 'nēng',
+    'neng2': 'néng',
+    'neng3': 'něng',
+    'neng4': 'nèng',
+    'neng5': 'neng',
+    'ni1': 'nī',
+    'ni2': 'ní',
+    'ni3': 'nǐ',
+    'ni4': 'nì',
+    'ni5': 'ni',
+    'nian1': 'niān',
+    'nian2': 'nián',
+    'nian3': 'niǎn',
+    'nian4': 'niàn',
+    'nian5': 'nian',
+    'niang1': 'niāng',
+    'niang2': 'niáng',
+    'niang3': 'niǎng',
+    'niang4': 'niàng',
+    'niang5': 'niang',
+    'niao1': 'niāo',
+    'niao2': 'niáo',
+    'niao3': 'niǎo',
+    'niao4': 'niào',
+    'niao5': 'niao',
+    'nie1': 'niē',
+    'nie2': 'nié',
+    'nie3': 'niě',
+    'nie4': 'niè',
+    'nie5': 'nie',
+    'nin1': 'nīn',
+    'nin2': 'nín',
+    'nin3': 'nǐn',
+    'nin4': 'nìn',
+    'nin5': 'nin',
+    'ning1': 'nīng',
+    'ning2': 'níng',
+    'ning3': 'nǐng',
+    'ning4': 'nìng',
+    'ning5': 'ning',
+    'niu1': 'niū',
+    'niu2': 'niú',
+    'niu3': 'niǔ',
+    'niu4': 'niù',
+    'niu5': 'niu',
+    'nong1': 'nōng',
+    'nong2': 'nóng',
+    'nong3': 'nǒng',
+    'nong4': 'nòng',
+    'nong5': 'nong',
+    'nou1': 'nōu',
+    'nou2': 'nóu',
+    'nou3': 'nǒu',
+    'nou4': 'nòu',
+    'nou5': 'nou',
+    'nu1': 'nū',
+    'nu2': 'nú',
+    'nu3': 'nǔ',
+    'nu4': 'nù',
+    'nu5': 'nu',
+    'nu:1': 'nǖ',
+    'nu:2': 'nǘ',
+    'nu:3': 'nǚ',
+    'nu:4': 'nǜ',
+    'nu:5': 'nü',
+    'nu:e1': 'nüē',
+    'nu:e2': 'nüé',
+    'nu:e3': 'nüě',
+    'nu:e4': 'nüè',
+    'nu:e5': 'nüe',
+    'nuan1': 'nuān',
+    'nuan2': 'nuán',
+    'nuan3': 'nuǎn',
+    'nuan4': 'nuàn',
+    'nuan5': 'nuan',
+    'nun1': 'nūn',
+    'nun2': 'nún',
+    'nun3': 'nǔn',
+    'nun4': 'nùn',
+    'nun5': 'nun',
+    'nuo1': 'nuō',
+    'nuo2': 'nuó',
+    'nuo3': 'nuǒ',
+    'nuo4': 'nuò',
+    'nuo5': 'nuo',
+    'nv1': 'nǖ',
+    'nv2': 'nǘ',
+    'nv3': 'nǚ',
+    'nv4': 'nǜ',
+    'nv5': 'nü',
+    'nve1': 'nüē',
+    'nve2': 'nüé',
+    'nve3': 'nüě',
+    'nve4': 'nüè',
+    'nve5': 'nüe',
+    'nü1': 'nǖ',
+    'nü2': 'nǘ',
+    'nü3': 'nǚ',
+    'nü4': 'nǜ',
+    'nü5': 'nü',
+    'nüe1': 'nüē',
+    'nüe2': 'nüé',
+    'nüe3': 'nüě',
+    'nüe4': 'nüè',
+    'nüe5': 'nüe',
+    'o1': 'ō',
+    'o2': 'ó',
+    'o3': 'ǒ',
+    'o4': 'ò',
+    'o5': 'o',
+    'ou1': 'ōu',
+    'ou2': 'óu',
+    'ou3': 'ǒu',
+    'ou4': 'òu',
+    'ou5': 'ou',
+    'pa1': 'pā',
+    'pa2': 'pá',
+    'pa3': 'pǎ',
+    'pa4': 'pà',
+    'pa5': 'pa',
+    'pai1': 'pāi',
+    'pai2': 'pái',
+    'pai3': 'pǎi',
+    'pai4': 'pài',
+    'pai5': 'pai',
+    'pan1': 'pān',
+    'pan2': 'pán',
+    'pan3': 'pǎn',
+    'pan4': 'pàn',
+    'pan5': 'pan',
+    'pang1': 'pāng',
+    'pang2': 'páng',
+    'pang3': 'pǎng',
+    'pang4': 'pàng',
+    'pang5': 'pang',
+    'pao1': 'pāo',
+    'pao2': 'páo',
+    'pao3': 'pǎo',
+    'pao4': 'pào',
+    'pao5': 'pao',
+    'pei1': 'pēi',
+    'pei2': 'péi',
+    'pei3': 'pěi',
+    'pei4': 'pèi',
+    'pei5': 'pei',
+    'pen1': 'pēn',
+    'pen2': 'pén',
+    'pen3': 'pěn',
+    'pen4': 'pèn',
+    'pen5': 'pen',
+    'peng1': 'pēng',
+    'peng2': 'péng',
+    'peng3': 'pěng',
+    'peng4': 'pèng',
+    'peng5': 'peng',
+    'pi1': 'pī',
+    'pi2': 'pí',
+    'pi3': 'pǐ',
+    'pi4': 'pì',
+    'pi5': 'pi',
+    'pian1': 'piān',
+    'pian2': 'pián',
+    'pian3': 'piǎn',
+    'pian4': 'piàn',
+    'pian5': 'pian',
+    'piao1': 'piāo',
+    'piao2': 'piáo',
+    'piao3': 'piǎo',
+    'piao4': 'piào',
+    'piao5': 'piao',
+    'pie1': 'piē',
+    'pie2': 'pié',
+    'pie3': 'piě',
+    'pie4': 'piè',
+    'pie5': 'pie',
+    'pin1': 'pīn',
+    'pin2': 'pín',
+    'pin3': 'pǐn',
+    'pin4': 'pìn',
+    'pin5': 'pin',
+    'ping1': 'pīng',
+    'ping2': 'píng',
+    'ping3': 'pǐng',
+    'ping4': 'pìng',
+    'ping5': 'ping',
+    'po1': 'pō',
+    'po2': 'pó',
+    'po3': 'pǒ',
+    'po4': 'pò',
+    'po5': 'po',
+    'pou1': 'pōu',
+    'pou2': 'póu',
+    'pou3': 'pǒu',
+    'pou4': 'pòu',
+    'pou5': 'pou',
+    'pu1': 'pū',
+    'pu2': 'pú',
+    'pu3': 'pǔ',
+    'pu4': 'pù',
+    'pu5': 'pu',
+    'qi1': 'qī',
+    'qi2': 'qí',
+    'qi3': 'qǐ',
+    'qi4': 'qì',
+    'qi5': 'qi',
+    'qia1': 'qiā',
+    'qia2': 'qiá',
+    'qia3': 'qiǎ',
+    'qia4': 'qià',
+    'qia5': 'qia',
+    'qian1': 'qiān',
+    'qian2': 'qián',
+    'qian3': 'qiǎn',
+    'qian4': 'qiàn',
+    'qian5': 'qian',
+    'qiang1': 'qiāng',
+    'qiang2': 'qiáng',
+    'qiang3': 'qiǎng',
+    'qiang4': 'qiàng',
+    'qiang5': 'qiang',
+    'qiao1': 'qiāo',
+    'qiao2': 'qiáo',
+    'qiao3': 'qiǎo',
+    'qiao4': 'qiào',
+    'qiao5': 'qiao',
+    'qie1': 'qiē',
+    'qie2': 'qié',
+    'qie3': 'qiě',
+    'qie4': 'qiè',
+    'qie5': 'qie',
+    'qin1': 'qīn',
+    'qin2': 'qín',
+    'qin3': 'qǐn',
+    'qin4': 'qìn',
+    'qin5': 'qin',
+    'qing1': 'qīng',
+    'qing2': 'qíng',
+    'qing3': 'qǐng',
+    'qing4': 'qìng',
+    'qing5': 'qing',
+    'qiong1': 'qiōng',
+    'qiong2': 'qióng',
+    'qiong3': 'qiǒng',
+    'qiong4': 'qiòng',
+    'qiong5': 'qiong',
+    'qiu1': 'qiū',
+    'qiu2': 'qiú',
+    'qiu3': 'qiǔ',
+    'qiu4': 'qiù',
+    'qiu5': 'qiu',
+    'qu1': 'qū',
+    'qu2': 'qú',
+    'qu3': 'qǔ',
+    'qu4': 'qù',
+    'qu5': 'qu',
+    'quan1': 'quān',
+    'quan2': 'quán',
+    'quan3': 'quǎn',
+    'quan4': 'quàn',
+    'quan5': 'quan',
+    'que1': 'quē',
+    'que2': 'qué',
+    'que3': 'quě',
+    'que4': 'què',
+    'que5': 'que',
+    'qun1': 'qūn',
+    'qun2': 'qún',
+    'qun3': 'qǔn',
+    'qun4': 'qùn',
+    'qun5': 'qun',
+    'ran1': 'rān',
+    'ran2': 'rán',
+    'ran3': 'rǎn',
+    'ran4': 'ràn',
+    'ran5': 'ran',
+    'rang1': 'rāng',
+    'rang2': 'ráng',
+    'rang3': 'rǎng',
+    'rang4': 'ràng',
+    'rang5': 'rang',
+    'rao1': 'rāo',
+    'rao2': 'ráo',
+    'rao3': 'rǎo',
+    'rao4': 'rào',
+    'rao5': 'rao',
+    're1': 'rē',
+    're2': 'ré',
+    're3': 'rě',
+    're4': 'rè',
+    're5': 're',
+    'ren1': 'rēn',
+    'ren2': 'rén',
+    'ren3': 'rěn',
+    'ren4': 'rèn',
+    'ren5': 'ren',
+    'reng1': 'rēng',
+    'reng2': 'réng',
+    'reng3': 'rěng',
+    'reng4': 'rèng',
+    'reng5': 'reng',
+    'ri1': 'rī',
+    'ri2': 'rí',
+    'ri3': 'rǐ',
+    'ri4': 'rì',
+    'ri5': 'ri',
+    'rong1': 'rōng',
+    'rong2': 'róng',
+    'rong3': 'rǒng',
+    'rong4': 'ròng',
+    'rong5': 'rong',
+    'rou1': 'rōu',
+    'rou2': 'róu',
+    'rou3': 'rǒu',
+    'rou4': 'ròu',
+    'rou5': 'rou',
+    'ru1': 'rū',
+    'ru2': 'rú',
+    'ru3': 'rǔ',
+    'ru4': 'rù',
+    'ru5': 'ru',
+    'rua1': 'ruā',
+    'rua2': 'ruá',
+    'rua3': 'ruǎ',
+    'rua4': 'ruà',
+    'rua5': 'rua',
+    'ruan1': 'ruān',
+    'ruan2': 'ruán',
+    'ruan3': 'ruǎn',
+    'ruan4': 'ruàn',
+    'ruan5': 'ruan',
+    'rui1': 'ruī',
+    'rui2': 'ruí',
+    'rui3': 'ruǐ',
+    'rui4': 'ruì',
+    'rui5': 'rui',
+    'run1': 'rūn',
+    'run2': 'rún',
+    'run3': 'rǔn',
+    'run4': 'rùn',
+    'run5': 'run',
+    'ruo1': 'ruō',
+    'ruo2': 'ruó',
+    'ruo3': 'ruǒ',
+    'ruo4': 'ruò',
+    'ruo5': 'ruo',
+    'sa1': 'sā',
+    'sa2': 'sá',
+    'sa3': 'sǎ',
+    'sa4': 'sà',
+    'sa5': 'sa',
+    'sai1': 'sāi',
+    'sai2': 'sái',
+    'sai3': 'sǎi',
+    'sai4': 'sài',
+    'sai5': 'sai',
+    'san1': 'sān',
+    'san2': 'sán',
+    'san3': 'sǎn',
+    'san4': 'sàn',
+    'san5': 'san',
+    'sang1': 'sāng',
+    'sang2': 'sáng',
+    'sang3': 'sǎng',
+    'sang4': 'sàng',
+    'sang5': 'sang',
+    'sao1': 'sāo',
+    'sao2': 'sáo',
+    'sao3': 'sǎo',
+    'sao4': 'sào',
+    'sao5': 'sao',
+    'se1': 'sē',
+    'se2': 'sé',
+    'se3': 'sě',
+    'se4': 'sè',
+    'se5': 'se',
+    'sen1': 'sēn',
+    'sen2': 'sén',
+    'sen3': 'sěn',
+    'sen4': 'sèn',
+    'sen5': 'sen',
+    'seng1': 'sēng',
+    'seng2': 'séng',
+    'seng3': 'sěng',
+    'seng4': 'sèng',
+    'seng5': 'seng',
+    'sha1': 'shā',
+    'sha2': 'shá',
+    'sha3': 'shǎ',
+    'sha4': 'shà',
+    'sha5': 'sha',
+    'shai1': 'shāi',
+    'shai2': 'shái',
+    'shai3': 'shǎi',
+    'shai4': 'shài',
+    'shai5': 'shai',
+    'shan1': 'shān',
+    'shan2': 'shán',
+    'shan3': 'shǎn',
+    'shan4': 'shàn',
+    'shan5': 'shan',
+    'shang1': 'shāng',
+    'shang2': 'sháng',
+    'shang3': 'shǎng',
+    'shang4': 'shàng',
+    'shang5': 'shang',
+    'shao1': 'shāo',
+    'shao2': 'sháo',
+    'shao3': 'shǎo',
+    'shao4': 'shào',
+    'shao5': 'shao',
+    'she1': 'shē',
+    'she2': 'shé',
+    'she3': 'shě',
+    'she4': 'shè',
+    'she5': 'she',
+    'shei1': 'shēi',
+    'shei2': 'shéi',
+    'shei3': 'shěi',
+    'shei4': 'shèi',
+    'shei5': 'shei',
+    'shen1': 'shēn',
+    'shen2': 'shén',
+    'shen3': 'shěn',
+    'shen4': 'shèn',
+    'shen5': 'shen',
+    'sheng1': 'shēng',
+    'sheng2': 'shéng',
+    'sheng3': 'shěng',
+    'sheng4': 'shèng',
+    'sheng5': 'sheng',
+    'shi1': 'shī',
+    'shi2': 'shí',
+    'shi3': 'shǐ',
+    'shi4': 'shì',
+    'shi5': 'shi',
+    'shou1': 'shōu',
+    'shou2': 'shóu',
+    'shou3': 'shǒu',
+    'shou4': 'shòu',
+    'shou5': 'shou',
+    'shu1': 'shū',
+    'shu2': 'shú',
+    'shu3': 'shǔ',
+    'shu4': 'shù',
+    'shu5': 'shu',
+    'shua1': 'shuā',
+    'shua2': 'shuá',
+    'shua3': 'shuǎ',
+    'shua4': 'shuà',
+    'shua5': 'shua',
+    'shuai1': 'shuāi',
+    'shuai2': 'shuái',
+    'shuai3': 'shuǎi',
+    'shuai4': 'shuài',
+    'shuai5': 'shuai',
+    'shuan1': 'shuān',
+    'shuan2': 'shuán',
+    'shuan3': 'shuǎn',
+    'shuan4': 'shuàn',
+    'shuan5': 'shuan',
+    'shuang1': 'shuāng',
+    'shuang2': 'shuáng',
+    'shuang3': 'shuǎng',
+    'shuang4': 'shuàng',
+    'shuang5': 'shuang',
+    'shui1': 'shuī',
+    'shui2': 'shuí',
+    'shui3': 'shuǐ',
+    'shui4': 'shuì',
+    'shui5': 'shui',
+    'shun1': 'shūn',
+    'shun2': 'shún',
+    'shun3': 'shǔn',
+    'shun4': 'shùn',
+    'shun5': 'shun',
+    'shuo1': 'shuō',
+    'shuo2': 'shuó',
+    'shuo3': 'shuǒ',
+    'shuo4': 'shuò',
+    'shuo5': 'shuo',
+    'si1': 'sī',
+    'si2': 'sí',
+    'si3': 'sǐ',
+    'si4': 'sì',
+    'si5': 'si',
+    'song1': 'sōng',
+    'song2': 'sóng',
+    'song3': 'sǒng',
+    'song4': 'sòng',
+    'song5': 'song',
+    'sou1': 'sōu',
+    'sou2': 'sóu',
+    'sou3': 'sǒu',
+    'sou4': 'sòu',
+    'sou5': 'sou',
+    'su1': 'sū',
+    'su2': 'sú',
+    'su3': 'sǔ',
+    'su4': 'sù',
+    'su5': 'su',
+    'suan1': 'suān',
+    'suan2': 'suán',
+    'suan3': 'suǎn',
+    'suan4': 'suàn',
+    'suan5': 'suan',
+    'sui1': 'suī',
+    'sui2': 'suí',
+    'sui3': 'suǐ',
+    'sui4': 'suì',
+    'sui5': 'sui',
+    'sun1': 'sūn',
+    'sun2': 'sún',
+    'sun3': 'sǔn',
+    'sun4': 'sùn',
+    'sun5': 'sun',
+    'suo1': 'suō',
+    'suo2': 'suó',
+    'suo3': 'suǒ',
+    'suo4': 'suò',
+    'suo5': 'suo',
+    'ta1': 'tā',
+    'ta2': 'tá',
+    'ta3': 'tǎ',
+    'ta4': 'tà',
+    'ta5': 'ta',
+    'tai1': 'tāi',
+    'tai2': 'tái',
+    'tai3': 'tǎi',
+    'tai4': 'tài',
+    'tai5': 'tai',
+    'tan1': 'tān',
+    'tan2': 'tán',
+    'tan3': 'tǎn',
+    'tan4': 'tàn',
+    'tan5': 'tan',
+    'tang1': 'tāng',
+    'tang2': 'táng',
+    'tang3': 'tǎng',
+    'tang4': 'tàng',
+    'tang5': 'tang',
+    'tao1': 'tāo',
+    'tao2': 'táo',
+    'tao3': 'tǎo',
+    'tao4': 'tào',
+    'tao5': 'tao',
+    'te1': 'tē',
+    'te2': 'té',
+    'te3': 'tě',
+    'te4': 'tè',
+    'te5': 'te',
+    'tei1': 'tēi',
+    'tei2': 'téi',
+    'tei3': 'těi',
+    'tei4': 'tèi',
+    'tei5': 'tei',
+    'teng1': 'tēng',
+    'teng2': 'téng',
+    'teng3': 'těng',
+    'teng4': 'tèng',
+    'teng5': 'teng',
+    'ti1': 'tī',
+    'ti2': 'tí',
+    'ti3': 'tǐ',
+    'ti4': 'tì',
+    'ti5': 'ti',
+    'tian1': 'tiān',
+    'tian2': 'tián',
+    'tian3': 'tiǎn',
+    'tian4': 'tiàn',
+    'tian5': 'tian',
+    'tiao1': 'tiāo',
+    'tiao2': 'tiáo',
+    'tiao3': 'tiǎo',
+    'tiao4': 'tiào',
+    'tiao5': 'tiao',
+    'tie1': 'tiē',
+    'tie2': 'tié',
+    'tie3': 'tiě',
+    'tie4': 'tiè',
+    'tie5': 'tie',
+    'ting1': 'tīng',
+    'ting2': 'tíng',
+    'ting3': 'tǐng',
+    'ting4': 'tìng',
+    'ting5': 'ting',
+    'tong1': 'tōng',
+    'tong2': 'tóng',
+    'tong3': 'tǒng',
+    'tong4': 'tòng',
+    'tong5': 'tong',
+    'tou1': 'tōu',
+    'tou2': 'tóu',
+    'tou3': 'tǒu',
+    'tou4': 'tòu',
+    'tou5': 'tou',
+    'tu1': 'tū',
+    'tu2': 'tú',
+    'tu3': 'tǔ',
+    'tu4': 'tù',
+    'tu5': 'tu',
+    'tuan1': 'tuān',
+    'tuan2': 'tuán',
+    'tuan3': 'tuǎn',
+    'tuan4': 'tuàn',
+    'tuan5': 'tuan',
+    'tui1': 'tuī',
+    'tui2': 'tuí',
+    'tui3': 'tuǐ',
+    'tui4': 'tuì',
+    'tui5': 'tui',
+    'tun1': 'tūn',
+    'tun2': 'tún',
+    'tun3': 'tǔn',
+    'tun4': 'tùn',
+    'tun5': 'tun',
+    'tuo1': 'tuō',
+    'tuo2': 'tuó',
+    'tuo3': 'tuǒ',
+    'tuo4': 'tuò',
+    'tuo5': 'tuo',
+    'wa1': 'wā',
+    'wa2': 'wá',
+    'wa3': 'wǎ',
+    'wa4': 'wà',
+    'wa5': 'wa',
+    'wai1': 'wāi',
+    'wai2': 'wái',
+    'wai3': 'wǎi',
+    'wai4': 'wài',
+    'wai5': 'wai',
+    'wan1': 'wān',
+    'wan2': 'wán',
+    'wan3': 'wǎn',
+    'wan4': 'wàn',
+    'wan5': 'wan',
+    'wang1': 'wāng',
+    'wang2': 'wáng',
+    'wang3': 'wǎng',
+    'wang4': 'wàng',
+    'wang5': 'wang',
+    'wei1': 'wēi',
+    'wei2': 'wéi',
+    'wei3': 'wěi',
+    'wei4': 'wèi',
+    'wei5': 'wei',
+    'wen1': 'wēn',
+    'wen2': 'wén',
+    'wen3': 'wěn',
+    'wen4': 'wèn',
+    'wen5': 'wen',
+    'weng1': 'wēng',
+    'weng2': 'wéng',
+    'weng3': 'wěng',
+    'weng4': 'wèng',
+    'weng5': 'weng',
+    'wo1': 'wō',
+    'wo2': 'wó',
+    'wo3': 'wǒ',
+    'wo4': 'wò',
+    'wo5': 'wo',
+    'wu1': 'wū',
+    'wu2': 'wú',
+    'wu3': 'wǔ',
+    'wu4': 'wù',
+    'wu5': 'wu',
+    'xi1': 'xī',
+    'xi2': 'xí',
+    'xi3': 'xǐ',
+    'xi4': 'xì',
+    'xi5': 'xi',
+    'xia1': 'xiā',
+    'xia2': 'xiá',
+    'xia3': 'xiǎ',
+    'xia4': 'xià',
+    'xia5': 'xia',
+    'xian1': 'xiān',
+    'xian2': 'xián',
+    'xian3': 'xiǎn',
+    'xian4': 'xiàn',
+    'xian5': 'xian',
+    'xiang1': 'xiāng',
+    'xiang2': 'xiáng',
+    'xiang3': 'xiǎng',
+    'xiang4': 'xiàng',
+    'xiang5': 'xiang',
+    'xiao1': 'xiāo',
+    'xiao2': 'xiáo',
+    'xiao3': 'xiǎo',
+    'xiao4': 'xiào',
+    'xiao5': 'xiao',
+    'xie1': 'xiē',
+    'xie2': 'xié',
+    'xie3': 'xiě',
+    'xie4': 'xiè',
+    'xie5': 'xie',
+    'xin1': 'xīn',
+    'xin2': 'xín',
+    'xin3': 'xǐn',
+    'xin4': 'xìn',
+    'xin5': 'xin',
+    'xing1': 'xīng',
+    'xing2': 'xíng',
+    'xing3': 'xǐng',
+    'xing4': 'xìng',
+    'xing5': 'xing',
+    'xiong1': 'xiōng',
+    'xiong2': 'xióng',
+    'xiong3': 'xiǒng',
+    'xiong4': 'xiòng',
+    'xiong5': 'xiong',
+    'xiu1': 'xiū',
+    'xiu2': 'xiú',
+    'xiu3': 'xiǔ',
+    'xiu4': 'xiù',
+    'xiu5': 'xiu',
+    'xu1': 'xū',
+    'xu2': 'xú',
+    'xu3': 'xǔ',
+    'xu4': 'xù',
+    'xu5': 'xu',
+    'xuan1': 'xuān',
+    'xuan2': 'xuán',
+    'xuan3': 'xuǎn',
+    'xuan4': 'xuàn',
+    'xuan5': 'xuan',
+    'xue1': 'xuē',
+    'xue2': 'xué',
+    'xue3': 'xuě',
+    'xue4': 'xuè',
+    'xue5': 'xue',
+    'xun1': 'xūn',
+    'xun2': 'xún',
+    'xun3': 'xǔn',
+    'xun4': 'xùn',
+    'xun5': 'xun',
+    'ya1': 'yā',
+    'ya2': 'yá',
+    'ya3': 'yǎ',
+    'ya4': 'yà',
+    'ya5': 'ya',
+    'yan1': 'yān',
+    'yan2': 'yán',
+    'yan3': 'yǎn',
+    'yan4': 'yàn',
+    'yan5': 'yan',
+    'yang1': 'yāng',
+    'yang2': 'yáng',
+    'yang3': 'yǎng',
+    'yang4': 'yàng',
+    'yang5': 'yang',
+    'yao1': 'yāo',
+    'yao2': 'yáo',
+    'yao3': 'yǎo',
+    'yao4': 'yào',
+    'yao5': 'yao',
+    'ye1': 'yē',
+    'ye2': 'yé',
+    'ye3': 'yě',
+    'ye4': 'yè',
+    'ye5': 'ye',
+    'yi1': 'yī',
+    'yi2': 'yí',
+    'yi3': 'yǐ',
+    'yi4': 'yì',
+    'yi5': 'yi',
+    'yin1': 'yīn',
+    'yin2': 'yín',
+    'yin3': 'yǐn',
+    'yin4': 'yìn',
+    'yin5': 'yin',
+    'ying1': 'yīng',
+    'ying2': 'yíng',
+    'ying3': 'yǐng',
+    'ying4': 'yìng',
+    'ying5': 'ying',
+    'yo1': 'yō',
+    'yo2': 'yó',
+    'yo3': 'yǒ',
+    'yo4': 'yò',
+    'yo5': 'yo',
+    'yong1': 'yōng',
+    'yong2': 'yóng',
+    'yong3': 'yǒng',
+    'yong4': 'yòng',
+    'yong5': 'yong',
+    'you1': 'yōu',
+    'you2': 'yóu',
+    'you3': 'yǒu',
+    'you4': 'yòu',
+    'you5': 'you',
+    'yu1': 'yū',
+    'yu2': 'yú',
+    'yu3': 'yǔ',
+    'yu4': 'yù',
+    'yu5': 'yu',
+    'yuan1': 'yuān',
+    'yuan2': 'yuán',
+    'yuan3': 'yuǎn',
+    'yuan4': 'yuàn',
+    'yuan5': 'yuan',
+    'yue1': 'yuē',
+    'yue2': 'yué',
+    'yue3': 'yuě',
+    'yue4': 'yuè',
+    'yue5': 'yue',
+    'yun1': 'yūn',
+    'yun2': 'yún',
+    'yun3': 'yǔn',
+    'yun4': 'yùn',
+    'yun5': 'yun',
+    'za1': 'zā',
+    'za2': 'zá',
+    'za3': 'zǎ',
+    'za4': 'zà',
+    'za5': 'za',
+    'zai1': 'zāi',
+    'zai2': 'zái',
+    'zai3': 'zǎi',
+    'zai4': 'zài',
+    'zai5': 'zai',
+    'zan1': 'zān',
+    'zan2': 'zán',
+    'zan3': 'zǎn',
+    'zan4': 'zàn',
+    'zan5': 'zan',
+    'zang1': 'zāng',
+    'zang2': 'záng',
+    'zang3': 'zǎng',
+    'zang4': 'zàng',
+    'zang5': 'zang',
+    'zao1': 'zāo',
+    'zao2': 'záo',
+    'zao3': 'zǎo',
+    'zao4': 'zào',
+    'zao5': 'zao',
+    'ze1': 'zē',
+    'ze2': 'zé',
+    'ze3': 'zě',
+    'ze4': 'zè',
+    'ze5': 'ze',
+    'zei1': 'zēi',
+    'zei2': 'zéi',
+    'zei3': 'zěi',
+    'zei4': 'zèi',
+    'zei5': 'zei',
+    'zen1': 'zēn',
+    'zen2': 'zén',
+    'zen3': 'zěn',
+    'zen4': 'zèn',
+    'zen5': 'zen',
+    'zeng1': 'zēng',
+    'zeng2': 'zéng',
+    'zeng3': 'zěng',
+    'zeng4': 'zèng',
+    'zeng5': 'zeng',
+    'zha1': 'zhā',
+    'zha2': 'zhá',
+    'zha3': 'zhǎ',
+    'zha4': 'zhà',
+    'zha5': 'zha',
+    'zhai1': 'zhāi',
+    'zhai2': 'zhái',
+    'zhai3': 'zhǎi',
+    'zhai4': 'zhài',
+    'zhai5': 'zhai',
+    'zhan1': 'zhān',
+    'zhan2': 'zhán',
+    'zhan3': 'zhǎn',
+    'zhan4': 'zhàn',
+    'zhan5': 'zhan',
+    'zhang1': 'zhāng',
+    'zhang2': 'zháng',
+    'zhang3': 'zhǎng',
+    'zhang4': 'zhàng',
+    'zhang5': 'zhang',
+    'zhao1': 'zhāo',
+    'zhao2': 'zháo',
+    'zhao3': 'zhǎo',
+    'zhao4': 'zhào',
+    'zhao5': 'zhao',
+    'zhe1': 'zhē',
+    'zhe2': 'zhé',
+    'zhe3': 'zhě',
+    'zhe4': 'zhè',
+    'zhe5': 'zhe',
+    'zhei1': 'zhēi',
+    'zhei2': 'zhéi',
+    'zhei3': 'zhěi',
+    'zhei4': 'zhèi',
+    'zhei5': 'zhei',
+    'zhen1': 'zhēn',
+    'zhen2': 'zhén',
+    'zhen3': 'zhěn',
+    'zhen4': 'zhèn',
+    'zhen5': 'zhen',
+    'zheng1': 'zhēng',
+    'zheng2': 'zhéng',
+    'zheng3': 'zhěng',
+    'zheng4': 'zhèng',
+    'zheng5': 'zheng',
+    'zhi1': 'zhī',
+    'zhi2': 'zhí',
+    'zhi3': 'zhǐ',
+    'zhi4': 'zhì',
+    'zhi5': 'zhi',
+    'zhong1': 'zhōng',
+    'zhong2': 'zhóng',
+    'zhong3': 'zhǒng',
+    'zhong4': 'zhòng',
+    'zhong5': 'zhong',
+    'zhou1': 'zhōu',
+    'zhou2': 'zhóu',
+    'zhou3': 'zhǒu',
+    'zhou4': 'zhòu',
+    'zhou5': 'zhou',
+    'zhu1': 'zhū',
+    'zhu2': 'zhú',
+    'zhu3': 'zhǔ',
+    'zhu4': 'zhù',
+    'zhu5': 'zhu',
+    'zhua1': 'zhuā',
+    'zhua2': 'zhuá',
+    'zhua3': 'zhuǎ',
+    'zhua4': 'zhuà',
+    'zhua5': 'zhua',
+    'zhuai1': 'zhuāi',
+    'zhuai2': 'zhuái',
+    'zhuai3': 'zhuǎi',
+    'zhuai4': 'zhuài',
+    'zhuai5': 'zhuai',
+    'zhuan1': 'zhuān',
+    'zhuan2': 'zhuán',
+    'zhuan3': 'zhuǎn',
+    'zhuan4': 'zhuàn',
+    'zhuan5': 'zhuan',
+    'zhuang1': 'zhuāng',
+    'zhuang2': 'zhuáng',
+    'zhuang3': 'zhuǎng',
+    'zhuang4': 'zhuàng',
+    'zhuang5': 'zhuang',
+    'zhui1': 'zhuī',
+    'zhui2': 'zhuí',
+    'zhui3': 'zhuǐ',
+    'zhui4': 'zhuì',
+    'zhui5': 'zhui',
+    'zhun1': 'zhūn',
+    'zhun2': 'zhún',
+    'zhun3': 'zhǔn',
+    'zhun4': 'zhùn',
+    'zhun5': 'zhun',
+    'zhuo1': 'zhuō',
+    'zhuo2': 'zhuó',
+    'zhuo3': 'zhuǒ',
+    'zhuo4': 'zhuò',
+    'zhuo5': 'zhuo',
+    'zi1': 'zī',
+    'zi2': 'zí',
+    'zi3': 'zǐ',
+    'zi4': 'zì',
+    'zi5': 'zi',
+    'zong1': 'zōng',
+    'zong2': 'zóng',
+    'zong3': 'zǒng',
+    'zong4': 'zòng',
+    'zong5': 'zong',
+    'zou1': 'zōu',
+    'zou2': 'zóu',
+    'zou3': 'zǒu',
+    'zou4': 'zòu',
+    'zou5': 'zou',
+    'zu1': 'zū',
+    'zu2': 'zú',
+    'zu3': 'zǔ',
+    'zu4': 'zù',
+    'zu5': 'zu',
+    'zuan1': 'zuān',
+    'zuan2': 'zuán',
+    'zuan3': 'zuǎn',
+    'zuan4': 'zuàn',
+    'zuan5': 'zuan',
+    'zui1': 'zuī',
+    'zui2': 'zuí',
+    'zui3': 'zuǐ',
+    'zui4': 'zuì',
+    'zui5': 'zui',
+    'zun1': 'zūn',
+    'zun2': 'zún',
+    'zun3': 'zǔn',
+    'zun4': 'zùn',
+    'zun5': 'zun',
+    'zuo1': 'zuō',
+    'zuo2': 'zuó',
+    'zuo3': 'zuǒ',
+    'zuo4': 'zuò',
+    'zuo5': 'zuo',
+}
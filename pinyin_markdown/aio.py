@@ -0,0 +1,117 @@
+"""
+asyncio entry points which render in an executor, so a large page doesn't block the event loop.
+
+    >>> html = await render(text, tone_class='t{}')
+    >>> renderer = AsyncRenderer(ProcessPoolExecutor(4), max_concurrent=8, timeout=2.0)
+    >>> async for html in renderer.render_many(pages):
+    ...     await send(html)
+
+Each worker thread or process renders with the shared PinyinRenderer pool for the config (see pool.py),
+so the output is the same as the sync path.
+"""
+import asyncio
+import collections
+
+from pinyin_markdown.pool import renderer as _shared_renderer
+
+DEFAULT_MAX_CONCURRENT = 8
+
+
+def _render(text, extensions, config):
+    """Runs in the executor. Module level, so that a process executor can pickle it."""
+    return _shared_renderer(extensions=extensions, **config).convert(text)
+
+
+async def render(text, extensions=(), timeout=None, executor=None, **config):
+    """
+    Renders text with PinyinExtension(**config) in executor, the loop's default thread pool if None.
+    :param timeout: seconds, or None to wait forever
+    :raises asyncio.TimeoutError: if the render took longer than timeout. A render which has started in a thread
+                                  or process can't be interrupted, so it finishes in the background.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(executor, _render, text, list(extensions), config)
+    return await asyncio.wait_for(future, timeout)
+
+
+async def _aiter(texts):
+    if hasattr(texts, '__aiter__'):
+        async for text in texts:
+            yield text
+    else:
+        for text in texts:
+            yield text
+
+
+class AsyncRenderer(object):
+    """
+    Renders in an executor with at most max_concurrent renders submitted at once.
+    Callers beyond that wait their turn, so a burst of requests can't queue up unbounded work in the executor.
+    """
+
+    def __init__(self, executor=None, max_concurrent=DEFAULT_MAX_CONCURRENT, timeout=None, extensions=(),
+                 **config):
+        """
+        :param executor: a concurrent.futures executor, or None for the loop's default thread pool
+        :param timeout: default seconds per render, or None to wait forever
+        :param extensions: other Markdown extensions, by name
+        :param config: PinyinExtension config
+        """
+        if max_concurrent < 1:
+            raise ValueError('max_concurrent must be at least 1')
+        self.executor = executor
+        self.max_concurrent = max_concurrent
+        self.timeout = timeout
+        self.extensions = list(extensions)
+        self.config = config
+        self._semaphore = None  # Made on first use, inside the running loop
+
+    def _get_semaphore(self):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphore
+
+    async def render(self, text, timeout=None):
+        """
+        :param timeout: seconds, overriding the renderer's timeout. Time spent waiting for a free slot counts.
+        :return: the HTML of text
+        :raises asyncio.TimeoutError: if the render took longer than timeout. A render which has started keeps
+                                      its slot until it finishes in the background.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        semaphore = self._get_semaphore()
+        await asyncio.wait_for(semaphore.acquire(), timeout)
+        try:
+            future = loop.run_in_executor(self.executor, _render, text, self.extensions, self.config)
+        except BaseException:
+            semaphore.release()
+            raise
+        # Released when the render is done, not when we stop waiting for it
+        future.add_done_callback(self._finished)
+        remaining = None if deadline is None else max(0.0, deadline - loop.time())
+        return await asyncio.wait_for(asyncio.shield(future), remaining)
+
+    def _finished(self, future):
+        self._semaphore.release()
+        if not future.cancelled():
+            future.exception()  # Retrieved, so that the error of a render nobody waits for any more isn't logged
+
+    async def render_many(self, texts, timeout=None):
+        """
+        Renders a batch, keeping at most max_concurrent pages in flight.
+        :param texts: iterable or async iterable of str
+        :return: async generator of HTML, in the same order as texts
+        """
+        pending = collections.deque()
+        try:
+            async for text in _aiter(texts):
+                pending.append(asyncio.ensure_future(self.render(text, timeout)))
+                if len(pending) >= self.max_concurrent:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
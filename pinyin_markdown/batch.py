@@ -0,0 +1,200 @@
+"""
+Converts a directory tree of Markdown files, or a list of documents, to HTML with a pool of worker processes.
+
+Each worker builds its Markdown instance once and reuses it with reset().
+A manifest of content hashes is kept in the output directory, so files which haven't changed since the
+last run (with the same options) are skipped.
+"""
+import hashlib
+import json
+import os
+import queue
+import time
+from itertools import islice
+from multiprocessing import Pool
+
+from markdown import Markdown
+from pinyin_markdown import disk_cache
+from pinyin_markdown.pinyinextension import PinyinExtension
+
+MANIFEST_NAME = '.pinyin_markdown_manifest.json'
+MARKDOWN_SUFFIXES = ('.md', '.markdown')
+
+_markdown = None  # The worker process's Markdown instance
+
+
+def _init_worker(config, extensions):
+    global _markdown
+    _markdown = Markdown(extensions=[PinyinExtension(**config)] + list(extensions))
+
+
+def check_config(config, extensions=()):
+    """
+    Builds the workers' Markdown once in this process, raising its error (e.g. a ValueError for an unknown engine).
+    A worker's initializer which raises would make the Pool start new workers forever, never returning.
+    """
+    _init_worker(config or {}, extensions)
+
+
+def _convert_file(task):
+    """
+    Runs in a worker: converts one file unless its hash matches the manifest.
+    :return: (relative path, hash, bytes read, whether it was converted)
+    """
+    rel, src, dst, old_hash, salt = task
+    with open(src, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(salt + data).hexdigest()
+    if digest == old_hash and os.path.exists(dst):
+        return rel, digest, len(data), False
+    html = _markdown.reset().convert(data.decode('utf8'))
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    with open(dst, 'w', encoding='utf8') as f:
+        f.write(html)
+    return rel, digest, len(data), True
+
+
+def _convert_chunk(texts):
+    """Runs in a worker: converts a list of documents"""
+    return [_markdown.reset().convert(text) for text in texts]
+
+
+def find_markdown(src_dir):
+    """:return: sorted relative paths of the Markdown files under src_dir"""
+    found = []
+    for root, dirs, files in os.walk(src_dir):
+        dirs.sort()
+        for name in files:
+            if name.endswith(MARKDOWN_SUFFIXES):
+                found.append(os.path.relpath(os.path.join(root, name), src_dir))
+    return sorted(found)
+
+
+def _load_manifest(path):
+    try:
+        with open(path, encoding='utf8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class BatchResult(object):
+    def __init__(self, converted, skipped, total_bytes, seconds):
+        self.converted = converted
+        self.skipped = skipped
+        self.total_bytes = total_bytes
+        self.seconds = seconds
+
+    @property
+    def files_per_second(self):
+        return (self.converted + self.skipped) / self.seconds if self.seconds else 0.0
+
+    @property
+    def megabytes_per_second(self):
+        return self.total_bytes / 1e6 / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return '{} converted, {} unchanged in {:.2f}s: {:.1f} files/s, {:.2f} MB/s'.format(
+            self.converted, self.skipped, self.seconds, self.files_per_second, self.megabytes_per_second)
+
+
+def convert_tree(src_dir, dst_dir, config=None, extensions=(), workers=None, chunksize=16):
+    """
+    Converts every .md file under src_dir to a .html file at the same relative path under dst_dir.
+    :param config: PinyinExtension config
+    :param extensions: other Markdown extensions, by name
+    :param workers: number of processes, default os.cpu_count()
+    :return: BatchResult
+    """
+    config = config or {}
+    check_config(config, extensions)
+    start = time.perf_counter()
+    manifest_path = os.path.join(dst_dir, MANIFEST_NAME)
+    manifest = _load_manifest(manifest_path)
+    # Changing the options or the package must re-render everything
+    salt = disk_cache.config_salt(config, extensions)
+    tasks = [(rel, os.path.join(src_dir, rel), os.path.join(dst_dir, os.path.splitext(rel)[0] + '.html'),
+              manifest.get(rel), salt) for rel in find_markdown(src_dir)]
+
+    converted = skipped = total_bytes = 0
+    new_manifest = {}
+    with Pool(workers, _init_worker, (config, extensions)) as pool:
+        for rel, digest, size, did_convert in pool.imap_unordered(_convert_file, tasks, chunksize):
+            new_manifest[rel] = digest
+            total_bytes += size
+            if did_convert:
+                converted += 1
+            else:
+                skipped += 1
+
+    os.makedirs(dst_dir, exist_ok=True)
+    with open(manifest_path, 'w', encoding='utf8') as f:
+        json.dump(new_manifest, f, indent=0, sort_keys=True)
+    return BatchResult(converted, skipped, total_bytes, time.perf_counter() - start)
+
+
+def iter_convert_many(docs, config=None, extensions=(), workers=None, chunksize=16, ordered=True, max_pending=None):
+    """
+    Converts documents in a pool of worker processes, sending them in chunks of chunksize to amortise the IPC.
+    Only max_pending chunks are converting or waiting to be yielded at any time, so memory stays bounded however
+    many documents there are, and docs may be a generator.
+    :param docs: iterable of Markdown str
+    :param config: PinyinExtension config
+    :param extensions: other Markdown extensions, by name
+    :param workers: number of processes, default os.cpu_count()
+    :param ordered: if True yield HTML in the order of docs, else yield (index, HTML) as chunks complete
+    :param max_pending: default twice the number of workers
+    :return: generator of HTML str, or of (index, HTML)
+    """
+    config = config or {}
+    check_config(config, extensions)
+    return _iter_convert_many(docs, config, extensions, workers, chunksize, ordered, max_pending)
+
+
+def _iter_convert_many(docs, config, extensions, workers, chunksize, ordered, max_pending):
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    docs = iter(docs)
+    done = queue.Queue()
+    with Pool(workers, _init_worker, (config, extensions)) as pool:
+        def submit(start, chunk):
+            pool.apply_async(_convert_chunk, (chunk,),
+                             callback=lambda htmls: done.put((start, htmls, None)),
+                             error_callback=lambda error: done.put((start, None, error)))
+
+        submitted = in_flight = next_index = 0
+        finished = {}  # Chunks which completed before an earlier one, by index of their first document
+        exhausted = False
+        while True:
+            while not exhausted and in_flight + len(finished) < max_pending:
+                chunk = list(islice(docs, chunksize))
+                if not chunk:
+                    exhausted = True
+                    break
+                submit(submitted, chunk)
+                submitted += len(chunk)
+                in_flight += 1
+            if not in_flight:
+                break
+            start, htmls, error = done.get()
+            in_flight -= 1
+            if error is not None:
+                raise error
+            if not ordered:
+                for index, html in enumerate(htmls, start):
+                    yield index, html
+                continue
+            finished[start] = htmls
+            while next_index in finished:
+                htmls = finished.pop(next_index)
+                for html in htmls:
+                    yield html
+                next_index += len(htmls)
+
+
+def convert_many(docs, config=None, extensions=(), workers=None, chunksize=16):
+    """
+    Converts documents in a pool of worker processes. See iter_convert_many, which doesn't build a list.
+    :return: list of HTML str, in the order of docs
+    """
+    return list(iter_convert_many(docs, config, extensions, workers, chunksize))
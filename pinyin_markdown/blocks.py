@@ -0,0 +1,145 @@
+"""
+Splits a Markdown document into top-level blocks which render independently.
+
+Rendering each block on its own and joining the results with newlines gives the same HTML as rendering the
+whole document, as long as the document doesn't use an extension which gathers content from across the
+document (footnotes, toc, abbr). Reference link definitions are handled by the renderers, which prepend them
+to every block.
+
+A split is only made at a blank line which is followed by a line that can't continue the block before it:
+not indented (code blocks, list items), not a list item, block quote, table row or heading underline,
+not a link definition, and not inside a fenced code block or an unclosed raw HTML block.
+Markdown ends a raw HTML block with a blank line of its own, which a split would lose, so a raw HTML block
+is never split from the block after it. When unsure, blocks are kept together, which is always safe.
+"""
+import re
+
+from markdown.util import BLOCK_LEVEL_ELEMENTS
+
+# Lines starting like this may continue the previous block even after a blank line
+_CONTINUATION = re.compile(r'[ \t>*+\-|=:\[]|\d+[.)]')
+_FENCE = re.compile(r' {0,3}(`{3,}|~{3,})')
+# The fences of the fenced_code extension, which must start the line. The closing fence is the same string.
+_FENCED_CODE = re.compile(r'(`{3,}|~{3,})')
+# A raw HTML block starts with a block-level tag, a comment or a declaration; <em> or <http://...> start a paragraph
+_RAW_HTML_START = re.compile(r' {{0,3}}<(?:!|\?|/?(?:{})(?=[\s/>]|$))'.format('|'.join(BLOCK_LEVEL_ELEMENTS)),
+                             re.IGNORECASE)
+_HTML_TAG = re.compile(r'<(/?)([a-zA-Z][\w-]*)[^>]*?(/?)>|<!--|-->')
+_VOID_TAGS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param',
+                        'source', 'track', 'wbr'))
+# Reference link definitions, but not footnote definitions ([^1]:)
+REFERENCE = re.compile(r'^ {0,3}\[[^\[\]^][^\[\]]*\]:.*$', re.MULTILINE)
+# Underlines the line before it as a setext heading, even if that line looks like a link definition
+_SETEXT_UNDERLINE = re.compile(r'[=-]+ *$')
+
+
+def _html_balance(line):
+    """:return: the number of raw HTML elements (or comments) opened minus the number closed in line"""
+    balance = 0
+    for m in _HTML_TAG.finditer(line):
+        token = m.group(0)
+        if token == '<!--':
+            balance += 1
+        elif token == '-->':
+            balance -= 1
+        elif m.group(2).lower() not in _VOID_TAGS and not m.group(3):
+            balance += -1 if m.group(1) else 1
+    return balance
+
+
+def _may_continue(line):
+    """:return: whether line may continue the block before it even after a blank line"""
+    return bool(_CONTINUATION.match(line) or _RAW_HTML_START.match(line))
+
+
+def iter_blocks(lines):
+    """
+    :param lines: iterable of lines, with or without their line endings, e.g. an open file
+    :return: generator of blocks, each a str of whole lines without the blank lines which separated them
+    """
+    block = []  # Lines of the current block, with their line endings
+    blanks = 0  # Blank lines seen since the last line of the block
+    fence = None  # The ``` or ~~~ which opened the fenced code block we are in
+    html = 0  # Unclosed elements of a raw HTML block, which starts with a block-level tag at the start of a line
+    raw = False  # Whether the block ends with raw HTML, which must be kept with the block after it
+    for line in lines:
+        if not line.endswith('\n'):
+            line += '\n'
+        if fence is None and not line.strip():
+            if block:
+                blanks += 1
+            continue
+        if blanks:
+            if fence is None and not raw and not _may_continue(line):
+                yield ''.join(block)
+                block = []
+            else:
+                block.append('\n' * blanks)
+                if not html and not REFERENCE.match(line):
+                    # The raw HTML block ended at the blank lines: this line's block may be split from the next,
+                    # unless it's a link definition, which renders nothing
+                    raw = False
+            blanks = 0
+        if fence is not None:
+            if line.strip().startswith(fence) and not line.strip().strip(fence[0]):
+                fence = None
+        else:
+            m = _FENCE.match(line)
+            if m:
+                fence = m.group(1)
+            elif html > 0 or _RAW_HTML_START.match(line):
+                html = max(0, html + _html_balance(line))
+                raw = True
+        block.append(line)
+    if block:
+        yield ''.join(block)
+
+
+def split_blocks(text):
+    """:return: list of the top-level blocks of a Markdown document"""
+    return list(iter_blocks(text.splitlines(True)))
+
+
+def references(text, fenced=False):
+    """
+    :param fenced: whether the fenced_code extension is loaded, so that definitions in fenced code don't count
+    :return: the reference link definitions in text, as a str which can be prepended to any block
+    """
+    return iter_references(text.splitlines(), fenced)
+
+
+def iter_references(lines, fenced=False):
+    """
+    Definitions in raw HTML blocks, fenced code (with fenced) and indented code (more than 3 spaces) don't count,
+    nor do those underlined as setext headings.
+    :return: the reference link definitions in an iterable of lines, in the same form as references()
+    """
+    found = []
+    fence = None  # The fence of the fenced code we are in
+    in_fence = []  # Definitions since the fence opened: they count if the fence is never closed
+    html = 0
+    pending = None  # The definition on the previous line, which is a heading if this line underlines it
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if pending is not None:
+            if not _SETEXT_UNDERLINE.match(line):
+                found.append(pending)
+            pending = None
+        if fence is not None:
+            if line.rstrip(' ') == fence:
+                fence = None
+                del in_fence[:]
+            elif REFERENCE.match(line):
+                in_fence.append(line)
+            continue
+        m = _FENCED_CODE.match(line) if fenced else None
+        if m:
+            fence = m.group(1)
+        elif html > 0 or _RAW_HTML_START.match(line):
+            html = max(0, html + _html_balance(line))
+        elif REFERENCE.match(line):
+            pending = line
+    if pending is not None:
+        found.append(pending)
+    found.extend(in_fence)
+    return '\n'.join(found) + '\n\n' if found else ''
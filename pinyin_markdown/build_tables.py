@@ -0,0 +1,53 @@
+"""
+Generates accented_table.py, the lookup table from every numbered sound to its accented form.
+
+The input space is finite: every syllable in SYLLABLES, with a lower or upper case first letter
+(as matched by pinyin_regex), ü spelled ü, v or u:, and tones 1-5.
+Run `python -m pinyin_markdown.build_tables` after changing SYLLABLES or VOWEL_MAP and commit the table:
+test_accented_table fails while it is out of date.
+"""
+from os import path
+
+from pinyin_markdown.numbered_accented import numbered_syllable_to_accented
+from pinyin_markdown.pinyin_regex import SYLLABLES
+from pinyin_markdown.syllable_trie import spellings
+
+TABLE_PATH = path.join(path.dirname(path.abspath(__file__)), 'accented_table.py')
+
+HEADER = '''# coding: utf-8
+# Generated by pinyin_markdown/build_tables.py from SYLLABLES and VOWEL_MAP. Do not edit.
+# Maps each numbered sound (syllable + tone) to its accented form
+'''
+
+
+def generate():
+    """
+    :return: dict of numbered sound => accented
+    :raises ValueError: if a toned syllable can't be accented
+    """
+    table = {}
+    for syllable in SYLLABLES:
+        for spelling in spellings(syllable):
+            for tone in '12345':
+                sound = spelling + tone
+                accented = numbered_syllable_to_accented(sound)
+                if accented == sound:
+                    raise ValueError("Pinyin conversion error: " + sound)
+                table[sound] = accented
+    return table
+
+
+def render(table):
+    lines = [HEADER, 'ACCENTED = {']
+    lines.extend('    {!r}: {!r},'.format(sound, table[sound]) for sound in sorted(table))
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def main(target=TABLE_PATH):
+    with open(target, 'w', encoding='utf8') as f:
+        f.write(render(generate()))
+
+
+if __name__ == '__main__':
+    main()
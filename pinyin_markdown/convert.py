@@ -0,0 +1,177 @@
+"""
+Converts numbered pinyin in plain text, without building a Markdown instance or an ElementTree.
+
+For flashcard exports, subtitles, JSON payloads and anything else which isn't Markdown:
+
+    >>> convert('Xi3an4 yi1dian3r')
+    "Xǐ'àn yīdiǎnr"
+    >>> for chunk in iter_convert(open('subtitles.srt', encoding='utf8'), mode='html'):
+    ...     out.write(chunk)
+
+Text around the pinyin is passed through unchanged.
+"""
+from html import escape
+
+from pinyin_markdown import tokens
+from pinyin_markdown.encoders import ENCODERS, encoded_table
+from pinyin_markdown.syllable_trie import trie, could_be_in_word
+
+MODES = ('text', 'entities', 'html')
+# A pinyin word can't be longer than the run of letters, digits and colons which holds it.
+# Runs longer than this are passed through unchanged when streaming, so that memory stays bounded.
+MAX_WORD_LENGTH = 4096
+
+
+class PinyinConverter(object):
+    """
+    Converts numbered pinyin to one of the output modes:
+        text: Xǐ'àn
+        entities: X&#464;'&#224;n
+        html: <span class="tone3">Xǐ</span><span class="pyap">'</span><span class="tone4">àn</span>
+    The class options have the same meaning as the PinyinExtension config, and only affect html.
+    The encoder option (see encoders.ENCODERS) applies to every mode; entities=True or the entities mode
+    mean encoder='entities'.
+    """
+
+    def __init__(self, mode='text', tone_class='tone{}', erhua_class='erhua', apostrophe_class='pyap',
+                 entities=False, encoder='nfc', max_word_length=MAX_WORD_LENGTH):
+        if mode not in MODES:
+            raise ValueError("Unknown output mode '{}'. Choose from {}".format(mode, MODES))
+        if entities or mode == 'entities':
+            encoder = 'entities'
+        if encoder not in ENCODERS:
+            raise ValueError("Unknown encoder '{}'. Choose from {}".format(encoder, ENCODERS))
+        self.mode = mode
+        self.accented = encoded_table(encoder)
+        self.trie = trie()
+        self.max_word_length = max_word_length
+        if mode == 'html':
+            self.tone_spans = {tone: self._span_format(tone_class.format(tone) if tone_class is not None else None)
+                               for tone in '12345'}
+            self.erhua_span = self._span_format(erhua_class).format("r")
+            self.apostrophe_span = self._span_format(apostrophe_class).format("'")
+
+    @staticmethod
+    def _span_format(cls):
+        if cls is None or len(cls) == 0:
+            return '<span>{}</span>'
+        return '<span class="' + escape(cls).replace('{', '{{').replace('}', '}}') + '">{}</span>'
+
+    def render_word(self, sounds):
+        """
+        :param sounds: the sounds of one word, as found by split_syllables: ['yi1', 'dian3', 'r']
+        :return: the converted word
+        """
+        accented = self.accented
+        if self.mode != 'html':
+            out = []
+            for i, sound in enumerate(sounds):
+                if sound == 'r':
+                    out.append('r')
+                else:
+                    if i > 0 and sound[0] in 'aeo':
+                        out.append("'")
+                    out.append(accented[sound])
+            return ''.join(out)
+
+        out = []
+        for i, sound in enumerate(sounds):
+            if sound == 'r':
+                out.append(self.erhua_span)
+            else:
+                if i > 0 and sound[0] in 'aeo':
+                    out.append(self.apostrophe_span)
+                out.append(self.tone_spans[sound[-1]].format(accented[sound]))
+        return ''.join(out)
+
+    def render_tokens(self, stream):
+        """
+        :param stream: tokens.TokenStream, e.g. from tokens.tokenize(text)
+        :return: the converted text, the same as convert(text)
+        """
+        accented = self.accented
+        html = self.mode == 'html'
+        out = []
+        for i in range(len(stream)):
+            kind = stream.kinds[i]
+            if kind == tokens.TEXT:
+                out.append(stream.source(i))
+            elif kind == tokens.ERHUA:
+                out.append(self.erhua_span if html else 'r')
+            else:
+                if stream.needs_apostrophe(i):
+                    out.append(self.apostrophe_span if html else "'")
+                text = accented[stream.sound(i)]
+                out.append(self.tone_spans[str(stream.tones[i])].format(text) if html else text)
+        return ''.join(out)
+
+    def convert(self, text):
+        """:return: text with every numbered pinyin word converted"""
+        out = []
+        last = 0
+        for m in self.trie.finditer(text):
+            out.append(text[last:m.start()])
+            out.append(self.render_word(m.sounds))
+            last = m.end()
+        out.append(text[last:])
+        return ''.join(out)
+
+    def iter_convert(self, chunks):
+        """
+        Converts a stream of text, such as a file opened in text mode, one chunk at a time.
+        A word split across chunks (zhua + ng4) is held back until it is complete,
+        so the output joined together is the same as converting the joined input.
+        :param chunks: iterable of str, or a single str
+        :return: generator of converted str
+        """
+        if isinstance(chunks, str):
+            chunks = (chunks,)
+        carry = ''
+        skipping = False  # Inside a run too long to be held back, which is passed through
+        for chunk in chunks:
+            if skipping:
+                i = 0
+                while i < len(chunk) and could_be_in_word(chunk[i]):
+                    i += 1
+                if i == len(chunk):
+                    yield chunk
+                    continue
+                yield chunk[:i]
+                chunk = chunk[i:]
+                skipping = False
+
+            buffer = carry + chunk
+            # Hold back the trailing run which the next chunk could continue
+            k = len(buffer)
+            while k > 0 and could_be_in_word(buffer[k - 1]):
+                k -= 1
+            if len(buffer) - k > self.max_word_length:
+                converted = self.convert(buffer[:k])
+                if converted:
+                    yield converted
+                yield buffer[k:]
+                carry = ''
+                skipping = True
+                continue
+            converted = self.convert(buffer[:k])
+            if converted:
+                yield converted
+            carry = buffer[k:]
+        if carry:
+            yield self.convert(carry)
+
+
+def convert(text, mode='text', **options):
+    """
+    Converts the numbered pinyin in a string. See PinyinConverter for the modes and options.
+    convert('ni3hao3') => 'nǐhǎo'
+    """
+    return PinyinConverter(mode, **options).convert(text)
+
+
+def iter_convert(chunks, mode='text', **options):
+    """
+    Converts the numbered pinyin in a string or an iterable of chunks, yielding converted text as it goes.
+    Memory use is bounded by the chunk size. See PinyinConverter for the modes and options.
+    """
+    return PinyinConverter(mode, **options).iter_convert(chunks)
@@ -0,0 +1,225 @@
+"""
+Counts syllables, tones and erhua across large corpora of numbered pinyin text.
+
+    >>> counts = scan_files(['graded/level1.txt', 'graded/level2.txt'], workers=4)
+    >>> counts.count('ni', 3), counts.tone_totals(), counts.erhua
+    >>> print(counts.megabytes_per_second)
+
+    python -m pinyin_markdown.corpus graded/*.txt -j 4 --json counts.json
+
+Pinyin words are found exactly as the trie engine finds them. The text is first split into runs of word
+characters (and u: colons) by a regex, which runs at C speed, and the runs are counted with a Counter;
+only distinct runs are split into sounds, with a cache, as real corpora repeat the same words endlessly.
+Counts are kept in one array of len(SYLLABLES) * 5 ints, indexed by position in SYLLABLES * 5 + tone - 1.
+"""
+import argparse
+import functools
+import json
+import re
+import sys
+import time
+from array import array
+from collections import Counter
+from multiprocessing import Pool
+
+from pinyin_markdown.pinyin_regex import SYLLABLES
+from pinyin_markdown.syllable_trie import trie, could_be_in_word, spellings, TONES
+
+CHUNK_SIZE = 1 << 20
+# The runs of text which hold whole pinyin words: u: keeps its colon, any other colon separates words
+_RUNS = re.compile(r'\w+(?::\w+)*')
+_HAS_TONE = re.compile('[1-5]')
+
+
+@functools.lru_cache(maxsize=None)
+def sound_indexes():
+    """:return: dict of every spelling of a sound => its index in the counts: 'Lv3' => SYLLABLES.index('lü') * 5 + 2"""
+    indexes = {}
+    for i, syllable in enumerate(SYLLABLES):
+        for spelling in spellings(syllable):
+            for tone in TONES:
+                indexes[spelling + tone] = i * 5 + int(tone) - 1
+    return indexes
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def run_sounds(run):
+    """:return: (number of pinyin words, tuple of the count indexes of their sounds, -1 for erhua) in a run"""
+    if _HAS_TONE.search(run) is None:
+        return 0, ()
+    indexes = sound_indexes()
+    sounds = trie().split_syllables(run)
+    if sounds:
+        # Usually the whole run is one word
+        words = [sounds]
+    else:
+        words = [m.sounds for m in trie().finditer(run)]
+    return len(words), tuple(-1 if sound == 'r' else indexes[sound] for sounds in words for sound in sounds)
+
+
+class SyllableCounts(object):
+    """Counts of each syllable in each tone, plus erhua, words and the bytes scanned"""
+
+    def __init__(self):
+        self.counts = array('Q', bytes(8 * len(SYLLABLES) * 5))
+        self.erhua = 0
+        self.words = 0
+        self.bytes = 0
+        self.seconds = 0.0
+
+    def add_runs(self, runs):
+        """:param runs: Counter of runs of text => number of times seen"""
+        counts = self.counts
+        for run, times in runs.items():
+            words, sounds = run_sounds(run)
+            if not words:
+                continue
+            self.words += words * times
+            for index in sounds:
+                if index < 0:
+                    self.erhua += times
+                else:
+                    counts[index] += times
+
+    def merge(self, other):
+        """Adds the counts of other, e.g. from another worker, to these. :return: self"""
+        counts = self.counts
+        for index, value in enumerate(other.counts):
+            if value:
+                counts[index] += value
+        self.erhua += other.erhua
+        self.words += other.words
+        self.bytes += other.bytes
+        self.seconds = max(self.seconds, other.seconds)
+        return self
+
+    def count(self, syllable, tone):
+        """:return: the number of times syllable (as in SYLLABLES, e.g. 'lü') was seen in tone 1-5"""
+        return self.counts[SYLLABLES.index(syllable) * 5 + int(tone) - 1]
+
+    def syllable_totals(self):
+        """:return: dict of syllable => count in every tone, without the syllables never seen"""
+        counts = self.counts
+        totals = {}
+        for i, syllable in enumerate(SYLLABLES):
+            total = sum(counts[i * 5:i * 5 + 5])
+            if total:
+                totals[syllable] = total
+        return totals
+
+    def tone_totals(self):
+        """:return: list of the counts of tones 1-5"""
+        return [sum(self.counts[tone::5]) for tone in range(5)]
+
+    def most_common(self, n=None):
+        """:return: list of ((syllable, tone), count), most common first"""
+        found = [((SYLLABLES[index // 5], index % 5 + 1), value) for index, value in enumerate(self.counts) if value]
+        found.sort(key=lambda item: -item[1])
+        return found[:n] if n is not None else found
+
+    @property
+    def megabytes_per_second(self):
+        return self.bytes / 1e6 / self.seconds if self.seconds else 0.0
+
+    def as_dict(self):
+        return {
+            'syllables': {'{}{}'.format(*sound): value for sound, value in self.most_common()},
+            'tones': self.tone_totals(),
+            'erhua': self.erhua,
+            'words': self.words,
+            'bytes': self.bytes,
+            'seconds': self.seconds,
+        }
+
+    def __str__(self):
+        return '{} words, {} syllables, {} erhua in {:.1f} MB: {:.2f} MB/s'.format(
+            self.words, sum(self.counts), self.erhua, self.bytes / 1e6, self.megabytes_per_second)
+
+
+def iter_runs(chunks):
+    """
+    Counts the runs in a stream of text, holding back a run which the next chunk could continue.
+    :return: generator of a Counter of runs => times seen, per chunk
+    """
+    carry = ''
+    for chunk in chunks:
+        buffer = carry + chunk
+        k = len(buffer)
+        while k > 0 and could_be_in_word(buffer[k - 1]):
+            k -= 1
+        if k == 0 and len(buffer) > CHUNK_SIZE:
+            k = len(buffer)  # One enormous run: count it rather than hold it all
+        yield Counter(_RUNS.findall(buffer, 0, k))
+        carry = buffer[k:]
+    if carry:
+        yield Counter(_RUNS.findall(carry))
+
+
+def scan_text(chunks, counts=None):
+    """
+    :param chunks: a str, or an iterable of str such as a file opened in text mode
+    :return: SyllableCounts, counts if given
+    """
+    if counts is None:
+        counts = SyllableCounts()
+    if isinstance(chunks, str):
+        chunks = (chunks,)
+    start = time.perf_counter()
+    for runs in iter_runs(chunks):
+        counts.add_runs(runs)
+    counts.seconds += time.perf_counter() - start
+    return counts
+
+
+def scan_file(path, chunk_size=CHUNK_SIZE):
+    """:return: SyllableCounts of a UTF-8 file, read chunk_size characters at a time"""
+    counts = SyllableCounts()
+    start = time.perf_counter()
+    with open(path, encoding='utf8', errors='replace') as f:
+        scan_text(iter(functools.partial(f.read, chunk_size), ''), counts)
+        counts.bytes = f.buffer.tell()
+    counts.seconds = time.perf_counter() - start
+    return counts
+
+
+def scan_files(paths, workers=None):
+    """
+    Scans files in parallel and merges the counts of the workers.
+    :param workers: number of processes, default os.cpu_count(). 1 scans in this process.
+    :return: SyllableCounts, with seconds the wall time of the whole scan
+    """
+    start = time.perf_counter()
+    total = SyllableCounts()
+    if workers == 1:
+        for path in paths:
+            total.merge(scan_file(path))
+    else:
+        with Pool(workers) as pool:
+            for counts in pool.imap_unordered(scan_file, paths):
+                total.merge(counts)
+    total.seconds = time.perf_counter() - start
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m pinyin_markdown.corpus',
+                                     description='Count syllables, tones and erhua in numbered pinyin text files')
+    parser.add_argument('files', nargs='+', help='UTF-8 text files')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='Worker processes - Default: number of CPUs')
+    parser.add_argument('-n', '--top', type=int, default=20, help='Number of the most common sounds to print')
+    parser.add_argument('--json', help='Write every count to this JSON file')
+    args = parser.parse_args(argv)
+
+    counts = scan_files(args.files, args.jobs)
+    print(counts)
+    print('Tones 1-5: ' + ' '.join(str(total) for total in counts.tone_totals()))
+    for (syllable, tone), value in counts.most_common(args.top):
+        print('{:<8}{:>12}'.format(syllable + str(tone), value))
+    if args.json:
+        with open(args.json, 'w', encoding='utf8') as f:
+            json.dump(counts.as_dict(), f, ensure_ascii=False, indent=1)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+Persistent cache of rendered documents in an SQLite file, shared by every process on the machine.
+
+    >>> renderer = PinyinRenderer(cache=RenderCache('/var/cache/lessons.sqlite'), tone_class='t{}')
+    >>> html = renderer.convert(text)  # Rendered once per deployment, not once per worker
+
+Entries are keyed by a hash of the source text, the options, the other extensions and the package version,
+so a key always maps to the same HTML and a new release never serves old output.
+SQLite in WAL mode lets any number of processes read while one writes. When the cache grows past max_bytes,
+the least recently used entries are deleted.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from pinyin_markdown import __version__
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Reads only refresh an entry's last use when it is older than this, so that reads rarely write
+_TOUCH_SECONDS = 60
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS renders (key BLOB PRIMARY KEY, html TEXT NOT NULL, size INTEGER NOT NULL,
+                                    used REAL NOT NULL);
+CREATE INDEX IF NOT EXISTS renders_used ON renders (used);
+CREATE TABLE IF NOT EXISTS total (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL);
+INSERT OR IGNORE INTO total VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS renders_insert AFTER INSERT ON renders
+    BEGIN UPDATE total SET size = size + new.size; END;
+CREATE TRIGGER IF NOT EXISTS renders_delete AFTER DELETE ON renders
+    BEGIN UPDATE total SET size = size - old.size; END;
+'''
+
+
+def config_salt(config, extensions=()):
+    """:return: bytes identifying everything besides the source text which changes the HTML"""
+    return json.dumps([sorted(config.items()), list(extensions), __version__]).encode('utf8')
+
+
+def render_key(text, salt):
+    return hashlib.sha256(salt + b'\0' + text.encode('utf8')).digest()
+
+
+class RenderCache(object):
+    """
+    An SQLite file of rendered HTML. Safe to use from many threads and processes at once:
+    each thread of each process has its own connection.
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES, timeout=30.0):
+        """
+        :param path: the SQLite file, created if missing
+        :param max_bytes: total size of the HTML to keep
+        :param timeout: seconds to wait for another process's write to finish
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.local = threading.local()
+        self._connect()
+
+    def _connect(self):
+        """:return: this thread's connection, made again in a forked child"""
+        connection = getattr(self.local, 'connection', None)
+        if connection is not None and self.local.pid == os.getpid():
+            return connection
+        connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.executescript(_SCHEMA)
+        self.local.connection = connection
+        self.local.pid = os.getpid()
+        return connection
+
+    def get(self, key):
+        """:return: the HTML stored under key, or None"""
+        connection = self._connect()
+        row = connection.execute('SELECT html, used FROM renders WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if row[1] < now - _TOUCH_SECONDS:
+            connection.execute('UPDATE renders SET used = ? WHERE key = ?', (now, key))
+        return row[0]
+
+    def put(self, key, html):
+        """Stores html under key, then deletes the least recently used entries while over max_bytes"""
+        connection = self._connect()
+        size = len(html.encode('utf8'))
+        with _transaction(connection):
+            connection.execute('INSERT OR IGNORE INTO renders VALUES (?, ?, ?, ?)', (key, html, size, time.time()))
+            total = connection.execute('SELECT size FROM total').fetchone()[0]
+            while total > self.max_bytes:
+                row = connection.execute('SELECT key, size FROM renders ORDER BY used, rowid LIMIT 1').fetchone()
+                if row is None:
+                    break
+                connection.execute('DELETE FROM renders WHERE key = ?', (row[0],))
+                total -= row[1]
+
+    def total_bytes(self):
+        return self._connect().execute('SELECT size FROM total').fetchone()[0]
+
+    def __len__(self):
+        return self._connect().execute('SELECT COUNT(*) FROM renders').fetchone()[0]
+
+    def clear(self):
+        self._connect().execute('DELETE FROM renders')
+
+
+class _transaction(object):
+    """BEGIN IMMEDIATE ... COMMIT, or ROLLBACK on an exception. Takes the write lock at the start."""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        self.connection.execute('BEGIN IMMEDIATE')
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.connection.execute('COMMIT' if exc_type is None else 'ROLLBACK')
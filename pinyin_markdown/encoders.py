@@ -0,0 +1,75 @@
+"""
+Output encoders for accented pinyin, selected with the `encoder` option:
+    nfc: precomposed characters, as in VOWEL_MAP: lǚ
+    nfd: base letters followed by combining marks: lu + U+0308 + U+030C
+    entities: a numeric HTML entity for every non-ASCII character: l&#474;
+    named: a named HTML entity where there is one, like &uuml; or &amacr;, otherwise numeric
+
+Each encoder works on a whole string in one C-level pass (str.translate or unicodedata.normalize).
+encoded_table() applies it once to every syllable in the generated accent table, so rendering
+only has to look the encoded syllable up.
+"""
+import functools
+import unicodedata
+
+from pinyin_markdown.numbered_accented import VOWEL_MAP, accented_table
+
+ENCODERS = ('nfc', 'nfd', 'entities', 'named')
+
+
+class _NumericEntities(dict):
+    """str.translate table giving every non-ASCII character a numeric entity. ASCII maps to itself."""
+
+    def __init__(self):
+        super(_NumericEntities, self).__init__((i, i) for i in range(128))
+
+    def __missing__(self, codepoint):
+        entity = self[codepoint] = '&#{};'.format(codepoint)
+        return entity
+
+
+class _NamedEntities(_NumericEntities):
+    """Like _NumericEntities, but uses the HTML entity name when there is one"""
+
+    def __init__(self):
+        from html.entities import codepoint2name, html5
+        super(_NamedEntities, self).__init__()
+        names = {}
+        for name, character in sorted(html5.items()):
+            if name.endswith(';') and len(character) == 1 and ord(character) > 127:
+                names.setdefault(ord(character), name)
+        names.update((codepoint, name + ';') for codepoint, name in codepoint2name.items() if codepoint > 127)
+        accented = set(VOWEL_MAP.values())
+        accented.update(c.upper() for c in VOWEL_MAP.values())
+        self.update((ord(c), '&' + names[ord(c)]) for c in accented if ord(c) in names)
+
+
+_TRANSLATIONS = {
+    'entities': _NumericEntities,
+    'named': _NamedEntities,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def translation_table(encoder):
+    """:return: the str.translate table for an entity encoder, built on first use"""
+    return _TRANSLATIONS[encoder]()
+
+
+def encode(text, encoder):
+    """
+    :param text: accented pinyin
+    :param encoder: one of ENCODERS
+    :return: the encoded text
+    """
+    if encoder in _TRANSLATIONS:
+        return text.translate(translation_table(encoder))
+    if encoder in ('nfc', 'nfd'):
+        return unicodedata.normalize(encoder.upper(), text)
+    raise ValueError("Unknown encoder '{}'. Choose from {}".format(encoder, ENCODERS))
+
+
+@functools.lru_cache(maxsize=None)
+def encoded_table(encoder):
+    """:return: dict of every numbered sound => accented and encoded syllable, made on first use"""
+    return {sound: encode(accented, encoder) for sound, accented in accented_table().items()}
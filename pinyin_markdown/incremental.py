@@ -0,0 +1,80 @@
+"""
+Re-renders only the blocks of a document which changed since the last render, for live previews.
+
+    >>> renderer = IncrementalRenderer(tone_class='t{}')
+    >>> result = renderer.render(text)
+    >>> result.html, result.reused, result.rendered
+
+The document is split into top-level blocks (see blocks.py) and the HTML of each block is cached under a hash
+of its source, the reference link definitions of the document and the options. Extensions which gather content
+from across the document (footnotes, toc, abbr) need a full render instead.
+"""
+import hashlib
+from collections import OrderedDict
+
+from markdown import Markdown
+from pinyin_markdown import disk_cache
+from pinyin_markdown.blocks import split_blocks, references
+from pinyin_markdown.pinyinextension import PinyinExtension
+
+DEFAULT_MAX_BLOCKS = 4096
+
+
+class RenderResult(object):
+    def __init__(self, html, reused, rendered):
+        self.html = html
+        self.reused = reused
+        self.rendered = rendered
+
+    def __str__(self):
+        return '{} blocks reused, {} rendered'.format(self.reused, self.rendered)
+
+
+class IncrementalRenderer(object):
+    """
+    Renders Markdown with PinyinExtension, block by block, keeping the HTML of the most recently used blocks.
+    Not thread safe: use one renderer per editor.
+    """
+
+    def __init__(self, extensions=(), max_blocks=DEFAULT_MAX_BLOCKS, **config):
+        """
+        :param extensions: other Markdown extensions, by name
+        :param max_blocks: number of rendered blocks to keep
+        :param config: PinyinExtension config
+        """
+        self.markdown = Markdown(extensions=[PinyinExtension(**config)] + list(extensions))
+        # Reference definitions in fenced code only don't count when the extension is loaded (also by extra)
+        self.fenced = 'fenced_code_block' in self.markdown.preprocessors
+        self.max_blocks = max_blocks
+        self.salt = disk_cache.config_salt(config, extensions)
+        self.blocks = OrderedDict()
+
+    def _key(self, refs, block):
+        return hashlib.sha256(self.salt + refs.encode('utf8') + b'\0' + block.encode('utf8')).digest()
+
+    def render(self, text):
+        """
+        :param text: the whole Markdown document
+        :return: RenderResult. The html is the same as Markdown.convert would give.
+        """
+        refs = references(text, self.fenced)
+        out = []
+        reused = rendered = 0
+        for block in split_blocks(text):
+            key = self._key(refs, block)
+            html = self.blocks.get(key)
+            if html is None:
+                html = self.markdown.reset().convert(refs + block)
+                rendered += 1
+            else:
+                self.blocks.move_to_end(key)
+                reused += 1
+            self.blocks[key] = html
+            if html:
+                out.append(html)
+        while len(self.blocks) > self.max_blocks:
+            self.blocks.popitem(last=False)
+        return RenderResult('\n'.join(out), reused, rendered)
+
+    def clear(self):
+        self.blocks.clear()
@@ -14,6 +14,15 @@ VOWEL_MAP = {
 }
 
 
+def accented_table():
+    """
+    :return: the generated dict of every numbered sound => accented syllable.
+             accented_table.py is only imported on first use.
+    """
+    from pinyin_markdown.accented_table import ACCENTED
+    return ACCENTED
+
+
 def _num_vowel_to_acc(vowel, tone):
     """Convert a numbered vowel to an accented vowel."""
     try:
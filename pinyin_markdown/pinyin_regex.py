@@ -1,3 +1,4 @@
+import functools
 import re
 
 # 410 SYLLABLES, copied from https://github.com/tsroten/zhon
@@ -32,6 +33,7 @@ SYLLABLES = ['a', 'ai', 'an', 'ang', 'ao', 'ba', 'bai', 'ban', 'bang', 'bao', 'b
              'zu', 'zuan', 'zui', 'zun', 'zuo']
 
 
+@functools.lru_cache(maxsize=None)
 def _joined_syllables_re():
     # yi => [yY]i
     # nü => n(?:ü|u\:|v)
@@ -56,9 +58,25 @@ def _polysyllabic_word_re_str():
     return '\\b((?:{})+r?)\\b'.format(toned_syllable)
 
 
-# This is the string which becomes the regex which searches for pinyin words
-POLYSYLLABIC_REGEX_STR = _polysyllabic_word_re_str()
-_SOUND_SPLITTER = _sounds_re(True)
+# The 410-alternative patterns are only built on first use, then shared by the whole process,
+# so importing the package (e.g. in a CLI which never renders pinyin) stays cheap.
+@functools.lru_cache(maxsize=None)
+def polysyllabic_regex_str():
+    """:return: the string which becomes the regex which searches for pinyin words"""
+    return _polysyllabic_word_re_str()
+
+
+@functools.lru_cache(maxsize=None)
+def sound_splitter():
+    """:return: the compiled regex which finds the sounds in a word"""
+    return _sounds_re(True)
+
+
+def __getattr__(name):
+    """POLYSYLLABIC_REGEX_STR is still available as a module attribute, built when first accessed"""
+    if name == 'POLYSYLLABIC_REGEX_STR':
+        return polysyllabic_regex_str()
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
 
 
 def split_syllables(poly):
@@ -69,4 +87,4 @@ def split_syllables(poly):
     :param poly: A pinyin word made of concatenated tone-numbered pinyin syllables
     :return: list of sounds in word
     """
-    return _SOUND_SPLITTER.findall(poly)
+    return sound_splitter().findall(poly)
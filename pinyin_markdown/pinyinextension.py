@@ -1,41 +1,155 @@
+import re
+import time
+import xml.etree.ElementTree as etree
+
 from markdown.extensions import Extension
-from markdown.inlinepatterns import Pattern
+from markdown.inlinepatterns import InlineProcessor
+from markdown.postprocessors import Postprocessor
+from markdown.preprocessors import Preprocessor
 from markdown.treeprocessors import Treeprocessor
-from markdown.util import etree
-from pinyin_markdown import pinyin_regex, numbered_accented
-
-JUNK_TAG = "junkpinyinmd"
-
-
-# Seriously there must be a better way of adding multiple
-class RemoveJunkParentTreeprocessor(Treeprocessor):
-    """Removes the <junkpinyinmd> tag and puts the pinyin <span>s under the parent <p>"""
-
-    def run(self, root: etree.Element):
-        junk_parents = root.findall('.//{}/..'.format(JUNK_TAG))
-        for parent in junk_parents:
-            i = 0
-            while i < len(parent):
-                junk = parent[i]
-                if junk.tag == JUNK_TAG:
-                    parent.remove(junk)
-                    last = True
-                    for accented_span in reversed(junk):
-                        parent.insert(i, accented_span)
-                        if last:
-                            accented_span.tail = junk.tail  # Remainder of surrounding <p>
-                            last = False
-                i += 1
-
-
-class NumberedPinyinPattern(Pattern):
-    def __init__(self, *args, **kwargs):
-        tone_cls = kwargs.pop('tone_class')
-        self.tone_class = (lambda tone: tone_cls.format(tone)) if tone_cls is not None else lambda x: None
+from markdown.serializers import _escape_cdata
+from markdown.util import AtomicString, STX, ETX
+from pinyin_markdown import pinyin_regex, syllable_trie, word_cache, encoders, stats, registry
+
+ENGINES = ('regex', 'trie', 'postprocess')
+GRANULARITIES = ('syllable', 'word', 'none')
+
+
+class UntagWordsTreeprocessor(Treeprocessor):
+    """
+    Clears the tag of each pinyin word element, so the serializer writes its <span>s straight into the parent <p>.
+    Markdown's inline processor and other extensions' treeprocessors (e.g. toc) expect every element to have a tag,
+    so this runs last. Only the words made by the pattern are visited, never the whole tree.
+    """
+
+    def __init__(self, md, pattern):
+        super(UntagWordsTreeprocessor, self).__init__(md)
+        self.pattern = pattern
+
+    def run(self, root):
+        for word in self.pattern.words:
+            word.tag = None
+        del self.pattern.words[:]
+
+
+class _CandidateGate(object):
+    """
+    Wraps the compiled word finder (the regex or the syllable trie) with a cheap pre-check:
+    a text node without a tone number 1-5 can't contain any pinyin, so the expensive search is skipped.
+    """
+    TONE = re.compile('[1-5]')
+
+    def __init__(self, finder):
+        self.finder = finder
+
+    def finditer(self, text, pos=0):
+        if self.TONE.search(text, pos) is None:
+            return iter(())
+        return self.finder.finditer(text, pos)
+
+
+class _BudgetGate(_CandidateGate):
+    """
+    A _CandidateGate which stops finding pinyin, leaving the rest of the document as it is, when the document is
+    longer than max_document_size characters or its render has taken longer than time_budget seconds.
+    The deadline is checked before every search and, by the trie, during it, so a single long search can't
+    outlast the budget. The regex engine can only be stopped between its matches.
+    BudgetPreprocessor starts the budget of each document.
+    """
+
+    def __init__(self, finder, max_document_size, time_budget):
+        super(_BudgetGate, self).__init__(finder)
+        self.max_document_size = max_document_size
+        self.time_budget = time_budget
+        self.deadline = None
+        self.exceeded = False
+
+    def start(self, size):
+        self.exceeded = bool(self.max_document_size) and size > self.max_document_size
+        self.deadline = time.perf_counter() + self.time_budget if self.time_budget else None
+
+    def finditer(self, text, pos=0):
+        if not self.exceeded and self.deadline is not None and time.perf_counter() > self.deadline:
+            self.exceeded = True
+        if self.exceeded:
+            return iter(())
+        if self.deadline is None or not isinstance(self.finder, syllable_trie.SyllableTrie):
+            return super(_BudgetGate, self).finditer(text, pos)
+        if self.TONE.search(text, pos) is None:
+            return iter(())
+        return self._finditer_before_deadline(text, pos)
+
+    def _finditer_before_deadline(self, text, pos):
+        for m in self.finder.finditer(text, pos, deadline=self.deadline):
+            yield m
+        if time.perf_counter() > self.deadline:
+            self.exceeded = True
+
+
+class BudgetPreprocessor(Preprocessor):
+    """Runs first, to measure the document and start the clock of the pattern's _BudgetGate"""
+
+    def __init__(self, md, gate):
+        super(BudgetPreprocessor, self).__init__(md)
+        self.gate = gate
+
+    def run(self, lines):
+        self.gate.start(sum(len(line) + 1 for line in lines))
+        return lines
+
+
+class NumberedPinyinPattern(InlineProcessor):
+    def __init__(self, pattern, md=None, **kwargs):
+        engine = kwargs.pop('engine', 'trie')
+        if engine not in ENGINES:
+            raise ValueError("Unknown pinyin engine '{}'. Choose from {}".format(engine, ENGINES))
+        self.engine = engine
+        self.granularity = kwargs.pop('granularity', 'syllable')
+        if self.granularity not in GRANULARITIES:
+            raise ValueError("Unknown granularity '{}'. Choose from {}".format(self.granularity, GRANULARITIES))
+        self.tone_class = kwargs.pop('tone_class')
         self.erhua_class = kwargs.pop('erhua_class')
         self.apostrophe_class = kwargs.pop('apostrophe_class')
+        encoder = kwargs.pop('encoder', 'nfc')
         self.entities = kwargs.pop('entities')
-        super(NumberedPinyinPattern, self).__init__(*args, **kwargs)
+        self.encoder = 'entities' if self.entities else encoder
+        if self.encoder not in encoders.ENCODERS:
+            raise ValueError("Unknown encoder '{}'. Choose from {}".format(self.encoder, encoders.ENCODERS))
+        self.cache = word_cache.word_cache(int(kwargs.pop('cache_size', word_cache.DEFAULT_SIZE)))
+        max_document_size = int(kwargs.pop('max_document_size', 0))
+        time_budget = float(kwargs.pop('time_budget', 0))
+        self.words = []  # Word elements made since the last UntagWordsTreeprocessor run
+        # An empty pattern, as InlineProcessor.__init__ would compile the real one, only for the gate to replace it
+        super(NumberedPinyinPattern, self).__init__('', md)
+        self.pattern = pattern
+        finder = registry.finder(engine, pattern)
+        if max_document_size or time_budget:
+            self.gate = _BudgetGate(finder, max_document_size, time_budget)
+        else:
+            self.gate = _CandidateGate(finder)
+        self.compiled_re = self.gate
+
+    def budget_exceeded(self):
+        """:return: whether the pinyin of the last document was left unconverted because it was over budget"""
+        return getattr(self.gate, 'exceeded', False)
+
+    @staticmethod
+    def sounds(m):
+        """The trie engine has already split the word while finding it"""
+        if isinstance(m, syllable_trie.WordMatch):
+            return m.sounds
+        return pinyin_regex.split_syllables(m.group(1))
+
+    def prepare(self, m):
+        """:return: tuple of (text, class) for each span of the matched word, from the word cache if enabled"""
+        if self.cache is not None:
+            return self.cache(m.group(1), self.tone_class, self.erhua_class, self.apostrophe_class, self.encoder)
+        return word_cache.prepare_word(self.sounds(m), self.tone_class, self.erhua_class, self.apostrophe_class,
+                                       self.encoder)
+
+    def cache_info(self):
+        """:return: hits, misses, maxsize and currsize of the shared word cache, or None if disabled"""
+        return self.cache.cache_info() if self.cache is not None else None
 
     @staticmethod
     def make_span(parent, text, cls):
@@ -47,35 +161,186 @@ class NumberedPinyinPattern(Pattern):
 
     @staticmethod
     def convert_to_entities(accented):
-        for c in accented:
-            if ord(c) > 122:  # Z is 122
-                return accented.replace(c, '&#{};'.format(ord(c)))
-        return accented
+        return encoders.encode(accented, 'entities')
 
-    def handleMatch(self, m):
+    def handleMatch(self, m, data):
         """
         Makes an ElementTree for the discovered Pinyin syllables.
-        The root element holding all syllables is <junkpinyinmd>, which is removed by RemoveJunkParentTreeprocessor
-        Converts Xi3ban4 to <junkpinyinmd><span class="tone3">Xǐ</span><span class="tone4">bàn</span></junkpinyinmd>
-        :param m: polysyllabic_chinese_word = m.group(2)
-        :return: etree
+        The element holding all syllables loses its tag in UntagWordsTreeprocessor, leaving just the <span>s
+        Converts Xi3ban4 to <span class="tone3">Xǐ</span><span class="tone4">bàn</span>
+        With granularity 'word': <span data-tones="34">Xǐbàn</span>
+        With granularity 'none': the text Xǐbàn
+        :param m: polysyllabic_chinese_word = m.group(1)
+        :param data: the text being searched
+        :return: etree (or str), start and end of the word in data
+        """
+        spans = self.prepare(m)
+        if self.granularity == 'none':
+            return ''.join(text for text, cls in spans), m.start(0), m.end(0)
+        if self.granularity == 'word':
+            word = etree.Element('span')
+            word.text = ''.join(text for text, cls in spans)
+            # Syllables never contain digits, so the digits of the word are its tones
+            word.set('data-tones', ''.join(c for c in m.group(1) if c in syllable_trie.TONES))
+            return word, m.start(0), m.end(0)
+
+        parent = etree.Element('span')
+        self.words.append(parent)
+        for text, cls in spans:
+            self.make_span(parent, text, cls)
+        return parent, m.start(0), m.end(0)
+
+    def render_html(self, m):
+        """:return: the serialized HTML of what handleMatch makes for the matched word, as a str"""
+        spans = self.prepare(m)
+        if self.granularity == 'none':
+            return ''.join(text for text, cls in spans)
+        if self.granularity == 'word':
+            return '<span data-tones="{}">{}</span>'.format(
+                ''.join(c for c in m.group(1) if c in syllable_trie.TONES), ''.join(text for text, cls in spans))
+        return ''.join('<span class="{}">{}</span>'.format(_escape_attribute(cls), text) if cls else
+                       '<span>{}</span>'.format(text) for text, cls in spans)
+
+
+def _escape_attribute(value):
+    """Escapes an attribute value as ElementTree serialization does"""
+    return value.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
+
+
+class StashAtomicTreeprocessor(Treeprocessor):
+    """
+    For the postprocess engine, puts what the inline engine never searches in Markdown's stash of raw HTML,
+    which is only restored after PinyinPostprocessor has run: atomic text like the text of autolinks, and the
+    characters escaped with a backslash, which stay word boundaries as they are for the inline engine.
+    Runs right after the inline patterns, before unescape turns the escapes back into plain characters and
+    before treeprocessors like toc's render the text through the postprocessors. Before Markdown 3.4 there is no
+    unescape treeprocessor: a postprocessor which runs after PinyinPostprocessor restores the escapes instead.
+    """
+    ESCAPED = re.compile('{}(\\d+){}'.format(STX, ETX))
+
+    def stash(self, text):
+        return self.md.htmlStash.store(_escape_cdata(text))
+
+    def stash_escaped(self, m):
+        return self.stash(chr(int(m.group(1))))
+
+    def run(self, root):
+        unescape = 'unescape' in self.md.treeprocessors
+        for element in root.iter():
+            if element.text:
+                if isinstance(element.text, AtomicString):
+                    # The contents of code elements are skipped by PinyinPostprocessor, and aren't unescaped
+                    if element.tag not in ('code', 'pre'):
+                        element.text = self.stash(element.text)
+                elif unescape:
+                    element.text = self.ESCAPED.sub(self.stash_escaped, element.text)
+            if element.tail and unescape:
+                element.tail = self.ESCAPED.sub(self.stash_escaped, element.tail)
+
+
+class PinyinPostprocessor(Postprocessor):
+    """
+    The postprocess engine: a single pass over the serialized HTML instead of a search of every text node.
+    Only text is converted: tags (with their attribute values), entities and the contents of code, pre, script
+    and style elements are skipped. Raw HTML, and what StashAtomicTreeprocessor stashed, is still in Markdown's
+    stash while this runs, so it is left alone as well.
+    """
+    SKIP = re.compile(r'<(?P<tag>code|pre|script|style)\b[^>]*>.*?</(?P=tag)\s*>|<[^>]*>|&#?\w+;',
+                      re.DOTALL | re.IGNORECASE)
+
+    def __init__(self, md, pattern, finish=None):
+        """
+        :param pattern: the NumberedPinyinPattern which finds and renders the words. It isn't registered.
+        :param finish: called after each document, to finish its instrumentation stats
         """
+        super(PinyinPostprocessor, self).__init__(md)
+        self.pattern = pattern
+        self.finish = finish
+
+    def convert(self, text):
+        finder = self.pattern.compiled_re
+        out = []
+        last = 0
+        for m in finder.finditer(text):
+            out.append(text[last:m.start(0)])
+            out.append(self.pattern.render_html(m))
+            last = m.end(0)
+        if not last:
+            return text
+        out.append(text[last:])
+        return ''.join(out)
+
+    def run(self, text):
+        out = []
+        last = 0
+        for m in self.SKIP.finditer(text):
+            out.append(self.convert(text[last:m.start()]))
+            out.append(m.group(0))
+            last = m.end()
+        out.append(self.convert(text[last:]))
+        if self.finish is not None:
+            self.finish()
+        return ''.join(out)
+
 
-        polysyllabic_chinese_word = m.group(2)
-        parent = etree.Element(JUNK_TAG)
-        for i, sound in enumerate(pinyin_regex.split_syllables(polysyllabic_chinese_word)):
-            if sound == 'r':
-                self.make_span(parent, 'r', self.erhua_class)
-            else:
-                if i > 0 and sound[0] in 'aeo':
-                    self.make_span(parent, "'", self.apostrophe_class)
-                accented = numbered_accented.numbered_syllable_to_accented(sound)
-                if accented == sound:
-                    raise Exception("Pinyin conversion error: " + sound)
-                if self.entities:
-                    accented = self.convert_to_entities(accented)
-                self.make_span(parent, accented, self.tone_class(sound[-1]))
-        return parent
+class HanziRubyPattern(InlineProcessor):
+    """
+    Annotates runs of hanzi with <ruby> elements, using the readings in a ruby.RubyIndex.
+    Like NumberedPinyinPattern, the element holding a run loses its tag in an UntagWordsTreeprocessor.
+    """
+
+    def __init__(self, pattern, md, annotator):
+        super(HanziRubyPattern, self).__init__(pattern, md)
+        self.annotator = annotator
+        self.words = []
+
+    def handleMatch(self, m, data):
+        parent = etree.Element('span')
+        self.words.append(parent)
+        self.annotator.annotate(parent, m.group(0))
+        return parent, m.start(0), m.end(0)
+
+
+class InstrumentedPinyinPattern(NumberedPinyinPattern):
+    """NumberedPinyinPattern which records timings and counts in self.stats, the stats of the current document"""
+
+    def __init__(self, *args, **kwargs):
+        self.stats = stats.PinyinStats()
+        super(InstrumentedPinyinPattern, self).__init__(*args, **kwargs)
+        self.compiled_re = stats.TimedFinder(self.compiled_re, self)
+
+    prepare = stats.timed_prepare
+
+    def handleMatch(self, m, data):
+        start = time.perf_counter()
+        result = super(InstrumentedPinyinPattern, self).handleMatch(m, data)
+        self.stats.handle_match_seconds += time.perf_counter() - start
+        return result
+
+
+class InstrumentedUntagWordsTreeprocessor(UntagWordsTreeprocessor):
+    """
+    Also finishes the stats of each document: adds them to the extension's totals and passes them to the hook
+    """
+
+    def __init__(self, md, pattern, totals, hook):
+        super(InstrumentedUntagWordsTreeprocessor, self).__init__(md, pattern)
+        self.totals = totals
+        self.hook = hook
+
+    def run(self, root):
+        start = time.perf_counter()
+        super(InstrumentedUntagWordsTreeprocessor, self).run(root)
+        self.pattern.stats.untag_seconds += time.perf_counter() - start
+        self.finish_document()
+
+    def finish_document(self):
+        document = self.pattern.stats
+        document.documents = 1
+        self.pattern.stats = stats.PinyinStats()
+        self.totals.add(document)
+        if self.hook is not None:
+            self.hook(document)
 
 
 class PinyinExtension(Extension):
@@ -95,16 +360,90 @@ class PinyinExtension(Extension):
                                          "May be empty"
                                          " - Default: pyap"],
             'entities': [False, "If True, output the accented characters as entity codes"
-                                " like &#466;"
-                                " - Default: False"]
+                                " like &#466;. Same as encoder='entities'"
+                                " - Default: False"],
+            'encoder': ['nfc', "How to write the accented characters: 'nfc' precomposed, 'nfd' with combining tone "
+                               "marks, 'entities' as numeric entities like &#466;, 'named' as named entities "
+                               "like &uuml; where possible"
+                               " - Default: 'nfc'"],
+            'engine': ['trie', "How to find pinyin words in text: 'trie' walks a prefix trie of syllables in a "
+                               "single pass, in time linear in the length of the text. 'regex' uses one big "
+                               "regular expression. 'postprocess' walks the trie over the serialized HTML "
+                               "instead of every text node"
+                               " - Default: 'trie'"],
+            'cache_size': [word_cache.DEFAULT_SIZE, "Number of rendered words kept in an LRU cache shared by "
+                                                    "every Markdown instance in the process. 0 disables it"
+                                                    " - Default: {}".format(word_cache.DEFAULT_SIZE)],
+            'instrument': [False, "If True, record per-stage timings and counts of the words, syllables, erhua and "
+                                  "apostrophes emitted in the extension's stats (a stats.PinyinStats)"
+                                  " - Default: False"],
+            'granularity': ['syllable', "Elements made for each word: 'syllable' a span per syllable, apostrophe and "
+                                        "erhua, 'word' one span with the tones in data-tones, 'none' plain "
+                                        "accented text without any elements"
+                                        " - Default: 'syllable'"],
+            'max_document_size': [0, "Documents longer than this many characters are rendered without converting "
+                                     "their pinyin. 0 for no limit"
+                                     " - Default: 0"],
+            'time_budget': [0.0, "Seconds a document may take to render before the rest of its pinyin is left "
+                                 "unconverted. 0 for no limit. The regex engine can only stop between words"
+                                 " - Default: 0"],
+            'ruby_index': ['', "Path of an index of a CEDICT dictionary, built by python -m pinyin_markdown.ruby. "
+                               "If set, hanzi are annotated with <ruby> pinyin. Empty to disable"
+                               " - Default: ''"]
         }
+        # Called with the PinyinStats of each document when instrumented, e.g. to export them to a metrics pipeline.
+        # Not a config option, as Markdown would turn it into a bool.
+        self.stats_hook = kwargs.pop('stats_hook', None)
 
         super(PinyinExtension, self).__init__(*args, **kwargs)
+        # Totals over every document of every Markdown instance the extension is added to, when instrumented
+        self.stats = stats.PinyinStats() if self.getConfig('instrument') else None
+
+    def pattern_configs(self):
+        """:return: the config which NumberedPinyinPattern takes: everything but instrument and ruby_index"""
+        configs = self.getConfigs()
+        del configs['instrument'], configs['ruby_index']
+        return configs
+
+    def extendMarkdown(self, md):
+        configs = self.pattern_configs()
+        if self.getConfig('instrument'):
+            if self.stats is None:  # Instrumented by setConfig after __init__
+                self.stats = stats.PinyinStats()
+            pinyin_pattern = InstrumentedPinyinPattern(pinyin_regex.polysyllabic_regex_str(), md, **configs)
+            untag = InstrumentedUntagWordsTreeprocessor(md, pinyin_pattern, self.stats, self.stats_hook)
+        else:
+            pinyin_pattern = NumberedPinyinPattern(pinyin_regex.polysyllabic_regex_str(), md, **configs)
+            # Only the syllable granularity makes word elements which need their tags cleared
+            untag = UntagWordsTreeprocessor(md, pinyin_pattern) if pinyin_pattern.granularity == 'syllable' else None
+        if pinyin_pattern.engine == 'postprocess':
+            finish = untag.finish_document if isinstance(untag, InstrumentedUntagWordsTreeprocessor) else None
+            # Before raw_html (priority 30) puts the stashed raw HTML back
+            md.postprocessors.register(PinyinPostprocessor(md, pinyin_pattern, finish), 'pinyin', 35)
+            # After inline (priority 20)
+            md.treeprocessors.register(StashAtomicTreeprocessor(md), 'pinyin_stash_atomic', 15)
+            untag = None
+        else:
+            # Lowest priority: run after all of Markdown's own inline patterns
+            md.inlinePatterns.register(pinyin_pattern, 'pinyin', 5)
+        if self.getConfig('ruby_index'):
+            self.register_ruby(md, pinyin_pattern)
+        if isinstance(pinyin_pattern.gate, _BudgetGate):
+            # Before normalize_whitespace (priority 30), the first preprocessor
+            md.preprocessors.register(BudgetPreprocessor(md, pinyin_pattern.gate), 'pinyin_budget', 35)
+        if untag is not None:
+            # After every other treeprocessor, including Markdown's last one, unescape (priority 0)
+            md.treeprocessors.register(untag, 'pinyin_untag_words', -1)
 
-    def extendMarkdown(self, md, md_globals):
-        pinyin_pattern = NumberedPinyinPattern(pinyin_regex.POLYSYLLABIC_REGEX_STR, **self.getConfigs())
-        md.inlinePatterns.add('pinyin', pinyin_pattern, '_end')
-        md.treeprocessors.add('pinyin_remove_junk', RemoveJunkParentTreeprocessor(md), '_end')
+    def register_ruby(self, md, pinyin_pattern):
+        from pinyin_markdown import ruby  # Only imported when enabled
+        annotator = ruby.RubyAnnotator(ruby.open_index(self.getConfig('ruby_index')), pinyin_pattern.tone_class,
+                                       pinyin_pattern.erhua_class, pinyin_pattern.apostrophe_class,
+                                       pinyin_pattern.encoder, AtomicString)
+        ruby_pattern = HanziRubyPattern(ruby.HANZI.pattern, md, annotator)
+        # After the pinyin: hanzi never contain numbered pinyin
+        md.inlinePatterns.register(ruby_pattern, 'pinyin_ruby', 4)
+        md.treeprocessors.register(UntagWordsTreeprocessor(md, ruby_pattern), 'pinyin_untag_ruby', -1)
 
 
 def makeExtension(*args, **kwargs):
@@ -0,0 +1,107 @@
+"""
+A bounded pool of ready-to-use Markdown instances for multi-threaded servers.
+
+A Markdown instance keeps per-document state (and NumberedPinyinPattern keeps the words of the document
+being rendered), so one instance must never be used by two threads at once. Building an instance per request
+is slow, so a PinyinRenderer keeps up to `size` of them and hands each to one thread at a time:
+
+    >>> renderer = PinyinRenderer(size=8, tone_class='t{}')
+    >>> html = renderer.convert(text)
+    >>> with renderer.markdown() as md:
+    ...     html = md.convert(text)
+
+The syllable regexes and trie, the accented tables and the word cache are process-wide and read-only,
+so every instance in every pool shares them. With a disk_cache.RenderCache, convert() also shares rendered
+documents with every other process using the same cache file.
+"""
+import contextlib
+import json
+import queue
+import threading
+
+from markdown import Markdown
+from pinyin_markdown.disk_cache import config_salt, render_key
+from pinyin_markdown.pinyinextension import PinyinExtension
+
+DEFAULT_SIZE = 8
+
+_renderers = {}
+_renderers_lock = threading.Lock()
+
+
+class PinyinRenderer(object):
+    def __init__(self, size=DEFAULT_SIZE, extensions=(), cache=None, **config):
+        """
+        :param size: the most Markdown instances to build. Threads wait for one to be checked in after that.
+        :param extensions: other Markdown extensions, by name
+        :param cache: disk_cache.RenderCache for convert(), or None
+        :param config: PinyinExtension config
+        """
+        if size < 1:
+            raise ValueError('Pool size must be at least 1')
+        self.size = size
+        self.extensions = list(extensions)
+        self.config = config
+        self.cache = cache
+        self.salt = config_salt(config, self.extensions)
+        self.idle = queue.LifoQueue()  # The most recently used instance is the most likely to be warm
+        self.created = 0
+        self.lock = threading.Lock()
+        # Fail now, not in the first request, if the config is bad
+        self.checkin(self._build())
+
+    def _build(self):
+        md = Markdown(extensions=[PinyinExtension(**self.config)] + self.extensions)
+        self.created += 1
+        return md
+
+    def checkout(self, timeout=None):
+        """
+        :param timeout: seconds to wait when all instances are in use, or None to wait forever
+        :return: a Markdown instance, which is only used by the caller until checkin()
+        :raises queue.Empty: if timeout passed without an instance becoming free
+        """
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self.lock:
+            if self.created < self.size:
+                return self._build()
+        return self.idle.get(timeout=timeout)
+
+    def checkin(self, md):
+        """Resets md and returns it to the pool"""
+        self.idle.put(md.reset())
+
+    @contextlib.contextmanager
+    def markdown(self, timeout=None):
+        """Context manager which checks a Markdown instance out and checks it back in"""
+        md = self.checkout(timeout)
+        try:
+            yield md
+        finally:
+            self.checkin(md)
+
+    def convert(self, text, timeout=None):
+        """:return: the HTML of text, from the cache or rendered by a pooled instance"""
+        if self.cache is None:
+            with self.markdown(timeout) as md:
+                return md.convert(text)
+        key = render_key(text, self.salt)
+        html = self.cache.get(key)
+        if html is None:
+            with self.markdown(timeout) as md:
+                html = md.convert(text)
+            self.cache.put(key, html)
+        return html
+
+
+def renderer(size=DEFAULT_SIZE, extensions=(), cache=None, **config):
+    """:return: the process's PinyinRenderer for this config and cache, created on first use"""
+    key = json.dumps([size, list(extensions), cache.path if cache is not None else None, sorted(config.items())])
+    with _renderers_lock:
+        pool = _renderers.get(key)
+        if pool is None:
+            pool = _renderers[key] = PinyinRenderer(size, extensions, cache, **config)
+        return pool
@@ -0,0 +1,28 @@
+"""
+Process-wide registry of the compiled pieces which every NumberedPinyinPattern with the same config shares.
+
+InlineProcessor.__init__ compiles its pattern for every instance, relying on the re module's cache,
+which holds 512 patterns and may evict the 410-way pinyin alternation at any time, costing milliseconds to
+compile again. Patterns give it an empty pattern and take their word finder from here instead, so building
+Markdown(extensions=[...]) per request never compiles anything after the first time. The accented tables
+(encoders.encoded_table) and the word caches (word_cache.word_cache) are already shared in the same way.
+"""
+import functools
+import re
+
+from pinyin_markdown.syllable_trie import trie
+
+
+@functools.lru_cache(maxsize=None)
+def compiled_regex(pattern):
+    """:return: pattern compiled with the flags InlineProcessor uses"""
+    return re.compile(pattern, re.DOTALL | re.UNICODE)
+
+
+def finder(engine, pattern):
+    """
+    :param engine: 'trie', 'regex' or 'postprocess', which uses the trie
+    :param pattern: the regex of the words, only compiled for the regex engine
+    :return: the shared object whose finditer(text, pos) finds pinyin words
+    """
+    return compiled_regex(pattern) if engine == 'regex' else trie()
@@ -0,0 +1,184 @@
+"""
+Reverse conversion: accented, numbered or toneless pinyin to normalised search keys.
+
+    >>> keys("Xǐ'àn")
+    ('xi3an4', 'xian')
+    >>> keys('yi1dian3r')
+    ('yi1dian3r', 'yidianr')
+
+Keys are lower case, with words separated by single spaces and no apostrophes. ü is written as `umlaut`,
+'v' by default. Unmarked syllables get the neutral tone 5.
+
+Accented words are split at apostrophes, then into syllables from SYLLABLES, preferring the fewest syllables.
+As in standard pinyin spelling, a syllable starting with a, e or o only follows an apostrophe,
+so xian is one syllable and xi'an two. Each syllable carries at most one tone mark.
+"""
+import functools
+import re
+import unicodedata
+
+from pinyin_markdown.numbered_accented import VOWEL_MAP
+from pinyin_markdown.pinyin_regex import SYLLABLES
+from pinyin_markdown.syllable_trie import trie
+
+_SYLLABLE_SET = frozenset(SYLLABLES)
+_LONGEST_SYLLABLE = max(map(len, SYLLABLES))
+_APOSTROPHES = "'’"
+# Runs of letters, digits, colons (for u:) and apostrophes are words. Anything else separates them.
+_WORDS = re.compile(r"[^\W_]+(?:[:'’][^\W_]+)*:?")
+
+
+@functools.lru_cache(maxsize=None)
+def inverse_vowel_map():
+    """:return: dict of accented vowel => (plain vowel, tone), e.g. 'ǎ' => ('a', '3'), 'Ǖ' => ('ü', '1')"""
+    inverse = {}
+    for numbered, accented in VOWEL_MAP.items():
+        vowel, tone = numbered[:-1], numbered[-1]
+        if tone != '5':
+            inverse[accented] = (vowel, tone)
+            inverse[accented.upper()] = (vowel, tone)
+    return inverse
+
+
+def _strip_tones(piece):
+    """
+    :param piece: lower case accented pinyin, without apostrophes
+    :return: (toneless letters with ü, list of the tone marked on each letter or None)
+    """
+    inverse = inverse_vowel_map()
+    letters = []
+    tones = []
+    for c in piece:
+        if c in inverse:
+            vowel, tone = inverse[c]
+            letters.append(vowel)
+            tones.append(tone)
+        elif c == ':' and letters and letters[-1] == 'u':
+            letters[-1] = 'ü'  # ǔ: or u:
+        else:
+            letters.append('ü' if c == 'v' else c)
+            tones.append(None)
+    return ''.join(letters), tones
+
+
+def _segment(letters, tones, strict):
+    """
+    Splits toneless letters into syllables, with the fewest syllables and the longest first syllable.
+    A final r which is not part of a syllable is erhua.
+    :return: list of (start, end) of each syllable, or None
+    """
+    length = len(letters)
+    # best[i] = (syllable count, end of first syllable) for letters[i:]
+    best = [None] * length + [(0, length)]
+    for i in range(length - 1, -1, -1):
+        if i == length - 1 and i > 0 and letters[i] == 'r':
+            best[i] = (1, length)  # Erhua
+        if strict and i > 0 and letters[i] in 'aeo':
+            continue
+        for end in range(min(length, i + _LONGEST_SYLLABLE), i, -1):
+            if best[end] is None or letters[i:end] not in _SYLLABLE_SET:
+                continue
+            if sum(1 for tone in tones[i:end] if tone is not None) > 1:
+                continue
+            if best[i] is None or best[end][0] + 1 < best[i][0]:
+                best[i] = (best[end][0] + 1, end)
+    if best[0] is None:
+        return None
+    spans = []
+    i = 0
+    while i < length:
+        end = best[i][1]
+        spans.append((i, end))
+        i = end
+    return spans
+
+
+def _accented_sounds(word):
+    """:return: list of (toneless syllable with ü, tone) in an accented or toneless word, or None"""
+    sounds = []
+    for piece in re.split('[' + _APOSTROPHES + ']', word):
+        if not piece:
+            continue
+        letters, tones = _strip_tones(piece)
+        spans = _segment(letters, tones, True) or _segment(letters, tones, False)
+        if spans is None:
+            return None
+        for start, end in spans:
+            if end - start == 1 and letters[start] == 'r' and start > 0:
+                sounds.append(('r', ''))
+            else:
+                tone = next((t for t in tones[start:end] if t is not None), '5')
+                sounds.append((letters[start:end], tone))
+    return sounds
+
+
+def _numbered_sounds(word):
+    """:return: list of (toneless syllable with ü, tone) in a tone-numbered word, or None"""
+    found = trie().split_syllables(word)
+    if not found:
+        return None
+    sounds = []
+    for sound in found:
+        if sound == 'r':
+            sounds.append(('r', ''))
+        else:
+            sounds.append((sound[:-1].replace('u:', 'ü').replace('v', 'ü'), sound[-1]))
+    return sounds
+
+
+@functools.lru_cache(maxsize=65536)
+def word_keys(word, umlaut='v'):
+    """
+    :param word: one lower case pinyin word, accented (xǐ'àn), numbered (xi3an4) or toneless (xian)
+    :return: (numbered key, toneless key), or None if word isn't pinyin
+    """
+    if any(c in '12345' for c in word):
+        sounds = _numbered_sounds(word)
+    else:
+        sounds = _accented_sounds(word)
+    if sounds is None:
+        return None
+    numbered = ''.join(syllable + tone for syllable, tone in sounds).replace('ü', umlaut)
+    toneless = ''.join(syllable for syllable, tone in sounds).replace('ü', umlaut)
+    return numbered, toneless
+
+
+def keys(text, umlaut='v'):
+    """
+    :param text: pinyin words, accented, numbered or toneless, e.g. "Tiān'ānmén Guǎngchǎng"
+    :return: (numbered key, toneless key), e.g. ('tian1an1men2 guang3chang3', 'tiananmen guangchang')
+    :raises ValueError: if a word isn't pinyin
+    """
+    numbered = []
+    toneless = []
+    for word in _WORDS.findall(unicodedata.normalize('NFC', text).lower()):
+        found = word_keys(word, umlaut)
+        if found is None:
+            raise ValueError("Not pinyin: " + word)
+        numbered.append(found[0])
+        toneless.append(found[1])
+    return ' '.join(numbered), ' '.join(toneless)
+
+
+def to_numbered(text, umlaut='v'):
+    """Xǐ'àn => xi3an4"""
+    return keys(text, umlaut)[0]
+
+
+def to_toneless(text, umlaut='v'):
+    """Xǐ'àn => xian"""
+    return keys(text, umlaut)[1]
+
+
+def bulk_keys(rows, umlaut='v'):
+    """
+    Converts many dictionary rows without any Markdown. Repeated words are served from word_keys' cache.
+    :param rows: iterable of pinyin strings
+    :return: generator of (row, numbered key, toneless key). The keys are None if the row isn't pinyin.
+    """
+    for row in rows:
+        try:
+            numbered, toneless = keys(row, umlaut)
+        except ValueError:
+            numbered = toneless = None
+        yield row, numbered, toneless
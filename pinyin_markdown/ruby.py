@@ -0,0 +1,212 @@
+"""
+Ruby annotation of hanzi with tone-classed pinyin, from a memory-mapped index of a CEDICT-format dictionary.
+
+Build the index once from a local CEDICT file (e.g. cedict_ts.u8), then point the extension at it:
+
+    python -m pinyin_markdown.ruby cedict_ts.u8 cedict.idx
+    >>> markdown.markdown('你好', extensions=[PinyinExtension(ruby_index='cedict.idx')])
+    '<p><ruby>你<rt><span class="tone3">nǐ</span></rt>好<rt><span class="tone3">hǎo</span></rt></ruby></p>'
+
+The index is a sorted table of UTF-8 headwords and their numbered readings, searched in place with bisection.
+Opening it only maps the file, so it is instant, and every process maps the same pages from the OS page cache
+instead of loading the dictionary into its own heap.
+
+File layout, little-endian:
+    magic (8 bytes), entry count N (uint32), longest headword in characters (uint32)
+    N + 1 uint32 offsets of the entries, relative to the start of the entries
+    entries: headword UTF-8, tab, reading ASCII, e.g. '你好\\tni3 hao3'
+"""
+import functools
+import mmap
+import re
+import struct
+import sys
+import xml.etree.ElementTree as etree
+
+from pinyin_markdown import word_cache
+from pinyin_markdown.encoders import encoded_table
+
+MAGIC = b'PYRUBY1\0'
+_HEADER = struct.Struct('<8sII')
+_OFFSET = struct.Struct('<I')
+# Traditional Simplified [pin1 yin1] /gloss/
+_CEDICT_LINE = re.compile(r'^(\S+) (\S+) \[([^\]]*)\]')
+HANZI = re.compile('[〇㐀-䶿一-鿿豈-﫿\U00020000-\U0002ffff]+')
+
+
+def read_cedict(lines):
+    """
+    :param lines: lines of a CEDICT-format file
+    :return: dict of headword (traditional and simplified) => numbered reading, e.g. '你好' => 'ni3 hao3'.
+             The first reading of a headword wins, except that a lower case reading beats a proper noun's.
+    """
+    readings = {}
+    for line in lines:
+        m = _CEDICT_LINE.match(line)
+        if m is None or line.startswith('#'):
+            continue
+        traditional, simplified, reading = m.groups()
+        for headword in (simplified, traditional):
+            old = readings.get(headword)
+            if old is None or (old[:1].isupper() and reading[:1].islower()):
+                readings[headword] = reading
+    return readings
+
+
+def build_index(cedict_path, index_path):
+    """Writes the index of the CEDICT file at cedict_path to index_path. :return: the number of headwords"""
+    with open(cedict_path, encoding='utf8') as f:
+        readings = read_cedict(f)
+    entries = sorted((headword.encode('utf8'), reading.encode('ascii', 'replace'))
+                     for headword, reading in readings.items())
+    longest = max((len(headword.decode('utf8')) for headword, reading in entries), default=0)
+    offsets = [0]
+    for headword, reading in entries:
+        offsets.append(offsets[-1] + len(headword) + 1 + len(reading))
+    with open(index_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, len(entries), longest))
+        f.write(struct.pack('<{}I'.format(len(offsets)), *offsets))
+        for headword, reading in entries:
+            f.write(headword + b'\t' + reading)
+    return len(entries)
+
+
+class RubyIndex(object):
+    """A memory-mapped index written by build_index"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self.longest = _HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            raise ValueError('Not a pinyin_markdown ruby index: ' + path)
+        self.offsets_start = _HEADER.size
+        self.entries_start = self.offsets_start + (self.count + 1) * _OFFSET.size
+
+    def _entry(self, i):
+        start, end = struct.unpack_from('<II', self.map, self.offsets_start + i * _OFFSET.size)
+        return self.map[self.entries_start + start:self.entries_start + end]
+
+    def reading(self, headword):
+        """:return: the numbered reading of headword, e.g. 'ni3 hao3', or None"""
+        key = headword.encode('utf8') + b'\t'
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry = self._entry(mid)
+            if entry.startswith(key):
+                return entry[len(key):].decode('ascii')
+            if entry < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def segment(self, text):
+        """
+        Splits text into the longest headwords in the index, from left to right.
+        :return: list of (text, reading or None if not in the index)
+        """
+        segments = []
+        i = 0
+        unknown = ''
+        while i < len(text):
+            for length in range(min(self.longest, len(text) - i), 0, -1):
+                reading = self.reading(text[i:i + length])
+                if reading is not None:
+                    if unknown:
+                        segments.append((unknown, None))
+                        unknown = ''
+                    segments.append((text[i:i + length], reading))
+                    i += length
+                    break
+            else:
+                unknown += text[i]
+                i += 1
+        if unknown:
+            segments.append((unknown, None))
+        return segments
+
+
+@functools.lru_cache(maxsize=None)
+def open_index(path):
+    """:return: the process's RubyIndex of path, mapped on first use"""
+    return RubyIndex(path)
+
+
+def reading_sounds(reading):
+    """'yi1 dian3 r5' => ['yi1', 'dian3', 'r']: CEDICT's erhua syllable r5 is the erhua 'r'"""
+    return ['r' if sound == 'r5' else sound for sound in reading.split()]
+
+
+class RubyAnnotator(object):
+    """Makes the ruby elements of hanzi, with the same spans as NumberedPinyinPattern"""
+
+    def __init__(self, index, tone_class='tone{}', erhua_class='erhua', apostrophe_class='pyap', encoder='nfc',
+                 text_type=str):
+        """:param text_type: applied to the hanzi text put in the elements, e.g. Markdown's AtomicString"""
+        self.index = index
+        self.text_type = text_type
+        self.options = (tone_class, erhua_class, apostrophe_class, encoder)
+        self.accented = encoded_table(encoder)
+
+    def annotate_sound(self, parent, sound):
+        """Adds the span of one sound to parent. Readings which aren't pinyin (like xx5) are written as they are."""
+        if sound != 'r' and sound not in self.accented:
+            if len(parent):
+                parent[-1].tail = (parent[-1].tail or '') + sound
+            else:
+                parent.text = (parent.text or '') + sound
+            return
+        for text, cls in word_cache.prepare_word([sound], *self.options):
+            span = etree.SubElement(parent, 'span')
+            span.text = text
+            if cls:
+                span.set('class', cls)
+
+    def annotate(self, parent, text):
+        """
+        Appends text to parent, with a <ruby> for each word in the index:
+        each character gets its own <rt> when the reading has a sound per character, else the word gets one.
+        """
+        last = None
+
+        def append_text(plain):
+            if last is None:
+                parent.text = self.text_type((parent.text or '') + plain)
+            else:
+                last.tail = self.text_type((last.tail or '') + plain)
+
+        for word, reading in self.index.segment(text):
+            if reading is None:
+                append_text(word)
+                continue
+            sounds = reading_sounds(reading)
+            ruby = last = etree.SubElement(parent, 'ruby')
+            if len(sounds) == len(word):
+                pairs = list(zip(word, ([sound] for sound in sounds)))
+            else:
+                pairs = [(word, sounds)]
+            rt = None
+            for characters, group in pairs:
+                if rt is None:
+                    ruby.text = self.text_type(characters)
+                else:
+                    rt.tail = self.text_type(characters)
+                rt = etree.SubElement(ruby, 'rt')
+                for sound in group:
+                    self.annotate_sound(rt, sound)
+        return parent
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print('Usage: python -m pinyin_markdown.ruby CEDICT_FILE INDEX_FILE')
+        return 2
+    print('{} headwords indexed'.format(build_index(*argv)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Optional instrumentation of PinyinExtension: per-stage timings and counts of what was emitted.
+
+    >>> ext = PinyinExtension(instrument=True, stats_hook=lambda stats: metrics.send(stats.as_dict()))
+    >>> markdown.markdown(text, extensions=[ext])
+    >>> print(ext.stats)
+
+Only an instrumented extension uses the timed classes below, so an extension without instrumentation runs
+exactly the same code as before.
+"""
+import time
+from itertools import chain
+
+from pinyin_markdown import word_cache
+
+TIMINGS = ('search_seconds', 'handle_match_seconds', 'split_seconds', 'accent_seconds', 'untag_seconds')
+COUNTS = ('documents', 'words', 'syllables', 'erhua', 'apostrophes')
+
+
+class PinyinStats(object):
+    """
+    search_seconds: finding pinyin words in text nodes
+    handle_match_seconds: NumberedPinyinPattern.handleMatch, including the next two stages
+    split_seconds: splitting words into sounds (free with the trie engine, which splits while searching)
+    accent_seconds: looking up the accented spans of the sounds, from the word cache if enabled
+    untag_seconds: UntagWordsTreeprocessor.run
+    """
+    __slots__ = TIMINGS + COUNTS
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        for name in TIMINGS:
+            setattr(self, name, 0.0)
+        for name in COUNTS:
+            setattr(self, name, 0)
+
+    def add(self, other):
+        """Adds the figures of other to these"""
+        for name in chain(TIMINGS, COUNTS):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in chain(TIMINGS, COUNTS)}
+
+    def __str__(self):
+        return ('{documents} documents, {words} words, {syllables} syllables, {erhua} erhua, {apostrophes} apostrophes'
+                ' | search {search_seconds:.6f}s, handleMatch {handle_match_seconds:.6f}s'
+                ' (split {split_seconds:.6f}s, accent {accent_seconds:.6f}s), untag {untag_seconds:.6f}s'
+                ).format(**self.as_dict())
+
+
+class TimedFinder(object):
+    """Wraps the pattern's compiled_re, adding the time spent finding each word to stats.search_seconds"""
+
+    def __init__(self, finder, pattern):
+        self.finder = finder
+        self.pattern = pattern
+
+    def finditer(self, text, pos=0):
+        clock = time.perf_counter
+        start = clock()
+        matches = self.finder.finditer(text, pos)
+        while True:
+            try:
+                m = next(matches)
+            except StopIteration:
+                self.pattern.stats.search_seconds += clock() - start
+                return
+            self.pattern.stats.search_seconds += clock() - start
+            yield m
+            start = clock()
+
+
+def timed_prepare(pattern, m):
+    """
+    NumberedPinyinPattern.prepare, timing the split and the accent lookup apart and counting what is emitted.
+    The sounds are always split here, even when the word cache would have served the word.
+    """
+    stats = pattern.stats
+    clock = time.perf_counter
+    start = clock()
+    sounds = pattern.sounds(m)
+    split = clock()
+    if pattern.cache is not None:
+        spans = pattern.cache(m.group(1), pattern.tone_class, pattern.erhua_class, pattern.apostrophe_class,
+                              pattern.encoder)
+    else:
+        spans = word_cache.prepare_word(sounds, pattern.tone_class, pattern.erhua_class, pattern.apostrophe_class,
+                                        pattern.encoder)
+    stats.split_seconds += split - start
+    stats.accent_seconds += clock() - split
+    stats.words += 1
+    for i, sound in enumerate(sounds):
+        if sound == 'r':
+            stats.erhua += 1
+        else:
+            stats.syllables += 1
+            if i > 0 and sound[0] in 'aeo':
+                stats.apostrophes += 1
+    return spans
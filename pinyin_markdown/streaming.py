@@ -0,0 +1,54 @@
+"""
+Renders very large Markdown documents block by block, writing each block's HTML as soon as it is ready.
+
+    >>> with open('word_list.html', 'w', encoding='utf8') as out:
+    ...     render_file('word_list.md', out, extensions=['tables'])
+
+Peak memory is proportional to the largest top-level block (see blocks.py), not to the whole document,
+and the output is the same as rendering the whole document at once. Reference link definitions are collected
+in a first pass over the file. Extensions which gather content from across the document (footnotes, toc, abbr)
+need a full render instead.
+"""
+from markdown import Markdown
+from pinyin_markdown.blocks import iter_blocks, iter_references
+from pinyin_markdown.pinyinextension import PinyinExtension
+
+
+class StreamingRenderer(object):
+    def __init__(self, extensions=(), **config):
+        """
+        :param extensions: other Markdown extensions, by name
+        :param config: PinyinExtension config
+        """
+        self.markdown = Markdown(extensions=[PinyinExtension(**config)] + list(extensions))
+        # Reference definitions in fenced code only don't count when the extension is loaded (also by extra)
+        self.fenced = 'fenced_code_block' in self.markdown.preprocessors
+
+    def iter_render(self, lines, references=''):
+        """
+        :param lines: iterable of lines, e.g. an open file
+        :param references: the document's reference link definitions, from blocks.iter_references(lines, self.fenced)
+        :return: generator of HTML chunks which joined together are the HTML of the whole document
+        """
+        first = True
+        for block in iter_blocks(lines):
+            html = self.markdown.reset().convert(references + block)
+            if html:
+                yield html if first else '\n' + html
+                first = False
+
+    def render_file(self, path, out):
+        """
+        Reads the Markdown file at path twice, first for its reference link definitions, then to render it.
+        :param out: a text stream, e.g. an open file or sys.stdout
+        """
+        with open(path, encoding='utf8') as f:
+            references = iter_references(f, self.fenced)
+        with open(path, encoding='utf8') as f:
+            for chunk in self.iter_render(f, references):
+                out.write(chunk)
+
+
+def render_file(path, out, extensions=(), **config):
+    """Writes the HTML of the Markdown file at path to the text stream out. See StreamingRenderer."""
+    StreamingRenderer(extensions, **config).render_file(path, out)
@@ -0,0 +1,218 @@
+"""
+A table-driven alternative to the regex in pinyin_regex.
+
+POLYSYLLABIC_REGEX_STR is a 410-way alternation which Python's re module tries alternative by alternative,
+with backtracking, at every word boundary of every text node. The trie below is built once from SYLLABLES
+and walked one character at a time, so a word is both found and split into its sounds in a single
+left-to-right pass.
+
+Every toned syllable ends with a tone digit and no syllable contains a digit, so at most one syllable can be
+followed by a tone at any position. The walk is therefore deterministic: no backtracking is ever needed.
+A scan only starts at the first character of a word and never goes past the end of that word. Words only start
+at word boundaries, but a colon is both inside a word (u:) and a word boundary, so scans of 'nu:e3nu:e3...x' would
+start after every colon and each read to the x. Whether a scan fails from a syllable start depends only on the
+text from there, so finditer remembers the syllable starts of every failed scan and later scans which reach one
+give up at once. Each character is then read a bounded number of times: matching takes time linear in the length
+of the text, whatever the text.
+"""
+import functools
+import time
+
+from pinyin_markdown.pinyin_regex import SYLLABLES
+
+TONES = '12345'
+# Positions of finditer, or syllables of a scan, between checks of the deadline
+_DEADLINE_INTERVAL = 1024
+_U_UMLAUT_SPELLINGS = ('ü', 'v', 'u:')
+
+
+def _is_word_char(c):
+    """Same definition of a word character as \\w in a unicode str regex"""
+    return c.isalnum() or c == '_'
+
+
+def could_be_in_word(c):
+    """:return: whether c can be part of a pinyin word: a word character, or the colon of u:"""
+    return c == ':' or _is_word_char(c)
+
+
+def spellings(syllable):
+    """All the ways a syllable is matched: yi => yi, Yi; lü => lü, lv, lu:, Lü, Lv, Lu:"""
+    umlauts = _U_UMLAUT_SPELLINGS if 'ü' in syllable else ('ü',)
+    for first in (syllable[0], syllable[0].upper()):
+        for umlaut in umlauts:
+            yield first + syllable[1:].replace('ü', umlaut)
+
+
+class _Node(object):
+    __slots__ = ('children', 'syllable')
+
+    def __init__(self):
+        self.children = {}
+        self.syllable = False
+
+
+class WordMatch(object):
+    """
+    Quacks like the match object produced by a search with POLYSYLLABIC_REGEX_STR:
+    group 0 and group 1 are both the polysyllabic word.
+    The sounds (syllable + tone, or a final erhua 'r') found while scanning are kept in `sounds`.
+    """
+    __slots__ = ('string', 'pos', 'endpos', 'sounds')
+
+    def __init__(self, string, pos, endpos, sounds):
+        self.string = string
+        self.pos = pos
+        self.endpos = endpos
+        self.sounds = sounds
+
+    def start(self, group=0):
+        return self.pos
+
+    def end(self, group=0):
+        return self.endpos
+
+    def span(self, group=0):
+        return self.pos, self.endpos
+
+    def group(self, group=0):
+        return self.string[self.pos:self.endpos]
+
+    def groups(self):
+        return self.group(1),
+
+
+class SyllableTrie(object):
+    """
+    Prefix trie of SYLLABLES which matches the same words as POLYSYLLABIC_REGEX_STR:
+    the first letter of each syllable may be capitalised, ü may be spelled ü, v or u:
+    and a word may end with an erhua r.
+    """
+
+    def __init__(self, syllables=SYLLABLES):
+        self.root = _Node()
+        umlaut_nodes = {}  # 'lü' => node, shared by the ü, v and u: spellings
+        for syllable in syllables:
+            first, rest = syllable[0], syllable[1:]
+            node = self.root.children.get(first)
+            if node is None:
+                node = self.root.children[first] = self.root.children[first.upper()] = _Node()
+            prefix = first
+            for c in rest:
+                prefix += c
+                if c == 'ü':
+                    node = self._add_umlaut(node, umlaut_nodes, prefix)
+                else:
+                    node = node.children.setdefault(c, _Node())
+            node.syllable = True
+
+    @staticmethod
+    def _add_umlaut(node, umlaut_nodes, prefix):
+        target = umlaut_nodes.get(prefix)
+        if target is None:
+            target = umlaut_nodes[prefix] = _Node()
+            for spelling in _U_UMLAUT_SPELLINGS:
+                parent = node
+                for c in spelling[:-1]:
+                    parent = parent.children.setdefault(c, _Node())
+                parent.children[spelling[-1]] = target
+        return target
+
+    def _scan_word(self, text, start, dead=None, deadline=None):
+        """
+        Walks the trie from text[start], which must be the first character of a word.
+        :param dead: set of the syllable starts from which a scan is known to fail, which is updated
+        :param deadline: time.perf_counter() after which the scan gives up, as if there were no word
+        :return: (end, sounds) of the word which starts at start, or None if there is no pinyin word there
+        """
+        root = self.root
+        length = len(text)
+        sounds = []
+        node = root
+        syllable_start = i = start
+        while i < length:
+            c = text[i]
+            i += 1
+            if node.syllable and c in TONES:
+                sounds.append(text[syllable_start:i])
+                if i == length or not _is_word_char(text[i]):
+                    return i, sounds
+                if dead is not None and i in dead:
+                    break
+                if deadline is not None and not len(sounds) % _DEADLINE_INTERVAL and time.perf_counter() > deadline:
+                    return None
+                node = root
+                syllable_start = i
+            elif node is root and sounds and c == 'r' and (i == length or not _is_word_char(text[i])):
+                sounds.append('r')
+                return i, sounds
+            else:
+                node = node.children.get(c)
+                if node is None:
+                    break
+        if dead is not None:
+            self._mark_dead(text, start, syllable_start, dead)
+        return None
+
+    @staticmethod
+    def _mark_dead(text, start, end, dead):
+        """Adds the syllable starts after start, up to end, of a failed scan to dead: they're after its tones"""
+        for i in range(start + 1, end + 1):
+            if text[i - 1] in TONES:
+                dead.add(i)
+
+    def finditer(self, text, pos=0, endpos=None, deadline=None):
+        """
+        Yields a WordMatch for each pinyin word in text, in the same order as POLYSYLLABIC_REGEX_STR would.
+        :param deadline: time.perf_counter() after which no more words are found, however long the text
+        """
+        if endpos is not None:
+            text = text[:endpos]
+        length = len(text)
+        i = pos
+        children = self.root.children
+        dead = set()
+        check = i + _DEADLINE_INTERVAL
+        while i < length:
+            if deadline is not None and i >= check:
+                if time.perf_counter() > deadline:
+                    return
+                check = i + _DEADLINE_INTERVAL
+            # Words only start at a word boundary
+            if text[i] in children and (i == 0 or not _is_word_char(text[i - 1])):
+                found = self._scan_word(text, i, dead, deadline)
+                if found is not None:
+                    end, sounds = found
+                    yield WordMatch(text, i, end, sounds)
+                    i = end
+                    continue
+            i += 1
+
+    def search(self, text, pos=0, endpos=None):
+        """:return: the first WordMatch in text at or after pos, or None"""
+        for match in self.finditer(text, pos, endpos):
+            return match
+        return None
+
+    def split_syllables(self, poly):
+        """
+        Returns all sounds (syllable + tone) contained in a polysyllabic word, like pinyin_regex.split_syllables
+        :param poly: A pinyin word made of concatenated tone-numbered pinyin syllables
+        :return: list of sounds in word
+        """
+        found = self._scan_word(poly, 0)
+        if found is None or found[0] != len(poly):
+            return []
+        return found[1]
+
+
+@functools.lru_cache(maxsize=None)
+def trie():
+    """:return: the process-wide SyllableTrie of SYLLABLES, built on first use"""
+    return SyllableTrie()
+
+
+def __getattr__(name):
+    if name == 'TRIE':
+        return trie()
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
@@ -0,0 +1,140 @@
+"""
+Compact token stream for numbered pinyin text, which renderers can share instead of re-tokenising.
+
+    >>> stream = tokenize('Xi3an4 yi1dian3r!')
+    >>> [(token.kind, SYLLABLES[token.syllable] if token.kind == SYLLABLE else '', token.tone) for token in stream]
+    [(1, 'xi', 3), (1, 'an', 4), (0, '', 0), (1, 'yi', 1), (1, 'dian', 3), (2, '', 0), (0, '', 0)]
+
+Every character of the text belongs to exactly one token, so the text around the pinyin can be rebuilt too.
+The tokens are kept column by column in arrays of small ints, about 13 bytes per token,
+rather than a str and a list per syllable.
+"""
+from array import array
+
+from pinyin_markdown.pinyin_regex import SYLLABLES
+from pinyin_markdown.syllable_trie import trie
+
+# Kinds
+TEXT = 0  # Anything which isn't pinyin
+SYLLABLE = 1  # A syllable and its tone number
+ERHUA = 2  # The r at the end of a word
+
+# Flags
+CAPITALIZED = 1  # The first letter of the syllable is upper case
+WORD_START = 2  # The first syllable of a word
+
+_SYLLABLE_IDS = {syllable: i for i, syllable in enumerate(SYLLABLES)}
+
+
+def _syllable_id(sound):
+    """:return: the index in SYLLABLES of a sound without its tone, e.g. 'Lv' or 'lu:' => index of 'lü'"""
+    spelling = sound[0].lower() + sound[1:]
+    return _SYLLABLE_IDS[spelling.replace('u:', 'ü').replace('v', 'ü')]
+
+
+class Token(object):
+    """One token of a TokenStream. Made on demand: the stream itself only holds arrays."""
+    __slots__ = ('kind', 'syllable', 'tone', 'flags', 'start', 'end')
+
+    def __init__(self, kind, syllable, tone, flags, start, end):
+        self.kind = kind
+        self.syllable = syllable
+        self.tone = tone
+        self.flags = flags
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return 'Token({}, {}, {}, {}, {}, {})'.format(self.kind, self.syllable, self.tone, self.flags, self.start,
+                                                      self.end)
+
+
+class TokenStream(object):
+    """
+    The tokens of text, column by column:
+        kinds: TEXT, SYLLABLE or ERHUA
+        syllables: index into SYLLABLES, 0 unless kind is SYLLABLE
+        tones: 1-5, 0 unless kind is SYLLABLE
+        flags: CAPITALIZED | WORD_START
+        starts, ends: offsets of the token in text
+    """
+    __slots__ = ('text', 'kinds', 'syllables', 'tones', 'flags', 'starts', 'ends')
+
+    def __init__(self, text):
+        self.text = text
+        self.kinds = array('B')
+        self.syllables = array('H')
+        self.tones = array('B')
+        self.flags = array('B')
+        self.starts = array('I')
+        self.ends = array('I')
+
+    def append(self, kind, syllable, tone, flags, start, end):
+        self.kinds.append(kind)
+        self.syllables.append(syllable)
+        self.tones.append(tone)
+        self.flags.append(flags)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, i):
+        return Token(self.kinds[i], self.syllables[i], self.tones[i], self.flags[i], self.starts[i], self.ends[i])
+
+    def __iter__(self):
+        for i in range(len(self.kinds)):
+            yield self[i]
+
+    def source(self, i):
+        """:return: the text of token i"""
+        return self.text[self.starts[i]:self.ends[i]]
+
+    def sound(self, i):
+        """
+        :return: token i as a key of the accented table, spelled with ü and capitalised as in the text: 'Lü3'.
+                 'r' for erhua, None for text.
+        """
+        kind = self.kinds[i]
+        if kind == SYLLABLE:
+            syllable = SYLLABLES[self.syllables[i]]
+            if self.flags[i] & CAPITALIZED:
+                syllable = syllable[0].upper() + syllable[1:]
+            return syllable + str(self.tones[i])
+        return 'r' if kind == ERHUA else None
+
+    def needs_apostrophe(self, i):
+        """Whether a syllable is written after an apostrophe, like the an of Xi'an"""
+        return (self.kinds[i] == SYLLABLE and not self.flags[i] & (WORD_START | CAPITALIZED)
+                and SYLLABLES[self.syllables[i]][0] in 'aeo')
+
+    def nbytes(self):
+        """:return: bytes used by the arrays, not counting the text"""
+        return sum(column.itemsize * len(column) for column in
+                   (self.kinds, self.syllables, self.tones, self.flags, self.starts, self.ends))
+
+
+def tokenize(text):
+    """:return: TokenStream of text, covering every character"""
+    stream = TokenStream(text)
+    last = 0
+    for m in trie().finditer(text):
+        if m.start() > last:
+            stream.append(TEXT, 0, 0, 0, last, m.start())
+        position = m.start()
+        flags = WORD_START
+        for sound in m.sounds:
+            end = position + len(sound)
+            if sound == 'r':
+                stream.append(ERHUA, 0, 0, 0, position, end)
+            else:
+                if sound[0].isupper():
+                    flags |= CAPITALIZED
+                stream.append(SYLLABLE, _syllable_id(sound[:-1]), int(sound[-1]), flags, position, end)
+            position = end
+            flags = 0
+        last = m.end()
+    if last < len(text):
+        stream.append(TEXT, 0, 0, 0, last, len(text))
+    return stream
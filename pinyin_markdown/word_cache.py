@@ -0,0 +1,55 @@
+"""
+Process-wide LRU cache of prepared pinyin words.
+
+Real documents repeat the same few hundred words thousands of times. A prepared word is the list of
+(text, class) pairs for its spans, so a cache hit only has to build the elements.
+The key is the word plus every option which changes its spans, so all Markdown instances in a process
+can share one cache whatever their config. functools.lru_cache is thread safe and counts hits and misses.
+"""
+import functools
+import threading
+
+from pinyin_markdown.encoders import encoded_table
+from pinyin_markdown.syllable_trie import trie
+
+DEFAULT_SIZE = 4096
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def prepare_word(sounds, tone_class, erhua_class, apostrophe_class, encoder):
+    """
+    :param sounds: sounds of the word, as found by split_syllables: ['Xi3', 'an4']
+    :param encoder: one of encoders.ENCODERS
+    :return: tuple of (text, class) for each span: (('Xǐ', 'tone3'), ("'", 'pyap'), ('àn', 'tone4'))
+    """
+    accented = encoded_table(encoder)
+    spans = []
+    for i, sound in enumerate(sounds):
+        if sound == 'r':
+            spans.append(('r', erhua_class))
+        else:
+            if i > 0 and sound[0] in 'aeo':
+                spans.append(("'", apostrophe_class))
+            tone_cls = tone_class.format(sound[-1]) if tone_class is not None else None
+            spans.append((accented[sound], tone_cls))
+    return tuple(spans)
+
+
+def _prepare_polysyllabic_word(word, tone_class, erhua_class, apostrophe_class, encoder):
+    return prepare_word(trie().split_syllables(word), tone_class, erhua_class, apostrophe_class, encoder)
+
+
+def word_cache(maxsize=DEFAULT_SIZE):
+    """
+    :return: the process's cached version of _prepare_polysyllabic_word holding up to maxsize words,
+             with cache_info() and cache_clear(). None if maxsize is 0.
+    """
+    if not maxsize:
+        return None
+    with _caches_lock:
+        cache = _caches.get(maxsize)
+        if cache is None:
+            cache = _caches[maxsize] = functools.lru_cache(maxsize)(_prepare_polysyllabic_word)
+        return cache
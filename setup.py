@@ -1,25 +1,11 @@
 from os import path
-import sys
+import re
 from setuptools import setup
-from setuptools.command.test import test as TestCommand
 
 
-class PyTest(TestCommand):
-    user_options = [('pytest-args=', 'a', "Arguments to pass to py.test")]
-
-    def initialize_options(self):
-        TestCommand.initialize_options(self)
-        self.pytest_args = []
-
-    def finalize_options(self):
-        TestCommand.finalize_options(self)
-        self.test_args = []
-        self.test_suite = True
-
-    def run_tests(self):
-        import pytest
-        errno = pytest.main(self.pytest_args)
-        sys.exit(errno)
+def version():
+    with open(path.join(path.abspath(path.dirname(__file__)), 'pinyin_markdown', '__init__.py'), encoding="utf8") as f:
+        return re.search(r"__version__ = '(.+)'", f.read()).group(1)
 
 
 def readme():
@@ -28,7 +14,7 @@ def readme():
 
 setup(
     name='pinyin_markdown',
-    version='0.8.2',
+    version=version(),
     description='Type Chinese pinyin with tone numbers in Markdown. Get accented pinyin.',
     long_description=readme(),
     url='https://github.com/bcaller/pinyin_markdown',
@@ -39,17 +25,21 @@ setup(
     author_email='bcallergmai@l.com',
     keywords='pinyin chinese markdown',
     tests_require=['pytest'],
-    cmdclass={'test': PyTest},
-    install_requires=['markdown>=2.5'],
+    install_requires=['markdown>=3.3'],
+    python_requires='>=3.7',
     classifiers=[
         'Development Status :: 4 - Beta',
         'Environment :: Console',
         'Intended Audience :: Developers',
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.2',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
         'Topic :: Internet :: WWW/HTTP :: Dynamic Content',
         'Topic :: Software Development :: Libraries :: Python Modules',
         'Topic :: Text Processing :: Filters',
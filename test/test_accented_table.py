@@ -0,0 +1,22 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+from pinyin_markdown import build_tables, numbered_accented
+from pinyin_markdown.accented_table import ACCENTED
+from .expected import numbered_accented as expected
+
+
+def test_table_is_up_to_date():
+    assert ACCENTED == build_tables.generate()
+
+
+def test_table_matches_conversion():
+    for numbered, accented in expected.items():
+        assert ACCENTED[numbered] == accented
+        assert ACCENTED[numbered.capitalize()] == numbered_accented.numbered_syllable_to_accented(
+            numbered.capitalize())
+
+
+def test_umlaut_spellings():
+    assert ACCENTED['lu:3'] == ACCENTED['lv3'] == ACCENTED['lü3'] == 'lǚ'
+    assert ACCENTED['Nu:e4'] == 'Nüè'
@@ -0,0 +1,99 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import markdown
+import pytest
+from pinyin_markdown import PinyinExtension
+from pinyin_markdown.aio import render, AsyncRenderer
+from pinyin_markdown import aio
+
+PAGES = ['# Ni3hao3 {}\n\n*Xi3an4* yi1dian3r'.format(i) for i in range(20)]
+
+
+def expected(text, **config):
+    return markdown.markdown(text, extensions=[PinyinExtension(**config)])
+
+
+def test_render():
+    assert asyncio.run(render(PAGES[0], tone_class='t{}')) == expected(PAGES[0], tone_class='t{}')
+
+
+def test_render_many_in_order():
+    async def collect():
+        async def pages():
+            for page in PAGES:
+                yield page
+        renderer = AsyncRenderer(max_concurrent=3)
+        return [html async for html in renderer.render_many(PAGES)], \
+               [html async for html in renderer.render_many(pages())]
+
+    from_list, from_async = asyncio.run(collect())
+    assert from_list == from_async == [expected(page) for page in PAGES]
+
+
+def test_process_executor():
+    async def collect():
+        with ProcessPoolExecutor(2) as executor:
+            renderer = AsyncRenderer(executor, entities=True)
+            return [html async for html in renderer.render_many(PAGES[:4])]
+
+    assert asyncio.run(collect()) == [expected(page, entities=True) for page in PAGES[:4]]
+
+
+def test_backpressure(monkeypatch):
+    running = []
+    most = []
+
+    def slow_render(text, extensions, config):
+        running.append(text)
+        most.append(len(running))
+        time.sleep(0.01)
+        running.remove(text)
+        return text
+
+    monkeypatch.setattr(aio, '_render', slow_render)
+
+    async def collect():
+        renderer = AsyncRenderer(max_concurrent=2)
+        return await asyncio.gather(*(renderer.render(page) for page in PAGES))
+
+    assert asyncio.run(collect()) == PAGES
+    assert max(most) <= 2
+
+
+def test_timeout(monkeypatch):
+    monkeypatch.setattr(aio, '_render', lambda text, extensions, config: time.sleep(0.2))
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(AsyncRenderer(timeout=0.01).render('ni3'))
+
+
+def test_timeouts_keep_slots(monkeypatch):
+    # A render which timed out is still running in its thread, so it must keep its slot
+    lock = threading.Lock()
+    running = []
+    most = []
+
+    def slow_render(text, extensions, config):
+        with lock:
+            running.append(text)
+            most.append(len(running))
+        time.sleep(0.3)
+        with lock:
+            running.remove(text)
+        return text
+
+    monkeypatch.setattr(aio, '_render', slow_render)
+
+    async def collect():
+        renderer = AsyncRenderer(max_concurrent=2, timeout=0.05)
+        timed_out = await asyncio.gather(*(renderer.render(page) for page in PAGES[:5]), return_exceptions=True)
+        assert all(isinstance(result, asyncio.TimeoutError) for result in timed_out)
+        return await asyncio.gather(*(renderer.render(page, timeout=10) for page in PAGES[5:10]))
+
+    assert asyncio.run(collect()) == PAGES[5:10]
+    assert max(most) <= 2
@@ -0,0 +1,67 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+import pytest
+from pinyin_markdown import batch, convert_many
+from pinyin_markdown.__main__ import main, parse_args
+
+
+def test_convert_tree_skips_unchanged(tmp_path):
+    src, dst = tmp_path / 'src', tmp_path / 'dst'
+    (src / 'sub').mkdir(parents=True)
+    (src / 'a.md').write_text('ni3hao3', encoding='utf8')
+    (src / 'sub' / 'b.md').write_text('Xi3an4', encoding='utf8')
+    (src / 'notes.txt').write_text('wo3', encoding='utf8')
+
+    result = batch.convert_tree(str(src), str(dst), {'tone_class': 't{}'}, workers=2)
+    assert (result.converted, result.skipped) == (2, 0)
+    assert (dst / 'a.html').read_text(encoding='utf8') == \
+        '<p><span class="t3">nǐ</span><span class="t3">hǎo</span></p>'
+    assert (dst / 'sub' / 'b.html').exists()
+    assert not (dst / 'notes.html').exists()
+
+    (src / 'a.md').write_text('ni3', encoding='utf8')
+    result = batch.convert_tree(str(src), str(dst), {'tone_class': 't{}'}, workers=2)
+    assert (result.converted, result.skipped) == (1, 1)
+    assert (dst / 'a.html').read_text(encoding='utf8') == '<p><span class="t3">nǐ</span></p>'
+
+    # Different options re-render everything
+    result = batch.convert_tree(str(src), str(dst), {'tone_class': 'x{}'}, workers=1)
+    assert (result.converted, result.skipped) == (2, 0)
+
+
+def test_config_flags():
+    args, config = parse_args(['src', 'dst', '--tone-class=', '--entities', '-x', 'tables', '-j', '3',
+                               '--cache-size', '10'])
+    assert config == {'tone_class': '', 'erhua_class': 'erhua', 'apostrophe_class': 'pyap', 'entities': True,
+                      'engine': 'trie', 'cache_size': 10, 'encoder': 'nfc', 'instrument': False,
+                      'granularity': 'syllable', 'max_document_size': 0, 'time_budget': 0.0,
+                      'ruby_index': ''}
+    assert args.extensions == ['tables']
+    assert args.jobs == 3
+
+
+def test_invalid_config(tmp_path, capsys):
+    # The workers' initializer would fail, and the Pool would start new workers forever
+    (tmp_path / 'a.md').write_text('ni3', encoding='utf8')
+    with pytest.raises(ValueError):
+        batch.convert_tree(str(tmp_path), str(tmp_path / 'out'), {'engine': 'nfa'}, workers=2)
+    assert main([str(tmp_path), str(tmp_path / 'out'), '--engine=nfa', '-j', '2']) == 2
+    assert "Unknown pinyin engine 'nfa'" in capsys.readouterr().err
+
+
+def test_convert_many_invalid_config():
+    with pytest.raises(ValueError):
+        convert_many(['ni3'], {'granularity': 'bogus'}, workers=2)
+    with pytest.raises(ValueError):
+        batch.iter_convert_many(['ni3'], {'encoder': 'bogus'}, workers=2)  # Before the first document
+
+
+def test_convert_many():
+    docs = ['ni3 {}'.format(i) for i in range(50)]
+    expected = ['<p><span class="t3">nǐ</span> {}</p>'.format(i) for i in range(50)]
+    assert convert_many(docs, {'tone_class': 't{}'}, workers=2, chunksize=3) == expected
+    unordered = batch.iter_convert_many(iter(docs), {'tone_class': 't{}'}, workers=2, chunksize=4, ordered=False,
+                                        max_pending=2)
+    assert sorted(unordered) == list(enumerate(expected))
+    assert convert_many([]) == []
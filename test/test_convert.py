@@ -0,0 +1,46 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+import pytest
+from pinyin_markdown import convert, iter_convert
+from .expected import md_html, numbered_accented
+
+
+@pytest.mark.parametrize('md, html', md_html, ids=[test[0][:10] for test in md_html])
+def test_html_matches_markdown(md, html):
+    if '**' in md:
+        pytest.skip('Markdown emphasis')
+    assert convert(md, 'html') == html
+
+
+def test_text():
+    assert convert("i ♥ Xi3an4! yi1dian3r lu:5") == "i ♥ Xǐ'àn! yīdiǎnr lü"
+    for numbered, accented in numbered_accented.items():
+        assert convert(numbered) == accented
+
+
+def test_entities():
+    assert convert('yi1dian3', 'entities') == 'y&#299;di&#462;n'
+    assert convert('lu:5', 'html', entities=True, tone_class='') == '<span>l&#252;</span>'
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        convert('ni3', 'xml')
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 5, 8])
+def test_chunk_boundaries(size):
+    text = 'foo zhuang4 Xi3an4, lu:3 yi1dian3r\nni3hao3 NI3HAO3 kuang4er2 x ' * 3
+    chunks = [text[i:i + size] for i in range(0, len(text), size)]
+    assert ''.join(iter_convert(chunks, 'html')) == convert(text, 'html')
+
+
+def test_stream_string_and_lines():
+    assert ''.join(iter_convert('ni3hao3')) == 'nǐhǎo'
+    assert list(iter_convert(['zhua', 'ng4\n', 'ni3\n'])) == ['zhuàng\n', 'nǐ\n']
+
+
+def test_overlong_runs_pass_through():
+    chunks = ['ni3 ', 'ni3' * 10, 'ni3' * 10, ' ni3']
+    assert ''.join(iter_convert(chunks, max_word_length=20)) == 'nǐ ' + 'ni3' * 20 + ' nǐ'
@@ -0,0 +1,77 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+import json
+
+from pinyin_markdown import corpus
+from pinyin_markdown.corpus import scan_file, scan_files, scan_text, sound_indexes, SyllableCounts
+from pinyin_markdown.pinyin_regex import SYLLABLES
+from pinyin_markdown.syllable_trie import trie
+
+TEXT = "Ni3hao3, ni3 yi1dian3r dou1 bu4 xi3an4 Lv4 nu:3? xx:ni3 ni3x a:b hao3_ 3ni3 Xi1'an1 er2\n"
+
+
+def counts_of_finditer(text):
+    expected = SyllableCounts()
+    for m in trie().finditer(text):
+        expected.words += 1
+        for sound in m.sounds:
+            if sound == 'r':
+                expected.erhua += 1
+            else:
+                expected.counts[sound_indexes()[sound]] += 1
+    return expected
+
+
+def test_counts():
+    counts = scan_text(TEXT)
+    assert counts.count('ni', 3) == 3
+    assert counts.count('hao', 3) == 1
+    assert counts.count('lü', 4) == counts.count('nü', 3) == 1
+    assert counts.count('er', 2) == 1
+    assert counts.erhua == 1
+    assert counts.words == 12
+    assert counts.tone_totals() == [4, 1, 7, 3, 0]
+    assert counts.most_common(1) == [(('ni', 3), 3)]
+    assert counts.syllable_totals()['xi'] == 2
+
+
+def test_same_as_trie_in_any_chunks():
+    expected = counts_of_finditer(TEXT)
+    for size in (1, 2, 3, 5, 8, 13):
+        chunks = [TEXT[i:i + size] for i in range(0, len(TEXT), size)]
+        counts = scan_text(chunks)
+        assert (counts.counts, counts.words, counts.erhua) == (expected.counts, expected.words, expected.erhua)
+
+
+def test_array_layout():
+    counts = scan_text('lu:3 lv3')
+    assert counts.counts[SYLLABLES.index('lü') * 5 + 2] == 2
+    assert len(counts.counts) == len(SYLLABLES) * 5
+
+
+def test_files_merged(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / 'part{}.txt'.format(i)
+        path.write_text(TEXT * (i + 1), encoding='utf8')
+        paths.append(str(path))
+    expected = counts_of_finditer(TEXT)
+    for workers in (1, 2):
+        counts = scan_files(paths, workers=workers)
+        assert counts.words == expected.words * 6
+        assert list(counts.counts) == [value * 6 for value in expected.counts]
+        assert counts.bytes == 6 * len(TEXT.encode('utf8'))
+        assert counts.megabytes_per_second > 0
+    assert scan_file(paths[0], chunk_size=7).counts == expected.counts
+
+
+def test_cli(tmp_path, capsys):
+    path = tmp_path / 'text.txt'
+    path.write_text(TEXT, encoding='utf8')
+    out = tmp_path / 'counts.json'
+    assert corpus.main([str(path), '-j', '1', '-n', '2', '--json', str(out)]) == 0
+    assert 'ni3' in capsys.readouterr().out
+    counts = json.loads(out.read_text(encoding='utf8'))
+    assert counts['syllables']['lü4'] == 1
+    assert counts['erhua'] == 1
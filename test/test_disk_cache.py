@@ -0,0 +1,53 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+from multiprocessing import Pool
+
+from pinyin_markdown.disk_cache import RenderCache, config_salt, render_key
+from pinyin_markdown.pool import PinyinRenderer
+
+
+def test_get_put(tmp_path):
+    cache = RenderCache(str(tmp_path / 'cache.sqlite'))
+    key = render_key('ni3', config_salt({'tone_class': 't{}'}))
+    assert key != render_key('ni3', config_salt({'tone_class': 'x{}'}))
+    assert cache.get(key) is None
+    cache.put(key, '<p>nǐ</p>')
+    assert RenderCache(cache.path).get(key) == '<p>nǐ</p>'
+    assert cache.total_bytes() == len('<p>nǐ</p>'.encode('utf8'))
+
+
+def test_eviction(tmp_path):
+    cache = RenderCache(str(tmp_path / 'cache.sqlite'), max_bytes=25)
+    for i in range(5):
+        cache.put(render_key(str(i), b''), '0123456789')
+    assert len(cache) == 2
+    assert cache.total_bytes() == 20
+    assert cache.get(render_key('4', b'')) == '0123456789'
+    assert cache.get(render_key('0', b'')) is None
+
+
+def test_renderer_uses_cache(tmp_path):
+    cache = RenderCache(str(tmp_path / 'cache.sqlite'))
+    renderer = PinyinRenderer(1, cache=cache, tone_class='t{}')
+    html = renderer.convert('ni3')
+    assert html == '<p><span class="t3">nǐ</span></p>'
+    assert len(cache) == 1
+    assert PinyinRenderer(1, cache=cache, tone_class='t{}').convert('ni3') == html
+    assert len(cache) == 1
+    PinyinRenderer(1, cache=cache).convert('ni3')
+    assert len(cache) == 2
+
+
+def _render_in_process(args):
+    path, text = args
+    return PinyinRenderer(1, cache=RenderCache(path)).convert(text)
+
+
+def test_processes_share_cache(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    texts = ['ni3 {}'.format(i % 10) for i in range(60)]
+    with Pool(3) as pool:
+        results = pool.map(_render_in_process, [(path, text) for text in texts], chunksize=1)
+    assert results == [PinyinRenderer(1).convert(text) for text in texts]
+    assert len(RenderCache(path)) == 10
@@ -0,0 +1,45 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+import unicodedata
+
+import pytest
+from markdown import Markdown
+from pinyin_markdown import PinyinExtension, encoders
+
+
+def test_entities_encode_every_character():
+    assert encoders.encode('lüè', 'entities') == 'l&#252;&#232;'
+    assert encoders.encode('{ab}', 'entities') == '{ab}'
+
+
+def test_named():
+    assert encoders.encode('lüè', 'named') == 'l&uuml;&egrave;'
+    assert encoders.encode('āǎ', 'named') == '&amacr;&#462;'
+
+
+def test_normal_forms():
+    assert encoders.encode('l\u01da', 'nfd') == 'lu\u0308\u030c'
+    assert encoders.encode('lu\u0308\u030c', 'nfc') == 'l\u01da'
+
+
+def test_encoded_table():
+    table = encoders.encoded_table('nfd')
+    assert table['lu:e4'] == unicodedata.normalize('NFD', 'lüè')
+    assert encoders.encoded_table('nfd') is table
+
+
+def test_unknown_encoder():
+    with pytest.raises(ValueError):
+        encoders.encode('ā', 'ascii')
+    with pytest.raises(ValueError):
+        Markdown(extensions=[PinyinExtension(encoder='ascii')])
+
+
+@pytest.mark.parametrize('encoder, html', [
+    ('entities', '<p><span class="tone4">l&#252;&#232;</span></p>'),
+    ('named', '<p><span class="tone4">l&uuml;&egrave;</span></p>'),
+])
+def test_markdown_encoder(encoder, html):
+    md = Markdown(extensions=[PinyinExtension(encoder=encoder)])
+    assert md.convert('lve4') == html
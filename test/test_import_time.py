@@ -0,0 +1,49 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+import os
+import subprocess
+import sys
+
+# Cumulative time of importing pinyin_markdown once Markdown, and the standard modules it needs, are imported.
+# About 5 ms with compiled bytecode. Building the syllable regexes, sound splitter, accented table and trie on
+# import would add about 20 ms.
+IMPORT_BUDGET_MICROSECONDS = 15000
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(*args):
+    return subprocess.run([sys.executable] + list(args), cwd=ROOT, check=True, universal_newlines=True,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+def test_import_builds_nothing():
+    run_python('-c', '''
+import sys
+import pinyin_markdown
+from pinyin_markdown import pinyin_regex, syllable_trie
+assert pinyin_regex.polysyllabic_regex_str.cache_info().currsize == 0
+assert pinyin_regex.sound_splitter.cache_info().currsize == 0
+assert syllable_trie.trie.cache_info().currsize == 0
+assert 'pinyin_markdown.accented_table' not in sys.modules
+assert 'pinyin_markdown.batch' not in sys.modules and 'multiprocessing' not in sys.modules
+from pinyin_markdown import convert_many
+''')
+
+
+def test_import_time_budget():
+    # Measures the import of compiled bytecode, as installed packages are, even with PYTHONDONTWRITEBYTECODE
+    run_python('-m', 'compileall', '-q', 'pinyin_markdown')
+    times = []
+    for _ in range(3):
+        stderr = run_python('-X', 'importtime', '-c', 'import markdown; import pinyin_markdown').stderr
+        times.extend(int(line.split('|')[1]) for line in stderr.splitlines()
+                     if line.split('|')[-1].strip() == 'pinyin_markdown')
+    assert len(times) == 3
+    assert min(times) < IMPORT_BUDGET_MICROSECONDS
+
+
+def test_lazy_attributes():
+    from pinyin_markdown import pinyin_regex, syllable_trie
+    assert pinyin_regex.POLYSYLLABIC_REGEX_STR is pinyin_regex.polysyllabic_regex_str()
+    assert syllable_trie.TRIE is syllable_trie.trie()
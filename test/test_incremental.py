@@ -0,0 +1,108 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+import markdown
+import pytest
+from pinyin_markdown import PinyinExtension
+from pinyin_markdown.blocks import references, split_blocks
+from pinyin_markdown.incremental import IncrementalRenderer
+
+DOCUMENT = '''# Ni3hao3
+
+Intro xi3an4 [link][r] and [x](http://a.b/wo3).
+
+- a ni3
+- b
+
+- c
+
+> quote
+
+    code ni3
+
+
+    more code
+
+```
+fence
+
+ni3
+```
+
+```
+[f]: http://example.com/fenced
+```
+
+See [f], <http://x.com/ni3> ni3.
+
+<div>
+raw
+
+block
+</div>
+
+[s]: http://example.com/setext
+==============================
+
+See [s].
+
+Heading
+-------
+
+| a | b |
+|---|---|
+| wo3 | x |
+
+[r]: http://example.com/ni3 "Title"
+
+last *ni3* para
+'''
+
+
+def test_split_blocks():
+    assert split_blocks('a\nb\n\n\nc\n\n    d\n\ne') == ['a\nb\n', 'c\n\n    d\n', 'e\n']
+    assert split_blocks('```\na\n\nb\n```\n\nc') == ['```\na\n\nb\n```\n', 'c\n']
+    # Only a block-level tag starts raw HTML, which stays with the next block only
+    assert split_blocks('<http://x.com> ni3\n\npara\n\n<em>a</em>\n\nb') == [
+        '<http://x.com> ni3\n', 'para\n', '<em>a</em>\n', 'b\n']
+    assert split_blocks('<div>\na\n\n</div>\n\nb\n\nc') == ['<div>\na\n\n</div>\n\nb\n', 'c\n']
+    assert split_blocks('<hr>\n\n[r]: /r\n\nb\n\nc') == ['<hr>\n\n[r]: /r\n\nb\n', 'c\n']
+
+
+def test_references():
+    text = '```\n[f]: /fenced\n```\n\n<div>\n[h]: /html\n</div>\n\n    [c]: /code\n\n[r]: /r\n'
+    assert references(text) == '[f]: /fenced\n[r]: /r\n\n'
+    assert references(text, fenced=True) == '[r]: /r\n\n'
+    # An unclosed fence isn't fenced code
+    assert references('```\n[f]: /fenced\n', fenced=True) == '[f]: /fenced\n\n'
+    # A definition underlined as a setext heading is a heading
+    assert references('[h]: /h\n---\n[r]: /r\n\n[t]: /t\n\n---\n') == '[r]: /r\n[t]: /t\n\n'
+
+
+@pytest.mark.parametrize('extensions', [(), ('extra',)])
+def test_same_as_full_render(extensions):
+    expected = markdown.markdown(DOCUMENT, extensions=[PinyinExtension()] + list(extensions))
+    assert IncrementalRenderer(extensions).render(DOCUMENT).html == expected
+
+
+def test_only_edited_blocks_render():
+    renderer = IncrementalRenderer(tone_class='t{}')
+    first = renderer.render(DOCUMENT)
+    assert first.reused == 0
+    edited = renderer.render(DOCUMENT.replace('# Ni3hao3', '# Ni3hao3 ma5'))
+    assert (edited.reused, edited.rendered) == (first.rendered - 1, 1)
+    assert '<span class="t5">ma</span>' in edited.html
+
+
+def test_references_invalidate():
+    renderer = IncrementalRenderer()
+    renderer.render(DOCUMENT)
+    result = renderer.render(DOCUMENT.replace('http://example.com', 'http://example.org'))
+    assert result.reused == 0
+    assert 'http://example.org/ni3' in result.html
+
+
+def test_max_blocks():
+    renderer = IncrementalRenderer(max_blocks=2)
+    renderer.render('a\n\nb\n\nc\n')
+    assert len(renderer.blocks) == 2
@@ -1,8 +1,11 @@
 # coding: utf-8
 from __future__ import unicode_literals
 
+import re
+import time
 from collections import namedtuple
 
+import markdown
 import pytest
 from markdown import Markdown
 from pinyin_markdown import PinyinExtension, pinyin_regex
@@ -16,20 +19,23 @@ class MarkdownTest(namedtuple('MarkdownTest', 'md html')):
         return markdown.convert(self.md) == '<p>{}</p>'.format(self.html)
 
 
-@pytest.fixture(params=[PinyinExtension(), 'pinyin_markdown'],
-                ids=["import", "str"])
+@pytest.fixture(params=[PinyinExtension(), 'pinyin_markdown', PinyinExtension(engine='regex'),
+                        PinyinExtension(cache_size=0), PinyinExtension(instrument=True),
+                        PinyinExtension(time_budget=60, max_document_size=10 ** 6),
+                        PinyinExtension(engine='postprocess')],
+                ids=["import", "str", "regex", "uncached", "instrumented", "budget", "postprocess"])
 def pinyin_markdown(request):
     return Markdown(extensions=[request.param])
 
 
 @pytest.fixture
 def pinyin_md_no_classes():
-    return Markdown(extensions=['pinyin_markdown(tone_class=,erhua_class=,apostrophe_class=)'])
+    return Markdown(extensions=[PinyinExtension(tone_class='', erhua_class='', apostrophe_class='')])
 
 
 @pytest.fixture
 def pinyin_md_entities():
-    return Markdown(extensions=['pinyin_markdown(entities=True)'])
+    return Markdown(extensions=[PinyinExtension(entities=True)])
 
 
 @pytest.fixture(params=["hello", "fanian", "fa xing4qi you", "NI3HAO3"])
@@ -83,3 +89,141 @@ def test_urls_unaffected(pinyin_markdown):
     assert MarkdownTest('http://x.com/wo3 [wo3](http://x.com/wo3)',
                         'http://x.com/<span class="tone3">wǒ</span> '
                         '<a href="http://x.com/wo3"><span class="tone3">wǒ</span></a>')(pinyin_markdown)
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        Markdown(extensions=[PinyinExtension(engine='nfa')])
+
+
+def test_toc_sees_pinyin():
+    md = Markdown(extensions=[PinyinExtension(), 'toc'])
+    assert md.convert('# ni3hao3\n\n[TOC]') == (
+        '<h1 id="nihao"><span class="tone3">nǐ</span><span class="tone3">hǎo</span></h1>\n'
+        '<div class="toc">\n<ul>\n<li><a href="#nihao">nǐhǎo</a></li>\n</ul>\n</div>')
+
+
+def test_word_cache_shared():
+    first = Markdown(extensions=[PinyinExtension(cache_size=7)])
+    second = Markdown(extensions=[PinyinExtension(cache_size=7, tone_class='t{}')])
+    cache = first.inlinePatterns['pinyin'].cache
+    assert second.inlinePatterns['pinyin'].cache is cache
+    cache.cache_clear()
+    first.convert('ni3hao3 ni3hao3')
+    second.convert('ni3hao3')
+    assert second.convert('ni3hao3') == '<p><span class="t3">nǐ</span><span class="t3">hǎo</span></p>'
+    info = first.inlinePatterns['pinyin'].cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+
+
+def test_word_cache_disabled():
+    md = Markdown(extensions=[PinyinExtension(cache_size=0)])
+    assert md.inlinePatterns['pinyin'].cache_info() is None
+
+
+@pytest.mark.parametrize('engine', ['regex', 'trie'])
+def test_instrumentation(engine):
+    documents = []
+    extension = PinyinExtension(instrument=True, stats_hook=documents.append, engine=engine)
+    md = Markdown(extensions=[extension])
+    md.convert("Xi3an4 yi1dian3r *ni3* hello")
+    md.reset().convert("no pinyin")
+    assert [stats.words for stats in documents] == [3, 0]
+    first = documents[0]
+    assert (first.syllables, first.erhua, first.apostrophes) == (5, 1, 1)
+    assert first.handle_match_seconds >= first.split_seconds + first.accent_seconds > 0
+    assert first.search_seconds > 0 and first.untag_seconds > 0
+    assert extension.stats.documents == 2 and extension.stats.words == 3
+    assert PinyinExtension().stats is None
+
+
+def test_instrumentation_shared_extension():
+    extension = PinyinExtension(instrument=True)
+    totals = extension.stats
+    Markdown(extensions=[extension]).convert('ni3hao3')
+    Markdown(extensions=[extension]).convert('Xi3an4 hello')
+    assert extension.stats is totals
+    assert (totals.documents, totals.words, totals.syllables) == (2, 2, 4)
+
+
+@pytest.mark.parametrize('instrument', [False, True])
+def test_granularity(instrument):
+    def convert(granularity, **config):
+        md = Markdown(extensions=[PinyinExtension(granularity=granularity, instrument=instrument, **config)])
+        return md.convert("Xi3an4 *yi1dian3r*")
+
+    assert convert('word') == ('<p><span data-tones="34">Xǐ\'àn</span> '
+                               '<em><span data-tones="13">yīdiǎnr</span></em></p>')
+    assert convert('none') == "<p>Xǐ'àn <em>yīdiǎnr</em></p>"
+    assert convert('none', entities=True) == "<p>X&#464;'&#224;n <em>y&#299;di&#462;nr</em></p>"
+
+
+def test_granularity_none_skips_untag():
+    assert 'pinyin_untag_words' not in Markdown(extensions=[PinyinExtension(granularity='none')]).treeprocessors
+    with pytest.raises(ValueError):
+        Markdown(extensions=[PinyinExtension(granularity='letter')])
+
+
+def test_size_budget():
+    md = Markdown(extensions=[PinyinExtension(max_document_size=20)])
+    assert md.convert('ni3 *ni3*') == '<p><span class="tone3">nǐ</span> <em><span class="tone3">nǐ</span></em></p>'
+    assert not md.inlinePatterns['pinyin'].budget_exceeded()
+    assert md.reset().convert('ni3 *ni3* and some more') == '<p>ni3 <em>ni3</em> and some more</p>'
+    assert md.inlinePatterns['pinyin'].budget_exceeded()
+    assert md.reset().convert('ni3') == '<p><span class="tone3">nǐ</span></p>'
+
+
+def test_adversarial_input_is_fast():
+    start = time.perf_counter()
+    Markdown(extensions=[PinyinExtension()]).convert('nu:e3' * 8000 + 'x')
+    assert time.perf_counter() - start < 2
+
+
+def test_time_budget():
+    md = Markdown(extensions=[PinyinExtension(time_budget=1e-9)])
+    assert md.convert('ni3 *ni3*') == '<p>ni3 <em>ni3</em></p>'
+    assert md.inlinePatterns['pinyin'].budget_exceeded()
+
+
+def test_time_budget_during_search():
+    md = Markdown(extensions=[PinyinExtension(time_budget=0.001)])
+    md.convert('ni3 ' + 'ni3' * 300000 + 'x')
+    assert md.inlinePatterns['pinyin'].budget_exceeded()
+
+
+@pytest.mark.parametrize('engine', ['regex', 'trie'])
+def test_patterns_share_compiled_finder(engine):
+    first, second = [Markdown(extensions=[PinyinExtension(engine=engine, tone_class=cls)]).inlinePatterns['pinyin']
+                     for cls in ('a{}', 'b{}')]
+    assert first.gate.finder is second.gate.finder
+    assert second.md.convert('ni3') == '<p><span class="b3">nǐ</span></p>'
+
+
+@pytest.mark.parametrize('engine', ['regex', 'trie'])
+def test_construction_compiles_nothing(monkeypatch, engine):
+    Markdown(extensions=[PinyinExtension(engine=engine)])
+    compiled = []
+    compile_ = re.compile
+    monkeypatch.setattr(re, 'compile', lambda pattern, *args, **kwargs: compiled.append(pattern) or
+                        compile_(pattern, *args, **kwargs))
+    Markdown(extensions=[PinyinExtension(engine=engine)])
+    assert pinyin_regex.polysyllabic_regex_str() not in compiled
+
+
+@pytest.mark.parametrize('extensions', [[], pytest.param(['toc'], marks=pytest.mark.skipif(
+    markdown.__version_info__ < (3, 6), reason='toc renders headings through the postprocessors since 3.6'))])
+@pytest.mark.parametrize('granularity', ['syllable', 'word', 'none'])
+def test_postprocess_same_as_inline(granularity, extensions):
+    text = ('<http://x.com/wo3> &amp; ni3&#8212;hao3 `ni3` <b>lu:4</b> [Xi3an4](/wo3 "wo3")\n\n'
+            '<div>ni3</div>\n\n    ni3\n\n![ni3](a.png) yi1dian3r\n\n'
+            '[http://x.com/wo3](http://x.com/wo3) ni3\\_hao3 \\<lu:4\\>\n\n'
+            '# <http://x.com/wo3> ni3\\_hao3')
+    inline = Markdown(extensions=[PinyinExtension(granularity=granularity)] + extensions)
+    postprocess = Markdown(extensions=[PinyinExtension(granularity=granularity, engine='postprocess')] + extensions)
+    assert postprocess.convert(text) == inline.convert(text)
+
+
+def test_postprocess_instrumented():
+    extension = PinyinExtension(engine='postprocess', instrument=True)
+    Markdown(extensions=[extension]).convert('ni3hao3 `ni3`')
+    assert (extension.stats.documents, extension.stats.words, extension.stats.syllables) == (1, 1, 2)
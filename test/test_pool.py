@@ -0,0 +1,50 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+import queue
+import threading
+
+import pytest
+from pinyin_markdown.pool import PinyinRenderer, renderer
+
+
+def test_convert():
+    pool = PinyinRenderer(2, tone_class='t{}')
+    assert pool.convert('ni3') == '<p><span class="t3">nǐ</span></p>'
+
+
+def test_bounded():
+    pool = PinyinRenderer(2)
+    first = pool.checkout()
+    second = pool.checkout()
+    assert first is not second
+    with pytest.raises(queue.Empty):
+        pool.checkout(timeout=0.01)
+    pool.checkin(first)
+    assert pool.checkout(timeout=0.01) is first
+    assert pool.created == 2
+
+
+def test_threads():
+    pool = PinyinRenderer(3)
+    results = []
+
+    def work(n):
+        for i in range(50):
+            text = 'ni3 ' * n + '\n\n*hao3*'
+            results.append(pool.convert(text) == pool.convert(text) and pool.convert(text).count('tone3') == n + 1)
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(1, 9)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert all(results) and len(results) == 400
+    assert pool.created <= 3
+
+
+def test_shared_per_config():
+    assert renderer(tone_class='x{}') is renderer(tone_class='x{}')
+    assert renderer(tone_class='x{}') is not renderer(tone_class='y{}')
+    with pytest.raises(ValueError):
+        PinyinRenderer(engine='nope')
@@ -0,0 +1,42 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+import pytest
+from pinyin_markdown import convert, reverse
+from .expected import numbered_accented
+
+
+@pytest.mark.parametrize('text, numbered, toneless', [
+    ("Xǐ'àn", 'xi3an4', 'xian'),
+    ('xian', 'xian5', 'xian'),
+    ("Tiān'ānmén Guǎngchǎng", 'tian1an1men2 guang3chang3', 'tiananmen guangchang'),
+    ('yīdiǎnr', 'yi1dian3r', 'yidianr'),
+    ('yi1dian3r', 'yi1dian3r', 'yidianr'),
+    ('Lu:4, lǜ!', 'lv4 lv4', 'lv lv'),
+    ('péngyou', 'peng2you5', 'pengyou'),
+    ('Nǚ’ér', 'nv3er2', 'nver'),
+    ('Zhōngguó', 'zhong1guo2', 'zhongguo'),
+])
+def test_keys(text, numbered, toneless):
+    assert reverse.keys(text) == (numbered, toneless)
+
+
+def test_umlaut():
+    assert reverse.to_numbered('lüè', umlaut='u:') == 'lu:e4'
+    assert reverse.to_toneless('lüè', umlaut='ü') == 'lüe'
+
+
+def test_every_syllable_round_trips():
+    for numbered, accented in numbered_accented.items():
+        assert reverse.to_numbered(accented) == numbered
+
+
+@pytest.mark.parametrize('numbered', ['xi3an4', 'kuang4er2', 'tian1an1men2', 'yi1dian3r', 'nu:3er2', 'fang1an4'])
+def test_round_trip_words(numbered):
+    assert reverse.to_numbered(convert(numbered)) == numbered.replace('u:', 'v')
+
+
+def test_bulk_keys():
+    rows = ['nǐhǎo', 'hello', 'xièxie']
+    assert list(reverse.bulk_keys(rows)) == [
+        ('nǐhǎo', 'ni3hao3', 'nihao'), ('hello', None, None), ('xièxie', 'xie4xie5', 'xiexie')]
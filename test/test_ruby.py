@@ -0,0 +1,56 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+import pytest
+from markdown import Markdown
+from pinyin_markdown import PinyinExtension
+from pinyin_markdown.ruby import build_index, RubyIndex
+
+CEDICT = '''# CC-CEDICT
+你好 你好 [ni3 hao3] /hello/
+你 你 [ni3] /you/
+好 好 [hao3] /good/
+好 好 [hao4] /to be fond of/
+中國 中国 [Zhong1 guo2] /China/
+華 华 [Hua4] /surname Hua/
+華 华 [hua2] /magnificent/
+女 女 [nu:3] /female/
+一點兒 一点儿 [yi1 dian3 r5] /a bit/
+〇 〇 [ling2] /zero/
+'''
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    cedict = tmp_path / 'cedict.u8'
+    cedict.write_text(CEDICT, encoding='utf8')
+    path = str(tmp_path / 'cedict.idx')
+    assert build_index(str(cedict), path) == 11
+    return path
+
+
+def test_index(index_path):
+    index = RubyIndex(index_path)
+    assert index.reading('你好') == 'ni3 hao3'
+    assert index.reading('中國') == index.reading('中国') == 'Zhong1 guo2'
+    assert index.reading('好') == 'hao3'
+    assert index.reading('华') == 'hua2'
+    assert index.reading('你们') is None
+    assert index.segment('你好好人你') == [('你好', 'ni3 hao3'), ('好', 'hao3'), ('人', None), ('你', 'ni3')]
+
+
+def test_not_an_index(tmp_path):
+    path = tmp_path / 'cedict.u8'
+    path.write_text(CEDICT, encoding='utf8')
+    with pytest.raises(ValueError):
+        RubyIndex(str(path))
+
+
+def test_markdown(index_path):
+    md = Markdown(extensions=[PinyinExtension(ruby_index=index_path, tone_class='t{}')])
+    assert md.convert('你好 ni3, *一点儿*人〇') == (
+        '<p><ruby>你<rt><span class="t3">nǐ</span></rt>好<rt><span class="t3">hǎo</span></rt></ruby> '
+        '<span class="t3">nǐ</span>, <em><ruby>一<rt><span class="t1">yī</span></rt>点<rt><span class="t3">diǎn'
+        '</span></rt>儿<rt><span class="erhua">r</span></rt></ruby></em>人<ruby>〇<rt><span class="t2">líng</span>'
+        '</rt></ruby></p>')
+    assert 'pinyin_ruby' not in Markdown(extensions=[PinyinExtension()]).inlinePatterns
@@ -0,0 +1,59 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+import io
+import tracemalloc
+
+import markdown
+import pytest
+from pinyin_markdown import PinyinExtension
+from pinyin_markdown.streaming import render_file, StreamingRenderer
+from .test_incremental import DOCUMENT
+
+
+class _Discard(object):
+    def write(self, chunk):
+        pass
+
+
+def peak_memory(function):
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_same_as_full_render(tmp_path):
+    path = tmp_path / 'doc.md'
+    path.write_text(DOCUMENT * 3, encoding='utf8')
+    out = io.StringIO()
+    render_file(str(path), out, extensions=['extra'], tone_class='t{}')
+    assert out.getvalue() == markdown.markdown(DOCUMENT * 3, extensions=[PinyinExtension(tone_class='t{}'), 'extra'])
+
+
+def test_fenced_reference(tmp_path):
+    text = '```\n[r]: http://example.com/\n```\n\nSee [r].\n'
+    path = tmp_path / 'doc.md'
+    path.write_text(text, encoding='utf8')
+    for extensions in ([], ['fenced_code']):
+        out = io.StringIO()
+        render_file(str(path), out, extensions=extensions)
+        assert out.getvalue() == markdown.markdown(text, extensions=[PinyinExtension()] + extensions)
+
+
+# An autolink or inline tag at the start of a paragraph isn't raw HTML, which would keep the rest in one block
+@pytest.mark.parametrize('start', ['', '<http://x.com> ni3\n\n<em>a</em>\n\n<div>b</div>\n\n'])
+def test_memory_bounded_by_block(tmp_path, start):
+    text = start + '\n\n'.join('Ni3hao3 {} xi3an4 yi1dian3r'.format(i) for i in range(400))
+    path = tmp_path / 'doc.md'
+    path.write_text(text, encoding='utf8')
+    renderer = StreamingRenderer()
+    md = markdown.Markdown(extensions=[PinyinExtension()])
+    renderer.render_file(str(path), _Discard())  # Warm the caches of both
+    md.convert(text)
+
+    streaming_peak = peak_memory(lambda: renderer.render_file(str(path), _Discard()))
+    full_peak = peak_memory(lambda: md.reset().convert(text))
+    assert streaming_peak * 10 < full_peak
@@ -0,0 +1,57 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+import re
+import time
+
+import pytest
+from pinyin_markdown import pinyin_regex
+from pinyin_markdown.syllable_trie import TRIE
+from .expected import md_html, numbered_accented
+
+_POLYSYLLABIC_RE = re.compile(pinyin_regex.POLYSYLLABIC_REGEX_STR)
+
+
+def regex_words(text):
+    return [(m.span(1), pinyin_regex.split_syllables(m.group(1))) for m in _POLYSYLLABIC_RE.finditer(text)]
+
+
+def trie_words(text):
+    return [(m.span(1), m.sounds) for m in TRIE.finditer(text)]
+
+
+@pytest.mark.parametrize('text', [test[0] for test in md_html] + [
+    'hello', 'fanian', 'NI3HAO3', 'lu:3 lv4e', 'dian3ran2 dian3r yi1dian3r3', 'x_ni3 ni3_ ni3:', 'ni3hao', 'Er4r',
+    'http://x.com/wo3', 'kuang4er2 xi3an4 Tian1an1men2', 'nu:e3nu:e3x nu:e3nu:e3', 'xx:ni3 nu:e3:ni3',
+])
+def test_same_words_as_regex(text):
+    assert trie_words(text) == regex_words(text)
+
+
+def test_split_every_sound():
+    for numbered in numbered_accented:
+        assert TRIE.split_syllables(numbered) == pinyin_regex.split_syllables(numbered)
+    for syllable in pinyin_regex.SYLLABLES:
+        for tone in '12345':
+            sound = syllable.capitalize() + tone
+            assert TRIE.split_syllables(sound) == [sound]
+
+
+def test_search_from_pos():
+    assert TRIE.search('ni3 hao3', 1).group(1) == 'hao3'
+    assert TRIE.search('ni hao') is None
+
+
+def test_linear_after_colons():
+    # A scan starts after each colon and, before failed scans were remembered, read on to the x every time
+    text = 'nu:e3' * 8000 + 'x'
+    start = time.perf_counter()
+    assert list(TRIE.finditer(text)) == []
+    assert time.perf_counter() - start < 1
+
+
+def test_deadline():
+    assert len(list(TRIE.finditer('ni3 ' * 100000, deadline=time.perf_counter()))) < 100000
+    # One long word is one scan, which checks the deadline as it goes
+    assert list(TRIE.finditer('ni3' * 100000, deadline=time.perf_counter())) == []
+    assert len(list(TRIE.finditer('ni3 ' * 100, deadline=time.perf_counter() + 60))) == 100
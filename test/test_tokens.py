@@ -0,0 +1,33 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+import pytest
+from pinyin_markdown import PinyinConverter
+from pinyin_markdown.pinyin_regex import SYLLABLES
+from pinyin_markdown.tokens import tokenize, TEXT, SYLLABLE, ERHUA, CAPITALIZED, WORD_START
+
+TEXT_WITH_PINYIN = "i ♥ Xi3An4 xi3an4! yi1dian3r Lv3 lu:5 NI3HAO3 kuang4er2 x"
+
+
+def test_tokens():
+    stream = tokenize('Lv3an4r, x')
+    assert [(token.kind, token.syllable, token.tone, token.flags, token.start, token.end) for token in stream] == [
+        (SYLLABLE, SYLLABLES.index('lü'), 3, WORD_START | CAPITALIZED, 0, 3),
+        (SYLLABLE, SYLLABLES.index('an'), 4, 0, 3, 6),
+        (ERHUA, 0, 0, 0, 6, 7),
+        (TEXT, 0, 0, 0, 7, 10),
+    ]
+    assert [stream.sound(i) for i in range(len(stream))] == ['Lü3', 'an4', 'r', None]
+    assert stream.needs_apostrophe(1) and not stream.needs_apostrophe(0)
+
+
+def test_covers_text():
+    stream = tokenize(TEXT_WITH_PINYIN)
+    assert ''.join(stream.source(i) for i in range(len(stream))) == TEXT_WITH_PINYIN
+    assert stream.nbytes() == 13 * len(stream)
+
+
+@pytest.mark.parametrize('mode', ['text', 'entities', 'html'])
+def test_render_tokens(mode):
+    converter = PinyinConverter(mode)
+    assert converter.render_tokens(tokenize(TEXT_WITH_PINYIN)) == converter.convert(TEXT_WITH_PINYIN)